@@ -11,7 +11,9 @@ import tempfile
 import shutil
 from pathlib import Path
 
-from app.services.case_ingestor import LegalCaseIngestor
+from app.services.case_ingestor import LegalCaseIngestor, case_info_from_metadata
+from app.services.ai_extractor import run_extraction_pipeline
+from app.pdf_parser import extract_text_from_pdf
 from app.database import engine
 
 router = APIRouter()
@@ -207,6 +209,22 @@ async def get_active_jobs():
         ]
     }
 
+def _batch_metadata(pdf_path: Path) -> dict:
+    """Case metadata for an uploaded PDF, derived from its filename"""
+    return {
+        'case_number': pdf_path.stem,
+        'title': pdf_path.stem.replace('_', ' ').title(),
+        'court_level': 'Appeals',
+        'division': 'Unknown',
+        'publication': 'Unknown'
+    }
+
+def _pdf_file_text(pdf_path: Path) -> str:
+    """Full text of a PDF file, as the ingestor joins its pages"""
+    full_text = '\n\n'.join(extract_text_from_pdf(pdf_path.read_bytes()))
+    # The ingestor rejects these anyway, so don't spend an LLM call on them
+    return full_text if len(full_text.strip()) >= 100 else ''
+
 # Background task function
 async def _process_pdf_batch(
     job_id: str,
@@ -226,6 +244,22 @@ async def _process_pdf_batch(
     failed = 0
     
     try:
+        # AI extraction for the whole batch first, overlapping PDF parsing with
+        # the LLM calls; the ingestor then reuses each result (and retries the
+        # extraction itself for any file the pipeline got no result for)
+        extracted = [None] * len(pdf_files)
+        if enable_ai_extraction:
+            _active_jobs[job_id]["message"] = "Running AI extraction"
+            
+            def on_extracted(index, case_info, result):
+                _active_jobs[job_id]["message"] = f"AI extraction finished for {case_info['case_number']}"
+            
+            extracted = await run_extraction_pipeline(
+                ((pdf_path, case_info_from_metadata(_batch_metadata(pdf_path))) for pdf_path in pdf_files),
+                _pdf_file_text,
+                on_result=on_extracted,
+            )
+        
         for i, pdf_path in enumerate(pdf_files):
             # Update job status
             _active_jobs[job_id].update({
@@ -242,13 +276,7 @@ async def _process_pdf_batch(
                     pdf_content = f.read()
                 
                 # Prepare metadata
-                metadata = {
-                    'case_number': pdf_path.stem,
-                    'title': pdf_path.stem.replace('_', ' ').title(),
-                    'court_level': 'Appeals',
-                    'division': 'Unknown',
-                    'publication': 'Unknown'
-                }
+                metadata = _batch_metadata(pdf_path)
                 
                 # Prepare source file info
                 source_file_info = {
@@ -261,7 +289,8 @@ async def _process_pdf_batch(
                     pdf_content=pdf_content,
                     metadata=metadata,
                     source_file_info=source_file_info,
-                    enable_ai_extraction=enable_ai_extraction
+                    enable_ai_extraction=enable_ai_extraction,
+                    extracted_data=extracted[i]
                 )
                 
                 processing_time = time.time() - start_time
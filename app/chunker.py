@@ -1,6 +1,6 @@
 import re
 import logging
-from typing import List, Dict
+from typing import Iterable, List, Dict
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -84,21 +84,24 @@ class LegalTextChunker:
             ]
         }
     
-    def chunk_pages(self, pages: List[str]) -> List[TextChunk]:
+    def chunk_pages(self, pages: Iterable[str]) -> List[TextChunk]:
         """
-        Chunk a list of page texts into semantic chunks.
+        Chunk page texts into semantic chunks.
         
         Args:
-            pages: List of page texts from PDF
+            pages: Page texts from PDF (any iterable, consumed once)
             
         Returns:
             List of TextChunk objects in order
         """
-        # Combine all pages into single text
-        full_text = "\n\n".join(pages)
-        
-        # Split into paragraphs first
-        paragraphs = self._split_into_paragraphs(full_text)
+        # Split into paragraphs page by page. Pages are joined with a blank
+        # line, which is always a paragraph break, so this matches splitting
+        # the joined text without building that extra full-document copy.
+        paragraphs = []
+        page_count = 0
+        for page in pages:
+            paragraphs.extend(self._split_into_paragraphs(page))
+            page_count += 1
         
         # Identify sections
         sectioned_paragraphs = self._identify_sections(paragraphs)
@@ -106,7 +109,7 @@ class LegalTextChunker:
         # Create chunks respecting section boundaries
         chunks = self._create_chunks(sectioned_paragraphs)
         
-        logger.info(f"Created {len(chunks)} chunks from {len(pages)} pages")
+        logger.info(f"Created {len(chunks)} chunks from {page_count} pages")
         return chunks
     
     def _split_into_paragraphs(self, text: str) -> List[str]:
@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field
-from typing import Optional, Literal
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Optional, Literal, Mapping
+from types import MappingProxyType
 from datetime import datetime
 from enum import Enum
 
@@ -47,36 +48,55 @@ class DocumentTypeSlug(str, Enum):
     EXHIBIT = "exhibit"
 
 
+# Literal mirrors of the enums above, used as model field types so that
+# pydantic-core validates them as plain string sets instead of Enum lookups
+DocumentRoleT = Literal["court", "party", "evidence", "administrative"]
+DocumentCategoryT = Literal["Court Decisions", "Party Briefs", "Evidence", "Administrative"]
+ProcessingStrategyT = Literal["case_outcome", "brief_extraction", "evidence_indexing", "text_only"]
+DocumentTypeSlugT = Literal[
+    "appellate_opinion", "trial_court_order", "final_judgment",
+    "opening_brief", "respondent_brief", "reply_brief",
+    "transcript", "exhibit",
+]
+
+
 # ============================================================================
 # Pydantic Models
 # ============================================================================
 
 class DocumentTypeBase(BaseModel):
     """Base document type with all required fields for the Traffic Cop system"""
+    # Core schemas are built on first use rather than at import (inherited by subclasses)
+    model_config = ConfigDict(defer_build=True)
+
     document_type: str = Field(..., description="Machine-readable document type slug (e.g., 'appellate_opinion')")
     description: Optional[str] = Field(None, description="Human-readable description of the document type")
-    role: DocumentRole = Field(..., description="Document authority source: court, party, evidence, administrative")
-    category: DocumentCategory = Field(..., description="UI grouping label for frontend display")
+    role: DocumentRoleT = Field(..., description="Document authority source: court, party, evidence, administrative")
+    category: DocumentCategoryT = Field(..., description="UI grouping label for frontend display")
     has_decision: bool = Field(False, description="Whether this document declares a winner (True for opinions/orders)")
     is_adversarial: bool = Field(False, description="Whether document is biased/argumentative (True for briefs)")
-    processing_strategy: ProcessingStrategy = Field(..., description="Backend routing: which pipeline to use")
+    processing_strategy: ProcessingStrategyT = Field(..., description="Backend routing: which pipeline to use")
     display_order: int = Field(100, description="Sort order for UI display within category")
 
 
 class DocumentTypeCreate(DocumentTypeBase):
     """Schema for creating a new document type"""
-    pass
+    # New rows must use a V1 slug; read models stay `str` for legacy rows
+    # such as 'Court Decision' created by the dimension services
+    document_type: DocumentTypeSlugT = Field(..., description="Machine-readable document type slug (e.g., 'appellate_opinion')")
 
 
 class DocumentTypeUpdate(BaseModel):
     """Schema for updating an existing document type - all fields optional"""
-    document_type: Optional[str] = None
+    model_config = ConfigDict(defer_build=True)
+
+    document_type: Optional[DocumentTypeSlugT] = None
     description: Optional[str] = None
-    role: Optional[DocumentRole] = None
-    category: Optional[DocumentCategory] = None
+    role: Optional[DocumentRoleT] = None
+    category: Optional[DocumentCategoryT] = None
     has_decision: Optional[bool] = None
     is_adversarial: Optional[bool] = None
-    processing_strategy: Optional[ProcessingStrategy] = None
+    processing_strategy: Optional[ProcessingStrategyT] = None
     display_order: Optional[int] = None
 
 
@@ -85,8 +105,12 @@ class DocumentType(DocumentTypeBase):
     document_type_id: int = Field(..., description="Unique document type identifier")
     created_at: datetime = Field(..., description="Record creation timestamp")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]):
+        """Build from a trusted database row (e.g. row._mapping) without re-validating"""
+        return cls.model_construct(**row)
 
 
 class DocumentTypeResponse(DocumentType):
@@ -98,37 +122,45 @@ class DocumentTypeResponse(DocumentType):
 # Helper functions for processing strategy routing
 # ============================================================================
 
+# Slug -> strategy routing table, built once at import
+_STRATEGY_MAP: Mapping[str, ProcessingStrategy] = MappingProxyType({
+    # Court decisions -> extract outcomes
+    "appellate_opinion": ProcessingStrategy.CASE_OUTCOME,
+    "trial_court_order": ProcessingStrategy.CASE_OUTCOME,
+    "final_judgment": ProcessingStrategy.CASE_OUTCOME,
+    # Party briefs -> populate briefs table
+    "opening_brief": ProcessingStrategy.BRIEF_EXTRACTION,
+    "respondent_brief": ProcessingStrategy.BRIEF_EXTRACTION,
+    "reply_brief": ProcessingStrategy.BRIEF_EXTRACTION,
+    # Evidence -> chunk and embed only
+    "transcript": ProcessingStrategy.EVIDENCE_INDEXING,
+    "exhibit": ProcessingStrategy.EVIDENCE_INDEXING,
+})
+
+
+_BRIEF_TYPES = frozenset({"opening_brief", "respondent_brief", "reply_brief"})
+_COURT_DECISIONS = frozenset({"appellate_opinion", "trial_court_order", "final_judgment"})
+_EVIDENCE_TYPES = frozenset({"transcript", "exhibit"})
+
+
 def get_processing_strategy(doc_type_slug: str) -> ProcessingStrategy:
     """
     Get the processing strategy for a given document type slug.
     Used by the ingestion pipeline to route documents to the correct processor.
     """
-    strategy_map = {
-        # Court decisions -> extract outcomes
-        "appellate_opinion": ProcessingStrategy.CASE_OUTCOME,
-        "trial_court_order": ProcessingStrategy.CASE_OUTCOME,
-        "final_judgment": ProcessingStrategy.CASE_OUTCOME,
-        # Party briefs -> populate briefs table
-        "opening_brief": ProcessingStrategy.BRIEF_EXTRACTION,
-        "respondent_brief": ProcessingStrategy.BRIEF_EXTRACTION,
-        "reply_brief": ProcessingStrategy.BRIEF_EXTRACTION,
-        # Evidence -> chunk and embed only
-        "transcript": ProcessingStrategy.EVIDENCE_INDEXING,
-        "exhibit": ProcessingStrategy.EVIDENCE_INDEXING,
-    }
-    return strategy_map.get(doc_type_slug, ProcessingStrategy.TEXT_ONLY)
+    return _STRATEGY_MAP.get(doc_type_slug, ProcessingStrategy.TEXT_ONLY)
 
 
 def is_brief_type(doc_type_slug: str) -> bool:
     """Check if a document type should populate the briefs table"""
-    return doc_type_slug in ("opening_brief", "respondent_brief", "reply_brief")
+    return doc_type_slug in _BRIEF_TYPES
 
 
 def is_court_decision(doc_type_slug: str) -> bool:
     """Check if a document type is a court decision with outcomes"""
-    return doc_type_slug in ("appellate_opinion", "trial_court_order", "final_judgment")
+    return doc_type_slug in _COURT_DECISIONS
 
 
 def is_evidence(doc_type_slug: str) -> bool:
     """Check if a document type is evidence (neutral facts)"""
-    return doc_type_slug in ("transcript", "exhibit")
+    return doc_type_slug in _EVIDENCE_TYPES
@@ -1,7 +1,9 @@
 import PyPDF2
+import os
 import re
 import logging
-from typing import List, Dict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from io import BytesIO
 
 logger = logging.getLogger(__name__)
@@ -43,6 +45,67 @@ def extract_text_from_pdf(pdf_content: bytes) -> List[str]:
         raise ValueError(f"Failed to parse PDF: {str(e)}")
 
 
+def _extract_page_range(pdf_content: bytes, start: int, stop: int) -> List[Tuple[int, str]]:
+    """
+    Worker for extract_text_from_pdf_parallel: open the PDF once and return
+    (page_index, cleaned_text) for pages [start, stop).
+    """
+    pdf_reader = PyPDF2.PdfReader(BytesIO(pdf_content))
+    
+    results = []
+    for page_num in range(start, stop):
+        try:
+            results.append((page_num, clean_pdf_text(pdf_reader.pages[page_num].extract_text())))
+        except Exception as e:
+            logger.error(f"Error extracting page {page_num + 1}: {str(e)}")
+    return results
+
+
+def extract_text_from_pdf_parallel(pdf_content: bytes, num_workers: Optional[int] = None) -> List[str]:
+    """
+    Same output as extract_text_from_pdf, but pages are extracted and cleaned
+    in a process pool (text extraction is CPU-bound and independent per page).
+    
+    Args:
+        pdf_content: PDF file content as bytes
+        num_workers: Worker processes (default: min(cpu count, 4))
+        
+    Returns:
+        List of strings, one per non-empty page, in page order
+    """
+    num_workers = num_workers or min(os.cpu_count() or 1, 4)
+    
+    try:
+        page_count = len(PyPDF2.PdfReader(BytesIO(pdf_content)).pages)
+    except Exception as e:
+        logger.error(f"Error reading PDF: {str(e)}")
+        raise ValueError(f"Failed to parse PDF: {str(e)}")
+    
+    num_workers = min(num_workers, page_count)
+    if num_workers <= 1:
+        return extract_text_from_pdf(pdf_content)
+    
+    # One contiguous page range per worker, so each opens the PDF only once
+    shard_size = -(-page_count // num_workers)
+    starts = list(range(0, page_count, shard_size))
+    stops = [min(start + shard_size, page_count) for start in starts]
+    
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        shards = executor.map(_extract_page_range, [pdf_content] * len(starts), starts, stops)
+        extracted = sorted(page for shard in shards for page in shard)
+    
+    pages = []
+    for page_num, cleaned_text in extracted:
+        if cleaned_text.strip():  # Only add non-empty pages
+            pages.append(cleaned_text)
+            logger.info(f"Extracted page {page_num + 1}: {len(cleaned_text)} characters")
+        else:
+            logger.warning(f"Page {page_num + 1} is empty after cleaning")
+    
+    logger.info(f"Successfully extracted {len(pages)} pages from PDF using {num_workers} workers")
+    return pages
+
+
 def clean_pdf_text(text: str) -> str:
     """
     Clean and normalize text extracted from PDF.
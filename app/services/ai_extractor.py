@@ -9,21 +9,38 @@ This module now contains ALL regex extraction logic (consolidated from regex_ext
 """
 
 from __future__ import annotations
-from typing import Optional, Dict, Any, List, Tuple
-import json
+from typing import TYPE_CHECKING, Callable, FrozenSet, Iterable, Optional, Dict, Any, List, Tuple, Union
+import asyncio
+import bisect
+import hashlib
+import importlib.util
+import itertools
 import os
 import logging
+import threading
 import time
-import traceback
 import re
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache, wraps
 
+import orjson
 from dotenv import load_dotenv
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
+from pydantic import TypeAdapter, ValidationError
+
+try:
+    import re2  # optional: google-re2
+except ImportError:
+    re2 = None
+
+if TYPE_CHECKING:
+    from langchain_core.prompts import ChatPromptTemplate
 
 # Import our models and prompts
 from .models import LegalCaseExtraction
+from ..models.document_types import ProcessingStrategy, get_processing_strategy
 from .prompts import SYSTEM_PROMPT, HUMAN_TEMPLATE
 
 # Ensure .env is loaded when this module is imported
@@ -102,40 +119,261 @@ class RegexExtractionResult:
 # REGEX PRE-EXTRACTION - Reliable extraction before AI processing
 # =============================================================================
 
-def extract_court_level_regex(text: str) -> str:
+def _compile_linear(pattern: str):
+    """
+    Compile with google-re2 (linear-time, no backtracking) if it is installed,
+    otherwise with `re`. Only for patterns RE2 supports; put flags inline.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error as e:
+            logger.debug("[Regex] RE2 rejected pattern, using re: %s", e)
+    return re.compile(pattern)
+
+
+# Strategies whose documents don't use the regex-extracted outcome/party fields
+_NO_REGEX_STRATEGIES = frozenset({ProcessingStrategy.EVIDENCE_INDEXING, ProcessingStrategy.TEXT_ONLY})
+
+# Compiled once at import - these run on every document
+_DOCKET_DIVISION_RE = re.compile(r'\d+-\d+-([IVX]+)')
+
+_CASE_NUMBER_RES = (
+    re.compile(r'No\.\s*(\d+[,\d]*-\d+(?:-[IVX]+)?)', re.IGNORECASE),  # "No. 39019-5-III" or "No. 101,045-1"
+    re.compile(r'Case\s*(?:No\.|Number)?\s*[:\s]*(\d+[,\d]*-\d+(?:-[IVX]+)?)', re.IGNORECASE),
+)
+
+# Washington citations: 123 Wn.2d 456, 123 Wn. App. 456, etc.
+_WA_CITATION_RE = re.compile(
+    r'(\d{1,3})\s+(Wn\.?\s*(?:App\.?\s*)?2d|Wn\.?\s*App\.?|Wash\.?\s*2d|Wash\.?)\s+(\d{1,4})'
+)
+
+_RCW_RE = re.compile(r'RCW\s+(\d+\.\d+(?:\.\d+)?)', re.IGNORECASE)
+
+# Citations and RCWs combined so the full opinion text is scanned once.
+# The two alternatives start on different characters (digit vs. 'R'), so
+# they never compete for the same match position.
+_CITATION_OR_RCW_RE = re.compile(
+    r'(?P<volume>\d{1,3})\s+(?P<reporter>Wn\.?\s*(?:App\.?\s*)?2d|Wn\.?\s*App\.?|Wash\.?\s*2d|Wash\.?)\s+(?P<page>\d{1,4})'
+    r'|(?i:RCW)\s+(?P<rcw>\d+\.\d+(?:\.\d+)?)'
+)
+
+# Outcome patterns - ordered from most specific to least specific
+_OUTCOME_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), outcome, detail)
+    for pattern, outcome, detail in (
+        # Combined outcomes (most specific first)
+        (r'affirm(?:ed)?\s+in\s+part[,\s]+(?:and\s+)?revers(?:ed)?\s+in\s+part',
+         'affirmed', 'affirmed in part, reversed in part'),
+        (r'revers(?:ed)?\s+in\s+part[,\s]+(?:and\s+)?affirm(?:ed)?\s+in\s+part',
+         'reversed', 'reversed in part, affirmed in part'),
+        (r'(?:we\s+)?revers(?:e|ed)\s+(?:and\s+)?remand',
+         'reversed', 'reversed and remanded'),
+        (r'(?:we\s+)?affirm(?:ed)?\s+(?:and\s+)?remand',
+         'affirmed', 'affirmed and remanded'),
+        # "We reverse/affirm" patterns (common in WA opinions)
+        (r'\bwe\s+remand\b', 'remanded', None),
+        (r'\bwe\s+affirm\b', 'affirmed', None),
+        (r'\bwe\s+reverse\b', 'reversed', None),
+        (r'\bwe\s+dismiss\b', 'dismissed', None),
+        # "is hereby affirmed" patterns
+        (r'\bis\s+(?:hereby\s+)?affirmed\b', 'affirmed', None),
+        (r'\bis\s+(?:hereby\s+)?reversed\b', 'reversed', None),
+        (r'\bis\s+(?:hereby\s+)?remanded\b', 'remanded', None),
+        (r'\bis\s+(?:hereby\s+)?dismissed\b', 'dismissed', None),
+        # Simple past tense forms (least specific)
+        (r'\baffirmed\b', 'affirmed', None),
+        (r'\breversed\b', 'reversed', None),
+        (r'\bremanded\b', 'remanded', None),
+        (r'\bdismissed\b', 'dismissed', None),
+    )
+)
+
+_EN_BANC_RE = re.compile(r'\bEN\s+BANC\b', re.IGNORECASE)
+
+# Literals the court level / division / publication status checks look for
+# in the uppercased 5000-char header
+_HEADER_LITERALS = (
+    'SUPREME COURT OF THE STATE OF WASHINGTON',
+    'IN THE COURT OF APPEALS',
+    'COURT OF APPEALS OF THE STATE OF WASHINGTON',
+    'SUPREME COURT',
+    'COURT OF APPEALS',
+    'DIVISION THREE', 'DIVISION III',
+    'DIVISION TWO', 'DIVISION II',
+    'DIVISION ONE', 'DIVISION I',
+    'OPINION PUBLISHED IN PART',
+    'PUBLISHED IN PART',
+    'UNPUBLISHED',
+)
+_HEADER_LITERALS_BYTES = tuple(literal.encode('ascii') for literal in _HEADER_LITERALS)
+_HEADER_LITERALS_LOWER = tuple(literal.lower() for literal in _HEADER_LITERALS)
+
+# Parties
+_V_SPLIT_RE = re.compile(r'\s+v\.?\s+', re.IGNORECASE)
+# The name run is a broad character class, so `re` backtracks quadratically
+# over long captions; use the linear-time engine for it when installed
+_PARTY_NAME_RE = _compile_linear(
+    r'(?i)([A-Z][A-Z\s\.,\']+(?:,\s*(?:JR\.|SR\.|III|II|IV)?)?)\s*,?\s*(?:Plaintiff|Defendant|Appellant|Respondent|Petitioner)'
+)
+# RE2's \s is ASCII [\t\n\f\r ] only, while `re` also matches \v, NBSP and other
+# Unicode spaces common in PDF text; map those to ' ' so both engines see the same input
+_PARTY_SPACE_TABLE = str.maketrans({
+    c: ' ' for c in map(chr, range(0x3001)) if c.isspace() and c not in ' \t\n\f\r'
+})
+_PARTY_SIMPLE_NAME_RE = re.compile(r'^([A-Z][A-Z\s\.\']+)')
+# Caption role words, found in one overlapping scan and then resolved in priority order
+_PARTY_ROLE_WORD_RE = re.compile(r'(?=(appellant|respondent|cross|plaintiff|defendant|petitioner))')
+_PARTY_ROLE_PRIORITY = (
+    ('appellant', 'Appellant'),
+    ('respondent', 'Respondent'),
+    ('plaintiff', 'Plaintiff'),
+    ('defendant', 'Defendant'),
+    ('petitioner', 'Petitioner'),
+)
+
+# Judges
+_J_PATTERN = re.compile(r'([A-Z][A-Za-z\-]+(?:\s+[A-Z][a-z]+)?),?\s*J\.', re.MULTILINE)
+_CONCUR_RE = re.compile(r'WE CONCUR[:\s]*(.{100,500})', re.IGNORECASE | re.DOTALL)
+_CONCUR_NAME_RE = re.compile(r'([A-Z][A-Za-z\-]+(?:\s+[A-Z][a-z]+)?),?\s*(?:J\.|C\.J\.)')
+_AUTHORED_RE = re.compile(r'Authored by\s+([A-Za-z\s\-\.]+)', re.IGNORECASE)
+_TRAILING_J_RE = re.compile(r'\s*,?\s*J\.?\s*$')
+
+# Case type (matched against lowercased header text)
+_STATE_DEFENDANT_RE = re.compile(r'v\.\s*(?:the\s+)?state of washington\s*,?\s*(?:d/b/a|defendant)')
+_STATE_RESPONDENT_RE = re.compile(r'state of washington\s*,?\s*respondent\s*,?\s*v\.')
+_STATE_V_APPELLANT_RE = re.compile(r'state of washington\s*,?\s*v\.\s*[^,]+,?\s*appellant')
+
+# Case type keyword cues (lowercase), in priority order; any cue in a group decides
+_CASE_TYPE_CUES_BEFORE_CRIMINAL = (
+    (('certification from', 'certified question'), 'civil'),
+    (('title ix', 'duty of care', 'duty to protect', 'negligence', 'negligent'), 'tort'),
+)
+_CRIMINAL_CUES = ('unlawful possession', 'convicted of', 'felony', 'misdemeanor')
+_CASE_TYPE_CUES_AFTER_CRIMINAL = (
+    (('in the matter of the estate', 'living trust', 'probate', 'personal representative',
+      'tedra', 'trust and estate'), 'estate'),
+    (('in re marriage', 'dissolution'), 'divorce'),
+    (('child support', 'parenting plan', 'custody', 'visitation'), 'family'),
+)
+
+# County - explicit references, checked in order
+_COUNTY_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'Appeal from\s+(?:the\s+)?([A-Za-z]+(?:\s+[A-Za-z]+)?)\s+County\s+Superior Court',
+        r'Appeal from\s+(?:the\s+)?Superior Court\s+(?:of|for)\s+([A-Za-z]+(?:\s+[A-Za-z]+)?)\s+County',
+        r'([A-Za-z]+)\s+County\s+Superior Court',
+        r'Superior Court of\s+([A-Za-z]+)\s+County',
+        r'Superior Court for\s+([A-Za-z]+)\s+County',
+        r'filed in\s+([A-Za-z]+)\s+County',
+        r'tried in\s+([A-Za-z]+)\s+County',
+    )
+)
+_COUNTY_STOPWORDS = frozenset({'the', 'a', 'an', 'of', 'state', 'washington'})
+
+# Washington State city-to-county mapping for common cities
+_CITY_TO_COUNTY = {
+    'seattle': 'King',
+    'tacoma': 'Pierce',
+    'spokane': 'Spokane',
+    'vancouver': 'Clark',
+    'bellevue': 'King',
+    'everett': 'Snohomish',
+    'kent': 'King',
+    'renton': 'King',
+    'spokane valley': 'Spokane',
+    'federal way': 'King',
+    'yakima': 'Yakima',
+    'bellingham': 'Whatcom',
+    'kennewick': 'Benton',
+    'auburn': 'King',
+    'pasco': 'Franklin',
+    'marysville': 'Snohomish',
+    'lakewood': 'Pierce',
+    'redmond': 'King',
+    'richland': 'Benton',
+    'olympia': 'Thurston',
+    'bremerton': 'Kitsap',
+    'pullman': 'Whitman',
+    'moses lake': 'Grant',
+    'longview': 'Cowlitz',
+    'wenatchee': 'Chelan',
+    'walla walla': 'Walla Walla',
+    'ellensburg': 'Kittitas',
+    'port angeles': 'Clallam',
+    'tri-cities': 'Benton',
+    'mount vernon': 'Skagit',
+    'anacortes': 'Skagit',
+}
+
+# City name in context that suggests location, e.g. "Moses Lake Police
+# Department" or "in Moses Lake", as one overlapping scan. "{city} police
+# department" is covered by "{city} police". The two branches can't both match
+# at one position (no city name starts with "in"/"at" + whitespace), and within
+# a branch the alternation order means the earliest city wins.
+_CITY_NAMES = '|'.join(map(re.escape, _CITY_TO_COUNTY))
+_CITY_CONTEXT_RE = re.compile(
+    r'(?=(?:in|at)\s+(' + _CITY_NAMES + r')|(' + _CITY_NAMES + r')\s+(?:police|city|municipal))'
+)
+_CITY_RANK = {city: i for i, city in enumerate(_CITY_TO_COUNTY)}
+
+
+def scan_header_literals(text: str, header_lower: Optional[str] = None) -> FrozenSet[str]:
+    """
+    Find which of the court/division/publication header literals appear in the
+    first 5000 chars. Every literal is tested once, so callers that need several
+    header fields can scan once and pass the hits to each extractor.
+    header_lower is text[:10000].lower() when the caller already has it; for
+    ASCII text it is searched directly instead of making an uppercase copy.
+    """
+    if header_lower is not None and header_lower.isascii():
+        header_head = header_lower[:5000]
+        return frozenset(
+            literal for literal, needle in zip(_HEADER_LITERALS, _HEADER_LITERALS_LOWER) if needle in header_head
+        )
+    header_upper = text[:5000].upper()
+    if header_upper.isascii():
+        return frozenset(literal for literal in _HEADER_LITERALS if literal in header_upper)
+    # Non-ASCII headers are stored 2-4 bytes per char; the needles are ASCII, so
+    # search a 1-byte copy ('?' for anything else keeps the match positions)
+    header_bytes = header_upper.encode('ascii', 'replace')
+    return frozenset(
+        literal for literal, needle in zip(_HEADER_LITERALS, _HEADER_LITERALS_BYTES) if needle in header_bytes
+    )
+
+
+def extract_court_level_regex(text: str, header_hits: Optional[FrozenSet[str]] = None) -> str:
     """Reliably extract court level using regex patterns."""
-    text_upper = text.upper()
-    
     # Check first 5000 chars for court identification
-    header_text = text_upper[:5000]
+    hits = header_hits if header_hits is not None else scan_header_literals(text)
     
-    if 'SUPREME COURT OF THE STATE OF WASHINGTON' in header_text:
+    if 'SUPREME COURT OF THE STATE OF WASHINGTON' in hits:
         return 'Supreme'
-    elif 'IN THE COURT OF APPEALS' in header_text or 'COURT OF APPEALS OF THE STATE OF WASHINGTON' in header_text:
+    elif 'IN THE COURT OF APPEALS' in hits or 'COURT OF APPEALS OF THE STATE OF WASHINGTON' in hits:
         return 'Appeals'
-    elif 'SUPREME COURT' in header_text:
+    elif 'SUPREME COURT' in hits:
         return 'Supreme'
-    elif 'COURT OF APPEALS' in header_text:
+    elif 'COURT OF APPEALS' in hits:
         return 'Appeals'
     
     return 'Appeals'  # Default
 
 
-def extract_division_regex(text: str) -> str:
+def extract_division_regex(text: str, header_hits: Optional[FrozenSet[str]] = None) -> str:
     """Reliably extract division using regex patterns."""
-    text_upper = text.upper()
-    header_text = text_upper[:5000]
+    hits = header_hits if header_hits is not None else scan_header_literals(text)
     
     # Look for "DIVISION ONE/TWO/THREE" or "DIVISION I/II/III"
-    if 'DIVISION THREE' in header_text or 'DIVISION III' in header_text:
+    if 'DIVISION THREE' in hits or 'DIVISION III' in hits:
         return 'Division III'
-    elif 'DIVISION TWO' in header_text or 'DIVISION II' in header_text:
+    elif 'DIVISION TWO' in hits or 'DIVISION II' in hits:
         return 'Division II'
-    elif 'DIVISION ONE' in header_text or 'DIVISION I' in header_text:
+    elif 'DIVISION ONE' in hits or 'DIVISION I' in hits:
         return 'Division I'
     
     # Also check docket number suffix like "39019-5-III"
-    docket_match = re.search(r'\d+-\d+-([IVX]+)', text[:5000])
+    docket_match = _DOCKET_DIVISION_RE.search(text[:5000])
     if docket_match:
         div = docket_match.group(1).upper()
         if div == 'III':
@@ -148,14 +386,13 @@ def extract_division_regex(text: str) -> str:
     return 'N/A'
 
 
-def extract_publication_status_regex(text: str) -> str:
+def extract_publication_status_regex(text: str, header_hits: Optional[FrozenSet[str]] = None) -> str:
     """Extract publication status using regex patterns."""
-    text_upper = text.upper()
-    header_text = text_upper[:5000]
+    hits = header_hits if header_hits is not None else scan_header_literals(text)
     
-    if 'OPINION PUBLISHED IN PART' in header_text or 'PUBLISHED IN PART' in header_text:
+    if 'OPINION PUBLISHED IN PART' in hits or 'PUBLISHED IN PART' in hits:
         return 'Partially Published'
-    elif 'UNPUBLISHED' in header_text:
+    elif 'UNPUBLISHED' in hits:
         return 'Unpublished'
     
     return 'Published'
@@ -164,13 +401,9 @@ def extract_publication_status_regex(text: str) -> str:
 def extract_case_number_regex(text: str) -> Optional[str]:
     """Extract case/docket number using regex patterns."""
     # Look for "No. 12345-6-I" or "No. 101,045-1" patterns
-    patterns = [
-        r'No\.\s*(\d+[,\d]*-\d+(?:-[IVX]+)?)',  # "No. 39019-5-III" or "No. 101,045-1"
-        r'Case\s*(?:No\.|Number)?\s*[:\s]*(\d+[,\d]*-\d+(?:-[IVX]+)?)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text[:5000], re.IGNORECASE)
+    header_text = text[:5000]
+    for pattern in _CASE_NUMBER_RES:
+        match = pattern.search(header_text)
         if match:
             return match.group(1).strip()
     
@@ -191,7 +424,7 @@ def extract_parties_regex(text: str) -> List[Tuple[str, str]]:
     # Pattern 2: "STATE OF WASHINGTON, Respondent, v. NAME, Appellant"
     
     # Split on "v." or "vs." to get plaintiff/appellant side and defendant/respondent side
-    v_split = re.split(r'\s+v\.?\s+', header_text, maxsplit=1, flags=re.IGNORECASE)
+    v_split = _V_SPLIT_RE.split(header_text, maxsplit=1)
     
     if len(v_split) >= 2:
         left_side = v_split[0]
@@ -222,41 +455,34 @@ def _extract_party_from_section(section: str) -> List[Tuple[str, str]]:
     
     # Detect role
     role = 'Unknown'
-    role_lower = clean_text.lower()
-    if 'appellant' in role_lower and 'cross' in role_lower and 'respondent' in role_lower:
+    role_words = set(_PARTY_ROLE_WORD_RE.findall(clean_text.lower()))
+    if {'appellant', 'cross', 'respondent'} <= role_words:
         role = 'Appellant/Cross Respondent'
-    elif 'respondent' in role_lower and 'cross' in role_lower and 'appellant' in role_lower:
-        role = 'Respondent/Cross Appellant'
-    elif 'appellant' in role_lower:
-        role = 'Appellant'
-    elif 'respondent' in role_lower:
-        role = 'Respondent'
-    elif 'plaintiff' in role_lower:
-        role = 'Plaintiff'
-    elif 'defendant' in role_lower:
-        role = 'Defendant'
-    elif 'petitioner' in role_lower:
-        role = 'Petitioner'
+    else:
+        for word, word_role in _PARTY_ROLE_PRIORITY:
+            if word in role_words:
+                role = word_role
+                break
     
     # Extract name - look for uppercase names before role indicators
     # Pattern: "MADELEINE BARLOW, Plaintiff" or "STATE OF WASHINGTON, Respondent"
-    name_match = re.search(
-        r'([A-Z][A-Z\s\.,\']+(?:,\s*(?:JR\.|SR\.|III|II|IV)?)?)\s*,?\s*(?:Plaintiff|Defendant|Appellant|Respondent|Petitioner)',
-        clean_text,
-        re.IGNORECASE
-    )
+    # A match has to end in a role word, so ASCII text without one can't match
+    if clean_text.isascii() and role_words <= {'cross'}:
+        name_match = None
+    else:
+        name_match = _PARTY_NAME_RE.search(clean_text.translate(_PARTY_SPACE_TABLE))
     
     if name_match:
         name = name_match.group(1).strip().strip(',').strip()
         # Clean up name
-        name = re.sub(r'\s+', ' ', name)
+        name = ' '.join(name.split())
         # Title case for better display
         if name.isupper():
             name = name.title()
         parties.append((name, role))
     else:
         # Try simpler pattern - just uppercase words
-        simple_match = re.search(r'^([A-Z][A-Z\s\.\']+)', clean_text)
+        simple_match = _PARTY_SIMPLE_NAME_RE.search(clean_text)
         if simple_match:
             name = simple_match.group(1).strip()
             if len(name) > 3 and name.upper() != 'IN THE MATTER':
@@ -267,40 +493,85 @@ def _extract_party_from_section(section: str) -> List[Tuple[str, str]]:
     return parties
 
 
-def extract_judges_regex(text: str) -> List[Tuple[str, str]]:
+def _title_case(name: str) -> str:
+    """str.title(), skipping the copy when the name is already title-cased."""
+    return name if name.istitle() else name.title()
+
+
+def _search_from_anchor(pattern: re.Pattern, text: str, text_lower: Optional[str], anchor: str) -> Optional[re.Match]:
     """
-    Extract judge names and roles using regex patterns.
-    Returns list of (name, role) tuples.
+    Same result as pattern.search(text) for a case-insensitive pattern that can
+    only match where `anchor` (lowercase literal) occurs. Candidate positions are
+    found with str.find on text_lower, and the regex only runs at those. Pass
+    text_lower=None when text.lower() would not keep positions (non-ASCII text).
     """
-    judges = []
-    seen_names = set()
-    
+    if text_lower is None:
+        return pattern.search(text)
+    pos = text_lower.find(anchor)
+    while pos != -1:
+        match = pattern.match(text, pos)
+        if match:
+            return match
+        pos = text_lower.find(anchor, pos + 1)
+    return None
+
+
+# Signature blocks ("SMITH, J.", "WE CONCUR:") sit at the end of the opinion
+_JUDGE_SIGNATURE_CHARS = 8000
+
+
+def _extract_signature_judges(
+    text: str, text_lower: Optional[str], judges: List[Tuple[str, str]], seen_names: set
+) -> None:
+    """Append "NAME, J." signers and WE CONCUR names found in text to judges."""
     # Pattern 1: "JOHNSON, J." or "LAWRENCE-BERREY, J."
-    j_pattern = re.compile(r'([A-Z][A-Za-z\-]+(?:\s+[A-Z][a-z]+)?),?\s*J\.', re.MULTILINE)
-    for match in j_pattern.finditer(text):
-        name = match.group(1).strip().title()
+    for match in _J_PATTERN.finditer(text):
+        name = _title_case(match.group(1).strip())
         if name not in seen_names and len(name) > 1:
             seen_names.add(name)
             judges.append((name, 'Authored by'))
     
     # Pattern 2: "WE CONCUR:" followed by judge names/signatures
-    concur_match = re.search(r'WE CONCUR[:\s]*(.{100,500})', text, re.IGNORECASE | re.DOTALL)
+    concur_match = _search_from_anchor(_CONCUR_RE, text, text_lower, 'we concur')
     if concur_match:
         concur_section = concur_match.group(1)
         # Look for judge name patterns
-        concur_names = re.findall(r'([A-Z][A-Za-z\-]+(?:\s+[A-Z][a-z]+)?),?\s*(?:J\.|C\.J\.)', concur_section)
+        concur_names = _CONCUR_NAME_RE.findall(concur_section)
         for name in concur_names:
-            name = name.strip().title()
+            name = _title_case(name.strip())
             if name not in seen_names and len(name) > 1:
                 seen_names.add(name)
                 judges.append((name, 'Concurring'))
+
+
+def extract_judges_regex(text: str) -> List[Tuple[str, str]]:
+    """
+    Extract judge names and roles using regex patterns.
+    Returns list of (name, role) tuples.
+    Signatures are read from the last _JUDGE_SIGNATURE_CHARS of the opinion,
+    falling back to the full text when that window has none.
+    """
+    judges = []
+    seen_names = set()
+    # One lowercase copy lets the case-insensitive searches skip straight to
+    # their literal prefixes instead of each scanning the whole text
+    text_lower = text.lower() if text.isascii() else None
+    
+    if len(text) > _JUDGE_SIGNATURE_CHARS:
+        _extract_signature_judges(
+            text[-_JUDGE_SIGNATURE_CHARS:],
+            text_lower[-_JUDGE_SIGNATURE_CHARS:] if text_lower is not None else None,
+            judges, seen_names,
+        )
+    if not judges:
+        _extract_signature_judges(text, text_lower, judges, seen_names)
     
-    # Pattern 3: "Authored by [Name]"
-    authored_match = re.search(r'Authored by\s+([A-Za-z\s\-\.]+)', text, re.IGNORECASE)
+    # Pattern 3: "Authored by [Name]" - on the cover page, so search the full text
+    authored_match = _search_from_anchor(_AUTHORED_RE, text, text_lower, 'authored by')
     if authored_match:
-        name = authored_match.group(1).strip().title()
+        name = _title_case(authored_match.group(1).strip())
         # Clean up - remove trailing role indicators
-        name = re.sub(r'\s*,?\s*J\.?\s*$', '', name)
+        name = _TRAILING_J_RE.sub('', name)
         if name and name not in seen_names:
             seen_names.add(name)
             # Insert at beginning since this is the primary author
@@ -309,139 +580,87 @@ def extract_judges_regex(text: str) -> List[Tuple[str, str]]:
     return judges
 
 
-def extract_case_type_regex(text: str) -> str:
-    """Determine case type from document content using regex."""
-    text_lower = text.lower()
-    header_lower = text_lower[:10000]  # First 10000 chars for context
+def extract_case_type_regex(text: str, header_lower: Optional[str] = None) -> str:
+    """
+    Determine case type from document content using regex.
+    header_lower is text[:10000].lower() when the caller already has it.
+    """
+    if header_lower is None:
+        header_lower = text[:10000].lower()  # First 10000 chars for context
+    
+    # All three caption regexes below need this literal, so one substring test
+    # decides whether any of them has to run
+    state_party = 'state of washington' in header_lower
     
     # First check for civil cases where State is DEFENDANT (sued by plaintiff)
     # Pattern: "Plaintiff v. State of Washington" or "v. State of Washington, Defendant"
-    if re.search(r'v\.\s*(?:the\s+)?state of washington\s*,?\s*(?:d/b/a|defendant)', header_lower):
+    if state_party and _STATE_DEFENDANT_RE.search(header_lower):
         return 'civil'
-    # Certified questions from federal courts are civil matters
-    if 'certification from' in header_lower or 'certified question' in header_lower:
-        return 'civil'
-    # Title IX, negligence, duty of care = tort/civil
-    if 'title ix' in header_lower or 'duty of care' in header_lower or 'duty to protect' in header_lower:
-        return 'tort'
-    if 'negligence' in header_lower or 'negligent' in header_lower:
-        return 'tort'
+    
+    # Certified questions (civil), then Title IX / negligence / duty of care (tort)
+    for cues, case_type in _CASE_TYPE_CUES_BEFORE_CRIMINAL:
+        if any(cue in header_lower for cue in cues):
+            return case_type
     
     # Criminal case patterns - State is PROSECUTOR/RESPONDENT (prosecuting defendant)
     # Pattern: "State of Washington, Respondent v. [Defendant]"
-    if re.search(r'state of washington\s*,?\s*respondent\s*,?\s*v\.', header_lower):
-        return 'criminal'
     # Pattern: "State of Washington v. [Defendant], Appellant"
-    if re.search(r'state of washington\s*,?\s*v\.\s*[^,]+,?\s*appellant', header_lower):
+    if state_party and (_STATE_RESPONDENT_RE.search(header_lower) or _STATE_V_APPELLANT_RE.search(header_lower)):
         return 'criminal'
-    if 'unlawful possession' in header_lower or 'convicted of' in header_lower:
+    if any(cue in header_lower for cue in _CRIMINAL_CUES):
         return 'criminal'
     if 'criminal' in header_lower and 'conviction' in header_lower:
         return 'criminal'
-    if 'felony' in header_lower or 'misdemeanor' in header_lower:
-        return 'criminal'
     
-    # Estate/Probate patterns
-    if 'in the matter of the estate' in header_lower or 'living trust' in header_lower:
-        return 'estate'
-    if 'probate' in header_lower or 'personal representative' in header_lower:
-        return 'estate'
-    if 'tedra' in header_lower or 'trust and estate' in header_lower:
-        return 'estate'
-    
-    # Divorce/Family patterns
-    if 'in re marriage' in header_lower or 'dissolution' in header_lower:
-        return 'divorce'
-    if 'child support' in header_lower or 'parenting plan' in header_lower:
-        return 'family'
-    if 'custody' in header_lower or 'visitation' in header_lower:
-        return 'family'
-    
-    # Civil patterns - general (after checking criminal)
-    if 'd/b/a' in header_lower or 'university' in header_lower:
-        return 'civil'
-    if 'breach of contract' in header_lower or 'breach of fiduciary' in header_lower:
-        return 'civil'
+    # Estate/probate, divorce, then family patterns
+    for cues, case_type in _CASE_TYPE_CUES_AFTER_CRIMINAL:
+        if any(cue in header_lower for cue in cues):
+            return case_type
     
-    # Default
+    # Default - also covers the general civil cues ('d/b/a', 'university',
+    # 'breach of contract', 'breach of fiduciary')
     return 'civil'
 
 
-def extract_county_regex(text: str) -> Optional[str]:
-    """Extract county information using regex patterns."""
-    
-    # Washington State city-to-county mapping for common cities
-    city_to_county = {
-        'seattle': 'King',
-        'tacoma': 'Pierce',
-        'spokane': 'Spokane',
-        'vancouver': 'Clark',
-        'bellevue': 'King',
-        'everett': 'Snohomish',
-        'kent': 'King',
-        'renton': 'King',
-        'spokane valley': 'Spokane',
-        'federal way': 'King',
-        'yakima': 'Yakima',
-        'bellingham': 'Whatcom',
-        'kennewick': 'Benton',
-        'auburn': 'King',
-        'pasco': 'Franklin',
-        'marysville': 'Snohomish',
-        'lakewood': 'Pierce',
-        'redmond': 'King',
-        'richland': 'Benton',
-        'olympia': 'Thurston',
-        'bremerton': 'Kitsap',
-        'pullman': 'Whitman',
-        'moses lake': 'Grant',
-        'longview': 'Cowlitz',
-        'wenatchee': 'Chelan',
-        'walla walla': 'Walla Walla',
-        'ellensburg': 'Kittitas',
-        'port angeles': 'Clallam',
-        'tri-cities': 'Benton',
-        'mount vernon': 'Skagit',
-        'anacortes': 'Skagit',
-    }
-    
-    # Look for explicit county references first
-    patterns = [
-        r'Appeal from\s+(?:the\s+)?([A-Za-z]+(?:\s+[A-Za-z]+)?)\s+County\s+Superior Court',
-        r'Appeal from\s+(?:the\s+)?Superior Court\s+(?:of|for)\s+([A-Za-z]+(?:\s+[A-Za-z]+)?)\s+County',
-        r'([A-Za-z]+)\s+County\s+Superior Court',
-        r'Superior Court of\s+([A-Za-z]+)\s+County',
-        r'Superior Court for\s+([A-Za-z]+)\s+County',
-        r'filed in\s+([A-Za-z]+)\s+County',
-        r'tried in\s+([A-Za-z]+)\s+County',
-    ]
-    
+def extract_county_regex(text: str, header_lower: Optional[str] = None) -> Optional[str]:
+    """
+    Extract county information using regex patterns.
+    header_lower is text[:10000].lower() when the caller already has it.
+    """
     text_to_search = text[:10000]  # Expand search area
     
-    for pattern in patterns:
-        match = re.search(pattern, text_to_search, re.IGNORECASE)
+    # Look for explicit county references first
+    for pattern in _COUNTY_RES:
+        match = pattern.search(text_to_search)
         if match:
-            county = match.group(1).strip().title()
-            if county.lower() not in ['the', 'a', 'an', 'of', 'state', 'washington']:
+            county = _title_case(match.group(1).strip())
+            if county.lower() not in _COUNTY_STOPWORDS:
                 return county
     
-    # If no explicit county found, try to find city names and map to counties
-    text_lower = text_to_search.lower()
-    for city, county in city_to_county.items():
-        # Look for city name in context that suggests location
-        # e.g., "Moses Lake Police Department" or "in Moses Lake"
-        city_patterns = [
-            rf'{city}\s+police\s+department',
-            rf'{city}\s+police',
-            rf'in\s+{city}',
-            rf'at\s+{city}',
-            rf'{city}\s+(?:city|municipal)',
-        ]
-        for city_pattern in city_patterns:
-            if re.search(city_pattern, text_lower):
-                return county
+    # If no explicit county found, try to find city names and map to counties.
+    # Cities are checked in mapping order, so the earliest listed city wins.
+    text_lower = header_lower if header_lower is not None else text_to_search.lower()
+    best_city = None
+    for match in _CITY_CONTEXT_RE.finditer(text_lower):
+        city = match.group(1) or match.group(2)
+        if best_city is None or _CITY_RANK[city] < _CITY_RANK[best_city]:
+            best_city = city
     
-    return None
+    return _CITY_TO_COUNTY[best_city] if best_city is not None else None
+
+
+def _normalize_reporter(reporter: str) -> str:
+    """Normalize a matched reporter abbreviation to its canonical form."""
+    reporter_norm = reporter.replace(' ', '').replace('.', '')
+    if 'App2d' in reporter_norm:
+        return 'Wn. App. 2d'
+    elif 'App' in reporter_norm:
+        return 'Wn. App.'
+    elif 'Wn2d' in reporter_norm or 'Wash2d' in reporter_norm:
+        return 'Wn.2d'
+    elif 'Wash' in reporter_norm:
+        return 'Wash.'
+    return 'Wn.2d'
 
 
 def extract_citations_regex(text: str) -> List[ExtractedCitation]:
@@ -452,25 +671,9 @@ def extract_citations_regex(text: str) -> List[ExtractedCitation]:
     citations = []
     seen = set()
     
-    # Washington citations: 123 Wn.2d 456, 123 Wn. App. 456, etc.
-    wa_citation_pattern = re.compile(
-        r'(\d{1,3})\s+(Wn\.?\s*(?:App\.?\s*)?2d|Wn\.?\s*App\.?|Wash\.?\s*2d|Wash\.?)\s+(\d{1,4})'
-    )
-    
-    for match in wa_citation_pattern.finditer(text):
+    for match in _WA_CITATION_RE.finditer(text):
         volume, reporter, page = match.groups()
-        # Normalize reporter format
-        reporter_norm = reporter.replace(' ', '').replace('.', '')
-        if 'App2d' in reporter_norm:
-            reporter_clean = 'Wn. App. 2d'
-        elif 'App' in reporter_norm:
-            reporter_clean = 'Wn. App.'
-        elif 'Wn2d' in reporter_norm or 'Wash2d' in reporter_norm:
-            reporter_clean = 'Wn.2d'
-        elif 'Wash' in reporter_norm:
-            reporter_clean = 'Wash.'
-        else:
-            reporter_clean = 'Wn.2d'
+        reporter_clean = _normalize_reporter(reporter)
         
         full = f"{volume} {reporter_clean} {page}"
         if full not in seen:
@@ -491,9 +694,7 @@ def extract_statutes_regex(text: str) -> List[ExtractedStatute]:
     statutes = []
     seen = set()
     
-    rcw_pattern = re.compile(r'RCW\s+(\d+\.\d+(?:\.\d+)?)', re.IGNORECASE)
-    
-    for match in rcw_pattern.finditer(text):
+    for match in _RCW_RE.finditer(text):
         rcw = match.group(1).rstrip('.')
         if rcw not in seen:
             statutes.append(ExtractedStatute(rcw_number=rcw, full_text=f"RCW {rcw}"))
@@ -502,6 +703,38 @@ def extract_statutes_regex(text: str) -> List[ExtractedStatute]:
     return statutes
 
 
+def extract_citations_and_statutes_regex(text: str) -> Tuple[List[ExtractedCitation], List[ExtractedStatute]]:
+    """
+    Extract case citations and RCW statutes in a single pass over the text.
+    Same results as extract_citations_regex + extract_statutes_regex.
+    """
+    citations = []
+    statutes = []
+    seen_citations = set()
+    seen_statutes = set()
+    
+    for match in _CITATION_OR_RCW_RE.finditer(text):
+        rcw = match.group('rcw')
+        if rcw is not None:
+            rcw = rcw.rstrip('.')
+            if rcw not in seen_statutes:
+                statutes.append(ExtractedStatute(rcw_number=rcw, full_text=f"RCW {rcw}"))
+                seen_statutes.add(rcw)
+            continue
+        
+        volume, page = match.group('volume'), match.group('page')
+        reporter_clean = _normalize_reporter(match.group('reporter'))
+        full = f"{volume} {reporter_clean} {page}"
+        if full not in seen_citations:
+            citations.append(ExtractedCitation(
+                volume=volume, reporter=reporter_clean,
+                page=page, full_citation=full
+            ))
+            seen_citations.add(full)
+    
+    return citations, statutes
+
+
 def extract_outcome_regex(text: str) -> Tuple[Optional[str], Optional[str]]:
     """
     Extract appeal outcome from document text.
@@ -510,36 +743,8 @@ def extract_outcome_regex(text: str) -> Tuple[Optional[str], Optional[str]]:
     # Search last 5000 chars where outcomes typically appear
     footer = text[-5000:] if len(text) > 5000 else text
     
-    # Outcome patterns - ordered from most specific to least specific
-    outcome_patterns = [
-        # Combined outcomes (most specific first)
-        (r'affirm(?:ed)?\s+in\s+part[,\s]+(?:and\s+)?revers(?:ed)?\s+in\s+part', 
-         'affirmed', 'affirmed in part, reversed in part'),
-        (r'revers(?:ed)?\s+in\s+part[,\s]+(?:and\s+)?affirm(?:ed)?\s+in\s+part', 
-         'reversed', 'reversed in part, affirmed in part'),
-        (r'(?:we\s+)?revers(?:e|ed)\s+(?:and\s+)?remand', 
-         'reversed', 'reversed and remanded'),
-        (r'(?:we\s+)?affirm(?:ed)?\s+(?:and\s+)?remand', 
-         'affirmed', 'affirmed and remanded'),
-        # "We reverse/affirm" patterns (common in WA opinions)
-        (r'\bwe\s+remand\b', 'remanded', None),
-        (r'\bwe\s+affirm\b', 'affirmed', None),
-        (r'\bwe\s+reverse\b', 'reversed', None),
-        (r'\bwe\s+dismiss\b', 'dismissed', None),
-        # "is hereby affirmed" patterns
-        (r'\bis\s+(?:hereby\s+)?affirmed\b', 'affirmed', None),
-        (r'\bis\s+(?:hereby\s+)?reversed\b', 'reversed', None),
-        (r'\bis\s+(?:hereby\s+)?remanded\b', 'remanded', None),
-        (r'\bis\s+(?:hereby\s+)?dismissed\b', 'dismissed', None),
-        # Simple past tense forms (least specific)
-        (r'\baffirmed\b', 'affirmed', None),
-        (r'\breversed\b', 'reversed', None),
-        (r'\bremanded\b', 'remanded', None),
-        (r'\bdismissed\b', 'dismissed', None),
-    ]
-    
-    for pattern, outcome, detail in outcome_patterns:
-        if re.search(pattern, footer, re.IGNORECASE):
+    for pattern, outcome, detail in _OUTCOME_PATTERNS:
+        if pattern.search(footer):
             return outcome, detail
     
     return None, None
@@ -548,7 +753,7 @@ def extract_outcome_regex(text: str) -> Tuple[Optional[str], Optional[str]]:
 def extract_en_banc_regex(text: str) -> bool:
     """Check if case was heard en banc."""
     header = text[:3000]
-    return bool(re.search(r'\bEN\s+BANC\b', header, re.IGNORECASE))
+    return bool(_EN_BANC_RE.search(header))
 
 
 def extract_all_regex(text: str, metadata: Optional[Dict[str, Any]] = None) -> RegexExtractionResult:
@@ -566,16 +771,18 @@ def extract_all_regex(text: str, metadata: Optional[Dict[str, Any]] = None) -> R
     result = RegexExtractionResult()
     
     # Court info
-    result.court_level = extract_court_level_regex(text)
-    result.division = extract_division_regex(text)
-    result.publication_status = extract_publication_status_regex(text)
+    header_lower = text[:10000].lower()
+    header_hits = scan_header_literals(text, header_lower)
+    result.court_level = extract_court_level_regex(text, header_hits)
+    result.division = extract_division_regex(text, header_hits)
+    result.publication_status = extract_publication_status_regex(text, header_hits)
     
     # Case identifiers
     result.case_file_id = extract_case_number_regex(text)
-    result.case_type = extract_case_type_regex(text)
+    result.case_type = extract_case_type_regex(text, header_lower)
     
     # Location
-    result.county = extract_county_regex(text)
+    result.county = extract_county_regex(text, header_lower)
     
     # Outcome
     result.appeal_outcome, result.outcome_detail = extract_outcome_regex(text)
@@ -587,8 +794,7 @@ def extract_all_regex(text: str, metadata: Optional[Dict[str, Any]] = None) -> R
     judges_tuples = extract_judges_regex(text)
     result.judges = [ExtractedJudge(name=name, role=role) for name, role in judges_tuples]
     
-    result.citations = extract_citations_regex(text)
-    result.statutes = extract_statutes_regex(text)
+    result.citations, result.statutes = extract_citations_and_statutes_regex(text)
     
     # Flags
     result.en_banc = extract_en_banc_regex(text)
@@ -600,180 +806,385 @@ def extract_all_regex(text: str, metadata: Optional[Dict[str, Any]] = None) -> R
     return result
 
 
+# Content-addressed cache for regex_pre_extract, so retries and fallback paths
+# that re-feed the same text skip the regex passes. Keyed on a 16-byte digest
+# rather than the text so the cache does not keep whole documents alive.
+_PRE_EXTRACT_CACHE_SIZE = 256
+_pre_extract_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_pre_extract_cache_lock = threading.Lock()
+
+
 def regex_pre_extract(text: str) -> Dict[str, Any]:
     """
     Perform regex pre-extraction to reliably extract key fields.
     These will override AI responses for fields where regex is more reliable.
+    Results are memoized by content hash; each call gets its own dict and lists.
     """
+    key = _pre_extract_key(text)
+    with _pre_extract_cache_lock:
+        cached = _pre_extract_cache.get(key)
+        if cached is not None:
+            _pre_extract_cache.move_to_end(key)
+    if cached is None:
+        cached = _regex_pre_extract_uncached(text)
+        _pre_extract_cache_put(key, cached)
+    return _copy_pre_extract(cached)
+
+
+def _pre_extract_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def _pre_extract_cache_put(key: bytes, result: Dict[str, Any]) -> None:
+    with _pre_extract_cache_lock:
+        _pre_extract_cache[key] = result
+        if len(_pre_extract_cache) > _PRE_EXTRACT_CACHE_SIZE:
+            _pre_extract_cache.popitem(last=False)
+
+
+def _copy_pre_extract(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached result so callers can't mutate the cached dict or lists."""
+    return {k: list(v) if isinstance(v, list) else v for k, v in result.items()}
+
+
+def _regex_pre_extract_uncached(text: str) -> Dict[str, Any]:
     appeal_outcome, outcome_detail = extract_outcome_regex(text)
+    citations, statutes = extract_citations_and_statutes_regex(text)
+    header_lower = text[:10000].lower()
+    header_hits = scan_header_literals(text, header_lower)
     
     return {
-        'court_level': extract_court_level_regex(text),
-        'district': extract_division_regex(text),
-        'published': extract_publication_status_regex(text),
+        'court_level': extract_court_level_regex(text, header_hits),
+        'district': extract_division_regex(text, header_hits),
+        'published': extract_publication_status_regex(text, header_hits),
         'case_file_id': extract_case_number_regex(text),
-        'case_type': extract_case_type_regex(text),
-        'county': extract_county_regex(text),
+        'case_type': extract_case_type_regex(text, header_lower),
+        'county': extract_county_regex(text, header_lower),
         'parties_regex': extract_parties_regex(text),
         'judges_regex': extract_judges_regex(text),
-        'citations': extract_citations_regex(text),
-        'statutes': extract_statutes_regex(text),
+        'citations': citations,
+        'statutes': statutes,
         'appeal_outcome': appeal_outcome,
         'outcome_detail': outcome_detail,
         'en_banc': extract_en_banc_regex(text),
     }
 
 
+def batch_regex_pre_extract(
+    texts: List[str],
+    max_workers: Optional[int] = None,
+    chunksize: int = 16,
+) -> List[Dict[str, Any]]:
+    """
+    Run regex_pre_extract over many documents using a process pool.
+    The regex passes are CPU-bound and hold the GIL, so threads don't scale
+    here; each document is independent. Results are returned in input order.
+    """
+    if len(texts) <= 1 or max_workers == 1:
+        return [regex_pre_extract(text) for text in texts]
+    
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        results = list(executor.map(_regex_pre_extract_uncached, texts, chunksize=chunksize))
+    
+    # Seed this process's cache so later regex_pre_extract calls on the same texts are hits
+    for text, result in zip(texts, results):
+        _pre_extract_cache_put(_pre_extract_key(text), result)
+    
+    return [_copy_pre_extract(result) for result in results]
+
+
+# LangChain is imported on first use so that regex-only callers and
+# workers that never extract do not pay its import cost.
+
+@lru_cache(maxsize=1)
 def _build_prompt() -> ChatPromptTemplate:
+    from langchain_core.prompts import ChatPromptTemplate
     return ChatPromptTemplate.from_messages([("system", SYSTEM_PROMPT), ("human", HUMAN_TEMPLATE)])
 
 
+# Appended to the system prompt for Ollama requests
+_OLLAMA_JSON_REQUIREMENTS = "\n\n🚨 CRITICAL JSON REQUIREMENTS:\nYour response MUST include ALL 7 top-level fields in your JSON:\n1. case (object)\n2. appeals_judges (array - REQUIRED even if empty [])\n3. attorneys (array - REQUIRED even if empty [])\n4. parties (array - REQUIRED even if empty [])\n5. issues_decisions (array - REQUIRED even if empty [])\n6. arguments (array - REQUIRED even if empty [])\n7. precedents (array - REQUIRED even if empty [])\n\nIf ANY field is missing from your JSON, the extraction WILL FAIL. Always include empty arrays [] if no data exists for that category."
+
+
+@lru_cache(maxsize=1)
+def _extraction_json_schema() -> Dict[str, Any]:
+    """LegalCaseExtraction JSON schema, built once (treat as read-only)."""
+    return LegalCaseExtraction.model_json_schema()
+
+
+@lru_cache(maxsize=1)
+def _ollama_schema_supported() -> bool:
+    """
+    Whether Ollama chat requests can pass the schema as format=<json-schema>
+    (server-side constrained decoding, ollama-python >= 0.4.3 / Ollama server >= 0.5;
+    0.4.0-0.4.2 type format as '' | 'json' and reject a schema dict client-side).
+    OLLAMA_FORMAT_SCHEMA=true/false overrides the client version check, e.g.
+    false for older servers that only understand format="json".
+    """
+    setting = os.getenv("OLLAMA_FORMAT_SCHEMA", "auto").lower()
+    if setting in ("true", "false"):
+        return setting == "true"
+    try:
+        from importlib.metadata import version
+        installed = version("ollama")
+        parts = tuple(int(part) for part in re.findall(r"\d+", installed)[:3])
+    except Exception:
+        return False
+    supported = parts >= (0, 4, 3)
+    logger.info(f"[Ollama] Native schema format {'enabled' if supported else 'unavailable'} "
+                f"(ollama-python {installed})")
+    return supported
+
+
+# Set once the installed client has refused format=<json-schema>
+_ollama_schema_refused = False
+
+
+def _ollama_native_schema() -> bool:
+    """Whether single-case Ollama requests currently use format=<json-schema>."""
+    return not _ollama_schema_refused and _ollama_schema_supported()
+
+
+def _ollama_json_retry_kwargs(error: ValidationError, chat_kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Chat kwargs for retrying with format="json" when the ollama client rejected
+    format=<json-schema> before sending it (a ValidationError on the request's
+    'format' field, from clients that only accept '' | 'json'). Native schema
+    format is then switched off for the rest of the process.
+    Returns None for any other error.
+    """
+    global _ollama_schema_refused
+    if not isinstance(chat_kwargs.get("format"), dict):
+        return None
+    if not any(tuple(err.get("loc", ()))[:1] == ("format",) for err in error.errors()):
+        return None
+    _ollama_schema_refused = True
+    logger.warning(f"[Ollama] Client rejected format=<json-schema>; retrying with format=\"json\"")
+    logger.debug("[Ollama] Schema format rejection:", exc_info=error)
+    return dict(chat_kwargs, format="json")
+
+
+def _ollama_format() -> Union[str, Dict[str, Any]]:
+    """format= argument for single-case Ollama chat requests."""
+    return _extraction_json_schema() if _ollama_native_schema() else "json"
+
+
+@lru_cache(maxsize=1)
+def _ollama_system_prompt() -> str:
+    """
+    System prompt + JSON requirements + the LegalCaseExtraction schema, built
+    once and reused. The schema stays in the prompt even when it is also sent
+    as format=, so the model sees the same instructions in both modes.
+    """
+    # Compact JSON: the pretty-printed schema roughly doubles its prompt tokens
+    schema_json = orjson.dumps(_extraction_json_schema()).decode()
+    system_prompt = (f"{SYSTEM_PROMPT}{_OLLAMA_JSON_REQUIREMENTS}"
+                     f"\n\nIMPORTANT: You must return valid JSON that matches this exact schema:\n{schema_json}")
+    # Server-side prefix/KV caching only helps while this prefix is byte-identical;
+    # log its hash so accidental drift between deployments is visible
+    digest = hashlib.blake2b(system_prompt.encode('utf-8'), digest_size=8).hexdigest()
+    logger.info(f"[Ollama] System prompt built: {len(system_prompt)} chars, blake2b={digest}")
+    return system_prompt
+
+
+def _format_user_message(case_info: Dict[str, Any], case_text: str) -> str:
+    """Render HUMAN_TEMPLATE the same way the ChatPromptTemplate would, without LangChain."""
+    return HUMAN_TEMPLATE.format(case_info=case_info, case_text=case_text)
+
+
+def _build_openai_chain(model: str):
+    """Build the prompt | structured ChatOpenAI chain; returns (llm, chain)."""
+    from langchain_openai import ChatOpenAI
+    
+    llm = ChatOpenAI(model=model, temperature=0)
+    structured_llm = llm.with_structured_output(LegalCaseExtraction, method="json_schema")
+    return llm, _build_prompt() | structured_llm
+
+
+@lru_cache(maxsize=4)
+def _get_openai_chain(model: str):
+    """Build the prompt | structured ChatOpenAI chain once per model and reuse it (sync callers)."""
+    return _build_openai_chain(model)[1]
+
+
+# Map common variations to proper enum values - now includes UNIVERSAL categories
+_ISSUE_CATEGORY_MAPPING = {
+    # ===== UNIVERSAL CATEGORIES (Non-Divorce) =====
+    # Criminal Law
+    'criminal law & procedure': 'Criminal Law & Procedure',
+    'criminal law': 'Criminal Law & Procedure',
+    'criminal': 'Criminal Law & Procedure',
+    'criminal procedure': 'Criminal Law & Procedure',
+    'search & seizure': 'Criminal Law & Procedure',
+    'fourth amendment': 'Criminal Law & Procedure',
+    'sentencing': 'Criminal Law & Procedure',
+    'firearm possession': 'Criminal Law & Procedure',
+    'unlawful possession': 'Criminal Law & Procedure',
+    
+    # Constitutional Law
+    'constitutional law': 'Constitutional Law',
+    'constitutional': 'Constitutional Law',
+    'due process': 'Constitutional Law',
+    'equal protection': 'Constitutional Law',
+    'first amendment': 'Constitutional Law',
+    'civil rights': 'Constitutional Law',
+    
+    # Civil Procedure
+    'civil procedure': 'Civil Procedure',
+    'summary judgment': 'Civil Procedure',
+    'motion to dismiss': 'Civil Procedure',
+    'statute of limitations': 'Civil Procedure',
+    'standing': 'Civil Procedure',
+    
+    # Evidence
+    'evidence': 'Evidence',
+    'hearsay': 'Evidence',
+    'expert testimony': 'Evidence',
+    'sufficiency of evidence': 'Evidence',
+    'insufficient evidence': 'Evidence',
+    
+    # Contracts
+    'contracts': 'Contracts',
+    'contract': 'Contracts',
+    'breach of contract': 'Contracts',
+    
+    # Torts / Personal Injury
+    'torts / personal injury': 'Torts / Personal Injury',
+    'torts': 'Torts / Personal Injury',
+    'tort': 'Torts / Personal Injury',
+    'personal injury': 'Torts / Personal Injury',
+    'negligence': 'Torts / Personal Injury',
+    'civil liability': 'Torts / Personal Injury',
+    'title ix': 'Torts / Personal Injury',
+    
+    # Property Law
+    'property law': 'Property Law',
+    'property': 'Property Law',
+    'real property': 'Property Law',
+    
+    # Employment Law
+    'employment law': 'Employment Law',
+    'employment': 'Employment Law',
+    'labor': 'Employment Law',
+    'workplace': 'Employment Law',
+    
+    # Estate & Probate
+    'estate & probate': 'Estate & Probate',
+    'estate': 'Estate & Probate',
+    'probate': 'Estate & Probate',
+    'trust': 'Estate & Probate',
+    'trust administration': 'Estate & Probate',
+    'will contest': 'Estate & Probate',
+    'inheritance': 'Estate & Probate',
+    
+    # Administrative Law
+    'administrative law': 'Administrative Law',
+    'administrative': 'Administrative Law',
+    'agency': 'Administrative Law',
+    
+    # Business & Commercial
+    'business & commercial': 'Business & Commercial',
+    'business': 'Business & Commercial',
+    'commercial': 'Business & Commercial',
+    
+    # Insurance Law
+    'insurance law': 'Insurance Law',
+    'insurance': 'Insurance Law',
+    
+    # ===== FAMILY LAW / DIVORCE CATEGORIES =====
+    'family law': 'Family Law',
+    'spousal support / maintenance': 'Spousal Support / Maintenance',
+    'spousal support': 'Spousal Support / Maintenance',
+    'maintenance': 'Spousal Support / Maintenance',
+    'alimony': 'Spousal Support / Maintenance',
+    
+    'child support': 'Child Support',
+    
+    'parenting plan / custody / visitation': 'Parenting Plan / Custody / Visitation',
+    'parenting plan': 'Parenting Plan / Custody / Visitation',
+    'custody': 'Parenting Plan / Custody / Visitation',
+    'visitation': 'Parenting Plan / Custody / Visitation',
+    'child custody': 'Parenting Plan / Custody / Visitation',
+    
+    'property division / debt allocation': 'Property Division / Debt Allocation',
+    'property division': 'Property Division / Debt Allocation',
+    'debt allocation': 'Property Division / Debt Allocation',
+    'asset division': 'Property Division / Debt Allocation',
+    
+    # ===== GENERAL CATEGORIES =====
+    'attorney fees & costs': 'Attorney Fees & Costs',
+    'attorney fees': 'Attorney Fees & Costs',
+    'legal fees': 'Attorney Fees & Costs',
+    
+    'procedural & evidentiary issues': 'Procedural & Evidentiary Issues',
+    'procedural': 'Procedural & Evidentiary Issues',
+    'evidentiary': 'Procedural & Evidentiary Issues',
+    
+    'jurisdiction & venue': 'Jurisdiction & Venue',
+    'jurisdiction': 'Jurisdiction & Venue',
+    'venue': 'Jurisdiction & Venue',
+    
+    'enforcement & contempt orders': 'Enforcement & Contempt Orders',
+    'enforcement': 'Enforcement & Contempt Orders',
+    'contempt': 'Enforcement & Contempt Orders',
+    
+    'modification orders': 'Modification Orders',
+    'modification': 'Modification Orders',
+    
+    'miscellaneous / unclassified': 'Miscellaneous / Unclassified',
+    'miscellaneous': 'Miscellaneous / Unclassified',
+    'other': 'Miscellaneous / Unclassified',
+    'unknown': 'Miscellaneous / Unclassified',
+    'general': 'Miscellaneous / Unclassified',
+}
+
+# Partial matching returns the first key (in mapping order) that occurs in the
+# category string or contains it. Both directions are answered with one scan:
+# - every key occurring in the string, via an overlapping alternation in mapping
+#   order (at each position the earliest key wins, so the min over positions is
+#   the earliest key overall)
+# - the first key containing the string, via find() on the keys joined in order
+_ISSUE_CATEGORY_KEYS = tuple(_ISSUE_CATEGORY_MAPPING)
+_ISSUE_CATEGORY_RANK = {key: i for i, key in enumerate(_ISSUE_CATEGORY_KEYS)}
+_ISSUE_CATEGORY_KEY_RE = re.compile('(?=(' + '|'.join(map(re.escape, _ISSUE_CATEGORY_KEYS)) + '))')
+_ISSUE_CATEGORY_KEYS_JOINED = '\n'.join(_ISSUE_CATEGORY_KEYS)
+_ISSUE_CATEGORY_KEY_OFFSETS = tuple(itertools.accumulate((len(k) + 1 for k in _ISSUE_CATEGORY_KEYS[:-1]), initial=0))
+
+
+# Enum values that already normalize to themselves - returned without a lookup
+_CANONICAL_CATEGORIES = frozenset(
+    value for value in _ISSUE_CATEGORY_MAPPING.values() if _ISSUE_CATEGORY_MAPPING.get(value.lower()) == value
+)
+
+
 def _normalize_issue_category(category_value: Any) -> str:
     """Normalize issue category value to match IssueCategory enum."""
     if not category_value:
         return "Miscellaneous / Unclassified"
+    if isinstance(category_value, str) and category_value in _CANONICAL_CATEGORIES:
+        return category_value
     
-    cat_str = str(category_value).strip().lower()
-    
-    # Map common variations to proper enum values - now includes UNIVERSAL categories
-    category_mapping = {
-        # ===== UNIVERSAL CATEGORIES (Non-Divorce) =====
-        # Criminal Law
-        'criminal law & procedure': 'Criminal Law & Procedure',
-        'criminal law': 'Criminal Law & Procedure',
-        'criminal': 'Criminal Law & Procedure',
-        'criminal procedure': 'Criminal Law & Procedure',
-        'search & seizure': 'Criminal Law & Procedure',
-        'fourth amendment': 'Criminal Law & Procedure',
-        'sentencing': 'Criminal Law & Procedure',
-        'firearm possession': 'Criminal Law & Procedure',
-        'unlawful possession': 'Criminal Law & Procedure',
-        
-        # Constitutional Law
-        'constitutional law': 'Constitutional Law',
-        'constitutional': 'Constitutional Law',
-        'due process': 'Constitutional Law',
-        'equal protection': 'Constitutional Law',
-        'first amendment': 'Constitutional Law',
-        'civil rights': 'Constitutional Law',
-        
-        # Civil Procedure
-        'civil procedure': 'Civil Procedure',
-        'summary judgment': 'Civil Procedure',
-        'motion to dismiss': 'Civil Procedure',
-        'statute of limitations': 'Civil Procedure',
-        'standing': 'Civil Procedure',
-        
-        # Evidence
-        'evidence': 'Evidence',
-        'hearsay': 'Evidence',
-        'expert testimony': 'Evidence',
-        'sufficiency of evidence': 'Evidence',
-        'insufficient evidence': 'Evidence',
-        
-        # Contracts
-        'contracts': 'Contracts',
-        'contract': 'Contracts',
-        'breach of contract': 'Contracts',
-        
-        # Torts / Personal Injury
-        'torts / personal injury': 'Torts / Personal Injury',
-        'torts': 'Torts / Personal Injury',
-        'tort': 'Torts / Personal Injury',
-        'personal injury': 'Torts / Personal Injury',
-        'negligence': 'Torts / Personal Injury',
-        'civil liability': 'Torts / Personal Injury',
-        'title ix': 'Torts / Personal Injury',
-        
-        # Property Law
-        'property law': 'Property Law',
-        'property': 'Property Law',
-        'real property': 'Property Law',
-        
-        # Employment Law
-        'employment law': 'Employment Law',
-        'employment': 'Employment Law',
-        'labor': 'Employment Law',
-        'workplace': 'Employment Law',
-        
-        # Estate & Probate
-        'estate & probate': 'Estate & Probate',
-        'estate': 'Estate & Probate',
-        'probate': 'Estate & Probate',
-        'trust': 'Estate & Probate',
-        'trust administration': 'Estate & Probate',
-        'will contest': 'Estate & Probate',
-        'inheritance': 'Estate & Probate',
-        
-        # Administrative Law
-        'administrative law': 'Administrative Law',
-        'administrative': 'Administrative Law',
-        'agency': 'Administrative Law',
-        
-        # Business & Commercial
-        'business & commercial': 'Business & Commercial',
-        'business': 'Business & Commercial',
-        'commercial': 'Business & Commercial',
-        
-        # Insurance Law
-        'insurance law': 'Insurance Law',
-        'insurance': 'Insurance Law',
-        
-        # ===== FAMILY LAW / DIVORCE CATEGORIES =====
-        'family law': 'Family Law',
-        'spousal support / maintenance': 'Spousal Support / Maintenance',
-        'spousal support': 'Spousal Support / Maintenance',
-        'maintenance': 'Spousal Support / Maintenance',
-        'alimony': 'Spousal Support / Maintenance',
-        
-        'child support': 'Child Support',
-        
-        'parenting plan / custody / visitation': 'Parenting Plan / Custody / Visitation',
-        'parenting plan': 'Parenting Plan / Custody / Visitation',
-        'custody': 'Parenting Plan / Custody / Visitation',
-        'visitation': 'Parenting Plan / Custody / Visitation',
-        'child custody': 'Parenting Plan / Custody / Visitation',
-        
-        'property division / debt allocation': 'Property Division / Debt Allocation',
-        'property division': 'Property Division / Debt Allocation',
-        'debt allocation': 'Property Division / Debt Allocation',
-        'asset division': 'Property Division / Debt Allocation',
-        
-        # ===== GENERAL CATEGORIES =====
-        'attorney fees & costs': 'Attorney Fees & Costs',
-        'attorney fees': 'Attorney Fees & Costs',
-        'legal fees': 'Attorney Fees & Costs',
-        
-        'procedural & evidentiary issues': 'Procedural & Evidentiary Issues',
-        'procedural': 'Procedural & Evidentiary Issues',
-        'evidentiary': 'Procedural & Evidentiary Issues',
-        
-        'jurisdiction & venue': 'Jurisdiction & Venue',
-        'jurisdiction': 'Jurisdiction & Venue',
-        'venue': 'Jurisdiction & Venue',
-        
-        'enforcement & contempt orders': 'Enforcement & Contempt Orders',
-        'enforcement': 'Enforcement & Contempt Orders',
-        'contempt': 'Enforcement & Contempt Orders',
-        
-        'modification orders': 'Modification Orders',
-        'modification': 'Modification Orders',
-        
-        'miscellaneous / unclassified': 'Miscellaneous / Unclassified',
-        'miscellaneous': 'Miscellaneous / Unclassified',
-        'other': 'Miscellaneous / Unclassified',
-        'unknown': 'Miscellaneous / Unclassified',
-        'general': 'Miscellaneous / Unclassified',
-    }
-    
+    return _normalize_issue_category_str(str(category_value).strip().lower())
+
+
+@lru_cache(maxsize=1024)
+def _normalize_issue_category_str(cat_str: str) -> str:
+    """Map a stripped, lowercased category string; cached since AI output reuses categories heavily."""
     # Check for exact match first
-    if cat_str in category_mapping:
-        return category_mapping[cat_str]
+    value = _ISSUE_CATEGORY_MAPPING.get(cat_str)
+    if value is not None:
+        return value
     
     # Check for partial matches
-    for key, value in category_mapping.items():
-        if key in cat_str or cat_str in key:
-            return value
+    best = len(_ISSUE_CATEGORY_KEYS)
+    for match in _ISSUE_CATEGORY_KEY_RE.finditer(cat_str):
+        best = min(best, _ISSUE_CATEGORY_RANK[match.group(1)])
+    if '\n' not in cat_str:
+        pos = _ISSUE_CATEGORY_KEYS_JOINED.find(cat_str)
+        if pos != -1:
+            best = min(best, bisect.bisect_right(_ISSUE_CATEGORY_KEY_OFFSETS, pos) - 1)
+    if best < len(_ISSUE_CATEGORY_KEYS):
+        return _ISSUE_CATEGORY_MAPPING[_ISSUE_CATEGORY_KEYS[best]]
     
     # Default to miscellaneous
     return 'Miscellaneous / Unclassified'
@@ -842,58 +1253,62 @@ def _transform_issues(raw_issues: list) -> list:
     return issues_decisions
 
 
+# Map common district variations (keys are uppercased)
+_DISTRICT_MAPPING = {
+    'DIVISION I': 'Division I',
+    'DIVISION 1': 'Division I',
+    'DIV I': 'Division I',
+    'DIV. I': 'Division I',
+    'I': 'Division I',
+    'DIVISION II': 'Division II',
+    'DIVISION 2': 'Division II',
+    'DIV II': 'Division II',
+    'DIV. II': 'Division II',
+    'II': 'Division II',
+    'DIVISION III': 'Division III',
+    'DIVISION 3': 'Division III',
+    'DIV III': 'Division III',
+    'DIV. III': 'Division III',
+    'III': 'Division III',
+    'N/A': 'N/A',
+    'NA': 'N/A',
+    'NONE': 'N/A',
+    '': 'N/A',
+}
+
+# Canonical enum values - returned as-is without normalizing
+_DISTRICT_VALUES = frozenset({'Division I', 'Division II', 'Division III', 'N/A'})
+_COURT_LEVEL_VALUES = frozenset({'Supreme', 'Appeals'})
+_PUBLISHED_VALUES = frozenset({'Published', 'Unpublished', 'Partially Published'})
+
+
 def _normalize_district(district_value: Any) -> str:
     """Normalize district value to match District enum."""
     if not district_value:
         return "N/A"
+    if isinstance(district_value, str) and district_value in _DISTRICT_VALUES:
+        return district_value
     
-    district_str = str(district_value).strip().upper()
-    
-    # Map common variations
-    district_mapping = {
-        'DIVISION I': 'Division I',
-        'DIVISION 1': 'Division I',
-        'DIV I': 'Division I',
-        'DIV. I': 'Division I',
-        'I': 'Division I',
-        'DIVISION II': 'Division II',
-        'DIVISION 2': 'Division II',
-        'DIV II': 'Division II',
-        'DIV. II': 'Division II',
-        'II': 'Division II',
-        'DIVISION III': 'Division III',
-        'DIVISION 3': 'Division III',
-        'DIV III': 'Division III',
-        'DIV. III': 'Division III',
-        'III': 'Division III',
-        'N/A': 'N/A',
-        'NA': 'N/A',
-        'NONE': 'N/A',
-        '': 'N/A',
-    }
-    
-    return district_mapping.get(district_str, 'N/A')
+    return _DISTRICT_MAPPING.get(str(district_value).strip().upper(), 'N/A')
 
 
 def _normalize_court_level(court_level_value: Any) -> str:
     """Normalize court level value to match CourtLevel enum."""
     if not court_level_value:
         return "Appeals"  # Default
+    if isinstance(court_level_value, str) and court_level_value in _COURT_LEVEL_VALUES:
+        return court_level_value
     
-    level_str = str(court_level_value).strip().lower()
-    
-    if 'supreme' in level_str:
-        return "Supreme"
-    elif 'appeal' in level_str:
-        return "Appeals"
-    else:
-        return "Appeals"  # Default
+    # Anything that isn't the Supreme Court (including unrecognized values) is Appeals
+    return "Supreme" if 'supreme' in str(court_level_value).lower() else "Appeals"
 
 
 def _normalize_published(published_value: Any) -> str:
     """Normalize published status to match PublicationStatus enum."""
     if not published_value:
         return "Published"  # Default
+    if isinstance(published_value, str) and published_value in _PUBLISHED_VALUES:
+        return published_value
     
     pub_str = str(published_value).strip().lower()
     
@@ -905,40 +1320,50 @@ def _normalize_published(published_value: Any) -> str:
         return "Published"
 
 
+# Personal role keywords, found in one overlapping scan and then resolved in
+# priority order (so "wife of husband" is still Husband, as before)
+_PERSONAL_ROLE_WORD_RE = re.compile(
+    r'(?=(husband|wife|parent|child|estate|corporation|company|business'
+    r'|government|state|individual|person|other|unknown))'
+)
+_PERSONAL_ROLE_KEYWORDS = frozenset({
+    'husband', 'wife', 'parent', 'child', 'estate', 'corporation', 'government', 'individual', 'other', 'unknown',
+})
+_PERSONAL_ROLE_PRIORITY = (
+    ('husband', 'Husband'),
+    ('wife', 'Wife'),
+    ('parent', 'Parent'),
+    ('child', 'Child'),
+    ('estate', 'Estate'),
+    ('corporation', 'Corporation'),
+    ('company', 'Corporation'),
+    ('business', 'Corporation'),
+    ('government', 'Government'),
+    ('state', 'Government'),
+    ('individual', 'Individual'),
+    ('person', 'Individual'),
+    ('other', 'Other'),
+)
+
+
 def _normalize_personal_role(role_value: Any) -> Optional[str]:
     """Normalize personal role to match PersonalRole enum. Returns None if not determinable."""
     if not role_value or role_value is None:
         return None
     
     role_str = str(role_value).strip().lower()
+    role_words = set(_PERSONAL_ROLE_WORD_RE.findall(role_str))
     
     # Check if this is actually a role or if the AI put a name here
-    role_keywords = ['husband', 'wife', 'parent', 'child', 'estate', 'corporation', 'government', 'individual', 'other', 'unknown']
-    if not any(kw in role_str for kw in role_keywords):
+    if role_words.isdisjoint(_PERSONAL_ROLE_KEYWORDS):
         # Likely a name, not a role - return None
         return None
     
     # Map to enum values - now includes universal roles
-    if 'husband' in role_str:
-        return 'Husband'
-    elif 'wife' in role_str:
-        return 'Wife'
-    elif 'parent' in role_str:
-        return 'Parent'
-    elif 'child' in role_str:
-        return 'Child'
-    elif 'estate' in role_str:
-        return 'Estate'
-    elif 'corporation' in role_str or 'company' in role_str or 'business' in role_str:
-        return 'Corporation'
-    elif 'government' in role_str or 'state' in role_str:
-        return 'Government'
-    elif 'individual' in role_str or 'person' in role_str:
-        return 'Individual'
-    elif 'other' in role_str:
-        return 'Other'
-    else:
-        return None  # Let the validator handle it
+    for word, role in _PERSONAL_ROLE_PRIORITY:
+        if word in role_words:
+            return role
+    return None  # Let the validator handle it
 
 
 def _normalize_trial_judge(trial_judge_value: Any) -> Optional[str]:
@@ -949,13 +1374,42 @@ def _normalize_trial_judge(trial_judge_value: Any) -> Optional[str]:
     if isinstance(trial_judge_value, list):
         # Take the first non-empty judge name
         for j in trial_judge_value:
-            if j and str(j).strip():
-                return str(j).strip()
+            name = str(j).strip() if j else None
+            if name:
+                return name
         return None
     
     return str(trial_judge_value).strip() if trial_judge_value else None
 
 
+# Field resolver tables for flat Ollama output: (output_key, candidate_keys, default).
+# _pick mirrors `d.get(k1) or d.get(k2) or d.get(kN, default)`.
+_ATTORNEY_FIELDS = (
+    ('name', ('name', 'attorney_name'), 'Unknown'),
+    ('firm_name', ('firm_name', 'firm'), None),
+    ('firm_address', ('firm_address', 'address'), None),
+    ('representing', ('representing', 'representation', 'role'), 'Unknown'),
+    ('attorney_type', ('attorney_type',), 'Attorney'),
+)
+_PARTY_NAME_KEYS = ('name', 'party_name')
+_PARTY_LEGAL_ROLE_KEYS = ('legal_role', 'role')
+_ARGUMENT_SIDE_KEYS = ('side', 'arguing_party', 'party')
+_ARGUMENT_TEXT_KEYS = ('argument_text', 'text', 'argument')
+_PRECEDENT_CASE_KEYS = ('precedent_case', 'case_name', 'name')
+_PRECEDENT_CITATION_KEYS = ('citation', 'cite')
+_PRECEDENT_RELATIONSHIP_KEYS = ('relationship', 'treatment')
+_PRECEDENT_CITATION_TEXT_KEYS = ('citation_text', 'relevance', 'description')
+
+
+def _pick(d: Dict[str, Any], keys: Tuple[str, ...], default: Any) -> Any:
+    """First truthy value among keys; the last key falls back to default only when missing"""
+    for k in keys[:-1]:
+        v = d.get(k)
+        if v:
+            return v
+    return d.get(keys[-1], default)
+
+
 def _transform_ollama_response(raw_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Transform raw Ollama JSON response to match our Pydantic schema.
@@ -1006,7 +1460,7 @@ def _transform_ollama_response(raw_data: Dict[str, Any]) -> Dict[str, Any]:
         if 'precedents' in raw_data and isinstance(raw_data['precedents'], list):
             raw_data['precedents'] = [
                 p for p in raw_data['precedents']
-                if isinstance(p, dict) and p.get('precedent_case', '').strip()
+                if isinstance(p, dict) and (case_name := p.get('precedent_case')) and not case_name.isspace()
             ]
         
         return raw_data
@@ -1046,56 +1500,39 @@ def _transform_ollama_response(raw_data: Dict[str, Any]) -> Dict[str, Any]:
         if isinstance(j, str):
             appeals_judges.append({'judge_name': j, 'role': 'Authored by'})
         elif isinstance(j, dict):
-            judge_obj = {
-                'judge_name': j.get('judge_name') or j.get('name') or str(j),
-                'role': j.get('role', 'Authored by')
-            }
-            appeals_judges.append(judge_obj)
+            name = j.get('judge_name') or j.get('name')
+            if not name:
+                logger.debug("[Ollama] Skipping judge record without a name: %r", j)
+                continue
+            appeals_judges.append({'judge_name': name, 'role': j.get('role', 'Authored by')})
     
     # Transform attorneys - map field names
-    attorneys = []
-    raw_attorneys = raw_data.get('attorneys', [])
-    for a in raw_attorneys:
-        if isinstance(a, dict):
-            attorney_obj = {
-                'name': a.get('name') or a.get('attorney_name', 'Unknown'),
-                'firm_name': a.get('firm_name') or a.get('firm'),
-                'firm_address': a.get('firm_address') or a.get('address'),
-                'representing': a.get('representing') or a.get('representation') or a.get('role', 'Unknown'),
-                'attorney_type': a.get('attorney_type', 'Attorney')
-            }
-            attorneys.append(attorney_obj)
+    attorneys = [
+        {out: _pick(a, keys, default) for out, keys, default in _ATTORNEY_FIELDS}
+        for a in raw_data.get('attorneys', []) if isinstance(a, dict)
+    ]
     
     # Transform parties
-    parties = []
-    raw_parties = raw_data.get('parties', [])
-    for p in raw_parties:
-        if isinstance(p, dict):
-            party_obj = {
-                'name': p.get('name') or p.get('party_name', 'Unknown'),
-                'legal_role': p.get('legal_role') or p.get('role', 'Unknown'),
-                'personal_role': _normalize_personal_role(p.get('personal_role'))
-            }
-            parties.append(party_obj)
+    parties = [
+        {
+            'name': _pick(p, _PARTY_NAME_KEYS, 'Unknown'),
+            'legal_role': _pick(p, _PARTY_LEGAL_ROLE_KEYS, 'Unknown'),
+            'personal_role': _normalize_personal_role(p.get('personal_role')),
+        }
+        for p in raw_data.get('parties', []) if isinstance(p, dict)
+    ]
     
     # Transform issues_decisions using dedicated function
     raw_issues = raw_data.get('issues_decisions', []) or raw_data.get('CATEGORIZED ISSUES WITH DECISIONS', []) or raw_data.get('issues', [])
     issues_decisions = _transform_issues(raw_issues)
     
     # Transform arguments - must match ArgumentModel(side, argument_text)
-    arguments = []
-    raw_arguments = raw_data.get('arguments', [])
-    for a in raw_arguments:
-        if isinstance(a, dict):
-            # Map to ArgumentModel fields
-            side = a.get('side') or a.get('arguing_party') or a.get('party', 'Court')
-            arg_text = a.get('argument_text') or a.get('text') or a.get('argument', '')
-            if arg_text:  # Only add if we have text
-                arg_obj = {
-                    'side': side,
-                    'argument_text': arg_text
-                }
-                arguments.append(arg_obj)
+    # Only arguments that have text are kept
+    arguments = [
+        {'side': _pick(a, _ARGUMENT_SIDE_KEYS, 'Court'), 'argument_text': arg_text}
+        for a in raw_data.get('arguments', [])
+        if isinstance(a, dict) and (arg_text := _pick(a, _ARGUMENT_TEXT_KEYS, ''))
+    ]
     
     # Transform precedents - must match PrecedentModel(precedent_case, citation, relationship)
     # Filter out empty precedents that would fail validation
@@ -1103,18 +1540,18 @@ def _transform_ollama_response(raw_data: Dict[str, Any]) -> Dict[str, Any]:
     raw_precedents = raw_data.get('precedents', []) or raw_data.get('citations', [])
     for p in raw_precedents:
         if isinstance(p, dict):
-            case_name = p.get('precedent_case') or p.get('case_name') or p.get('name', '')
+            case_name = _pick(p, _PRECEDENT_CASE_KEYS, '')
             # Skip empty precedents
-            if not case_name or case_name.strip() == '':
+            if not case_name or case_name.isspace():
                 continue
             prec_obj = {
                 'precedent_case': case_name,
-                'citation': p.get('citation') or p.get('cite', case_name),
-                'relationship': p.get('relationship') or p.get('treatment', 'cited'),
-                'citation_text': p.get('citation_text') or p.get('relevance') or p.get('description')
+                'citation': _pick(p, _PRECEDENT_CITATION_KEYS, case_name),
+                'relationship': _pick(p, _PRECEDENT_RELATIONSHIP_KEYS, 'cited'),
+                'citation_text': _pick(p, _PRECEDENT_CITATION_TEXT_KEYS, None)
             }
             precedents.append(prec_obj)
-        elif isinstance(p, str) and p.strip():
+        elif isinstance(p, str) and p and not p.isspace():
             precedents.append({
                 'precedent_case': p, 
                 'citation': p, 
@@ -1122,7 +1559,7 @@ def _transform_ollama_response(raw_data: Dict[str, Any]) -> Dict[str, Any]:
             })
     
     # Build final structure
-    transformed = {
+    return {
         'case': case_obj,
         'appeals_judges': appeals_judges,
         'attorneys': attorneys,
@@ -1131,8 +1568,22 @@ def _transform_ollama_response(raw_data: Dict[str, Any]) -> Dict[str, Any]:
         'arguments': arguments,
         'precedents': precedents
     }
-    
-    return transformed
+
+
+# Party names the LLM invents when it can't find the real ones (casefolded)
+_PLACEHOLDER_NAMES = frozenset({'john doe', 'jane doe', 'john smith', 'jane smith', 'unknown', 'n/a'})
+
+
+# Case fields taken from regex pre-extraction when present, in override order:
+# (field, value that does not count as found)
+_REGEX_OVERRIDE_FIELDS = (
+    ('court_level', None),
+    ('district', 'N/A'),
+    ('published', None),
+    ('case_file_id', None),
+    ('case_type', None),
+    ('county', None),
+)
 
 
 def _apply_regex_overrides(transformed_data: Dict[str, Any], regex_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -1145,35 +1596,14 @@ def _apply_regex_overrides(transformed_data: Dict[str, Any], regex_data: Dict[st
     
     case_obj = transformed_data['case']
     
-    # Override court_level - regex is very reliable for this
-    if regex_data.get('court_level'):
-        case_obj['court_level'] = regex_data['court_level']
-        logger.info(f"[Regex Override] court_level = {regex_data['court_level']}")
-    
-    # Override district - regex is reliable
-    if regex_data.get('district') and regex_data['district'] != 'N/A':
-        case_obj['district'] = regex_data['district']
-        logger.info(f"[Regex Override] district = {regex_data['district']}")
-    
-    # Override publication status - regex is reliable  
-    if regex_data.get('published'):
-        case_obj['published'] = regex_data['published']
-        logger.info(f"[Regex Override] published = {regex_data['published']}")
-    
-    # Override case_file_id if found by regex
-    if regex_data.get('case_file_id'):
-        case_obj['case_file_id'] = regex_data['case_file_id']
-        logger.info(f"[Regex Override] case_file_id = {regex_data['case_file_id']}")
-    
-    # Override case_type - regex is more reliable than AI for this
-    if regex_data.get('case_type'):
-        case_obj['case_type'] = regex_data['case_type']
-        logger.info(f"[Regex Override] case_type = {regex_data['case_type']}")
-    
-    # Override county if found
-    if regex_data.get('county'):
-        case_obj['county'] = regex_data['county']
-        logger.info(f"[Regex Override] county = {regex_data['county']}")
+    # Override structured fields where regex is more reliable than the AI
+    log_overrides = logger.isEnabledFor(logging.INFO)
+    for key, ignored in _REGEX_OVERRIDE_FIELDS:
+        value = regex_data.get(key)
+        if value and value != ignored:
+            case_obj[key] = value
+            if log_overrides:
+                logger.info("[Regex Override] %s = %s", key, value)
     
     # Set court based on court_level and district
     court_level = case_obj.get('court_level', 'Appeals')
@@ -1191,14 +1621,13 @@ def _apply_regex_overrides(transformed_data: Dict[str, Any], regex_data: Dict[st
     ai_parties = transformed_data.get('parties', [])
     
     # Check for placeholder names in AI parties
-    placeholder_names = ['john doe', 'jane doe', 'john smith', 'jane smith', 'unknown', 'n/a']
     has_placeholder = any(
-        isinstance(p, dict) and p.get('name', '').lower() in placeholder_names
+        isinstance(p, dict) and (name := p.get('name')) and name.casefold() in _PLACEHOLDER_NAMES
         for p in ai_parties
     )
     
     if regex_parties and (not ai_parties or has_placeholder):
-        logger.info(f"[Regex Override] Using regex-extracted parties (AI had placeholders)")
+        logger.info("[Regex Override] Using regex-extracted parties (AI had placeholders)")
         transformed_data['parties'] = [
             {
                 'name': name,
@@ -1214,7 +1643,7 @@ def _apply_regex_overrides(transformed_data: Dict[str, Any], regex_data: Dict[st
     ai_judges = transformed_data.get('appeals_judges', [])
     
     if regex_judges and not ai_judges:
-        logger.info(f"[Regex Override] Using regex-extracted judges (AI returned none)")
+        logger.info("[Regex Override] Using regex-extracted judges (AI returned none)")
         transformed_data['appeals_judges'] = [
             {
                 'judge_name': name,
@@ -1224,10 +1653,10 @@ def _apply_regex_overrides(transformed_data: Dict[str, Any], regex_data: Dict[st
         ]
     elif regex_judges and ai_judges:
         # Supplement AI judges with regex judges (merge unique names)
-        ai_judge_names = {j.get('judge_name', '').lower() for j in ai_judges}
+        ai_judge_names = {j['judge_name'].casefold() for j in ai_judges if j.get('judge_name')}
         for name, role in regex_judges:
-            if name.lower() not in ai_judge_names:
-                logger.info(f"[Regex Supplement] Adding judge: {name} ({role})")
+            if name.casefold() not in ai_judge_names:
+                logger.info("[Regex Supplement] Adding judge: %s (%s)", name, role)
                 transformed_data['appeals_judges'].append({
                     'judge_name': name,
                     'role': role
@@ -1237,57 +1666,141 @@ def _apply_regex_overrides(transformed_data: Dict[str, Any], regex_data: Dict[st
     return transformed_data
 
 
+# Cached validator for LegalCaseExtraction, built once at import
+_EXTRACTION_ADAPTER = TypeAdapter(LegalCaseExtraction)
+
+
 def _log_extraction_result(result: LegalCaseExtraction, source: str, duration: float):
-    """Log detailed extraction results"""
+    """Log detailed extraction results (as one record, built only when INFO is enabled)"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     try:
-        logger.info(f"{'='*60}")
-        logger.info(f"[AI] {source} EXTRACTION SUCCESSFUL")
-        logger.info(f"{'='*60}")
-        logger.info(f"[AI] Duration: {duration:.2f} seconds")
-        logger.info(f"[AI] Extracted Data Summary:")
-        logger.info(f"   - Case Title: {result.case.title[:50]}..." if result.case.title else "   - Case Title: None")
-        logger.info(f"   - County: {result.case.county}")
-        logger.info(f"   - Appeal Outcome: {result.case.appeal_outcome}")
-        logger.info(f"   - Overall Outcome: {result.case.overall_case_outcome}")
-        logger.info(f"   - Appeals Judges: {len(result.appeals_judges)}")
-        for j in result.appeals_judges:
-            logger.info(f"      - {j.judge_name} ({j.role.value if hasattr(j.role, 'value') else j.role})")
-        logger.info(f"   - Attorneys: {len(result.attorneys)}")
-        for a in result.attorneys:
-            # AttorneyModel uses 'name' not 'attorney_name'
-            logger.info(f"      - {a.name} (representing: {a.representing})")
-        logger.info(f"   - Parties: {len(result.parties)}")
-        for p in result.parties:
-            # PartyModel uses 'name' not 'party_name'
-            role_str = p.legal_role.value if hasattr(p.legal_role, 'value') else str(p.legal_role)
-            logger.info(f"      - {p.name} ({role_str})")
-        logger.info(f"   - Issues/Decisions: {len(result.issues_decisions)}")
-        for i in result.issues_decisions:
-            # IssueDecisionModel uses 'category' not 'issue_category'
-            category_str = i.category.value if hasattr(i.category, 'value') else str(i.category)
-            logger.info(f"      - {category_str}: {i.appeal_outcome}")
-        logger.info(f"   - Arguments: {len(result.arguments)}")
-        logger.info(f"   - Precedents: {len(result.precedents)}")
-        logger.info(f"{'='*60}")
+        rule = '=' * 60
+        lines = [
+            rule,
+            f"[AI] {source} EXTRACTION SUCCESSFUL",
+            rule,
+            f"[AI] Duration: {duration:.2f} seconds",
+            "[AI] Extracted Data Summary:",
+            f"   - Case Title: {result.case.title[:50]}..." if result.case.title else "   - Case Title: None",
+            f"   - County: {result.case.county}",
+            f"   - Appeal Outcome: {result.case.appeal_outcome}",
+            f"   - Overall Outcome: {result.case.overall_case_outcome}",
+            f"   - Appeals Judges: {len(result.appeals_judges)}",
+        ]
+        lines.extend(
+            f"      - {j.judge_name} ({j.role.value if hasattr(j.role, 'value') else j.role})"
+            for j in result.appeals_judges
+        )
+        lines.append(f"   - Attorneys: {len(result.attorneys)}")
+        # AttorneyModel uses 'name' not 'attorney_name'
+        lines.extend(f"      - {a.name} (representing: {a.representing})" for a in result.attorneys)
+        lines.append(f"   - Parties: {len(result.parties)}")
+        # PartyModel uses 'name' not 'party_name'
+        lines.extend(
+            f"      - {p.name} ({p.legal_role.value if hasattr(p.legal_role, 'value') else str(p.legal_role)})"
+            for p in result.parties
+        )
+        lines.append(f"   - Issues/Decisions: {len(result.issues_decisions)}")
+        # IssueDecisionModel uses 'category' not 'issue_category'
+        lines.extend(
+            f"      - {i.category.value if hasattr(i.category, 'value') else str(i.category)}: {i.appeal_outcome}"
+            for i in result.issues_decisions
+        )
+        lines.append(f"   - Arguments: {len(result.arguments)}")
+        lines.append(f"   - Precedents: {len(result.precedents)}")
+        lines.append(rule)
+        logger.info("\n".join(lines))
     except Exception as e:
         logger.error(f"[AI] Error logging extraction result: {e}")
-        logger.debug(f"[AI] Traceback: {traceback.format_exc()}")
+        logger.debug("[AI] Traceback:", exc_info=True)
 
 
-def extract_case_with_openai(case_text: str, case_info: Dict[str, Any]) -> Optional[LegalCaseExtraction]:
-    """Extract case data using OpenAI API"""
-    start_time = time.time()
-    model = os.getenv("OPENAI_MODEL", "gpt-4")
-    
-    logger.info(f"[OpenAI] Starting extraction with model: {model}")
-    logger.info(f"[OpenAI] Case info: {json.dumps(case_info, indent=2)}")
-    logger.info(f"[OpenAI] Text length: {len(case_text)} characters")
-    
+# ============================================================================
+# CONTEXT WINDOW GUARDS
+# ============================================================================
+
+# Rough token estimate without a tokenizer (English prose averages ~4 chars/token)
+_CHARS_PER_TOKEN = 4
+
+# Tokens reserved for the structured JSON answer
+_RESPONSE_TOKEN_BUDGET = 4096
+
+# OpenAI context windows (tokens) for known model families. A model matches the
+# longest entry it equals or extends with '-' (dated snapshots, -mini, ...), so
+# e.g. gpt-4.5-preview never falls into the 8k gpt-4 entry
+_OPENAI_CONTEXT_TOKENS = {
+    "gpt-4.1": 1047576,
+    "gpt-4.5-preview": 128000,
+    "gpt-4o": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4-1106-preview": 128000,
+    "gpt-4-0125-preview": 128000,
+    "gpt-4-32k": 32768,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+}
+
+
+def _openai_context_limit(model: str) -> Optional[int]:
+    """Context window of model from _OPENAI_CONTEXT_TOKENS, or None when unknown."""
+    matches = [family for family in _OPENAI_CONTEXT_TOKENS if model == family or model.startswith(family + "-")]
+    return _OPENAI_CONTEXT_TOKENS[max(matches, key=len)] if matches else None
+
+
+def _estimate_tokens(*texts: str) -> int:
+    return sum(len(t) for t in texts) // _CHARS_PER_TOKEN + 1
+
+
+def _fits_openai_context(model: str, case_text: str, case_info: Dict[str, Any]) -> bool:
+    """
+    False (with a warning) when the prompt for this case clearly exceeds the
+    model's context window, so the request is skipped instead of being
+    rejected after a full round trip. Unknown models are always allowed.
+    """
+    limit = _openai_context_limit(model)
+    if limit is None:
+        return True
+    estimated = _estimate_tokens(SYSTEM_PROMPT, HUMAN_TEMPLATE, case_text, str(case_info)) + _RESPONSE_TOKEN_BUDGET
+    if estimated <= limit:
+        return True
+    logger.warning(f"[OpenAI] Prompt for {case_info.get('case_number', 'Unknown')} is ~{estimated} tokens, "
+                   f"over {model}'s {limit}-token context window; skipping OpenAI")
+    return False
+
+
+def _ollama_chat_options(messages: List[Dict[str, str]]) -> Dict[str, Any]:
+    """
+    Chat options for native Ollama requests. When OLLAMA_NUM_CTX is set it is
+    passed as num_ctx (Ollama's own default window is small and silently
+    truncates long opinions), with a warning if the prompt still won't fit.
+    """
+    options: Dict[str, Any] = {"temperature": 0.0}
+    num_ctx = os.getenv("OLLAMA_NUM_CTX")
+    if num_ctx:
+        options["num_ctx"] = int(num_ctx)
+        estimated = _estimate_tokens(*(m["content"] for m in messages)) + _RESPONSE_TOKEN_BUDGET
+        if estimated > options["num_ctx"]:
+            logger.warning(f"[Ollama] Prompt is ~{estimated} tokens, over OLLAMA_NUM_CTX={num_ctx}; "
+                           f"the server will truncate the input")
+    return options
+
+
+def extract_case_with_openai(case_text: str, case_info: Dict[str, Any]) -> Optional[LegalCaseExtraction]:
+    """Extract case data using OpenAI API"""
+    start_time = time.time()
+    model = os.getenv("OPENAI_MODEL", "gpt-4")
+    
+    logger.info(f"[OpenAI] Starting extraction with model: {model}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("[OpenAI] Case info: %s", orjson.dumps(case_info, option=orjson.OPT_INDENT_2, default=str).decode())
+    logger.info("[OpenAI] Text length: %d characters", len(case_text))
+    
+    if not _fits_openai_context(model, case_text, case_info):
+        return None
+    
     try:
-        llm = ChatOpenAI(model=model, temperature=0)
-        structured_llm = llm.with_structured_output(LegalCaseExtraction, method="json_schema")
-        prompt = _build_prompt()
-        chain = prompt | structured_llm
+        chain = _get_openai_chain(model)
         
         logger.info("[OpenAI] Sending request to OpenAI API...")
         result = chain.invoke({"case_info": case_info, "case_text": case_text})
@@ -1297,7 +1810,7 @@ def extract_case_with_openai(case_text: str, case_info: Dict[str, Any]) -> Optio
             _log_extraction_result(result, "OpenAI", duration)
             return result
         
-        validated = LegalCaseExtraction.model_validate(result)
+        validated = _EXTRACTION_ADAPTER.validate_python(result)
         duration = time.time() - start_time
         _log_extraction_result(validated, "OpenAI", duration)
         return validated
@@ -1307,102 +1820,539 @@ def extract_case_with_openai(case_text: str, case_info: Dict[str, Any]) -> Optio
         logger.error(f"❌ OpenAI extraction failed after {duration:.2f}s")
         logger.error(f"❌ Error type: {type(e).__name__}")
         logger.error(f"❌ Error message: {str(e)}")
-        logger.debug(f"❌ Full traceback:\n{traceback.format_exc()}")
+        logger.debug("❌ Full traceback:", exc_info=True)
         return None
 
 
-def extract_case_with_ollama(case_text: str, case_info: Dict[str, Any]) -> Optional[LegalCaseExtraction]:
-    """Extract case data using Ollama (local or remote) with regex hybrid approach"""
+async def extract_cases_batch_with_openai(
+    cases: List[Tuple[str, Dict[str, Any]]],
+    max_concurrency: int = 8,
+) -> List[Optional[LegalCaseExtraction]]:
+    """
+    Extract many cases with OpenAI concurrently via the chain's abatch().
+    
+    Args:
+        cases: List of (case_text, case_info) tuples
+        max_concurrency: Maximum number of in-flight OpenAI requests
+        
+    Returns:
+        One result per input case, in input order (None where extraction failed)
+    """
+    if not cases:
+        return []
+    
+    start_time = time.time()
+    model = os.getenv("OPENAI_MODEL", "gpt-4")
+    logger.info(f"[OpenAI] Starting batch extraction of {len(cases)} cases with model: {model} "
+                f"(max_concurrency={max_concurrency})")
+    
+    chain = _get_async_openai_chain(model)
+    inputs = [{"case_info": case_info, "case_text": case_text} for case_text, case_info in cases]
+    raw_results = await chain.abatch(
+        inputs,
+        config={"max_concurrency": max_concurrency},
+        return_exceptions=True,
+    )
+    
+    results: List[Optional[LegalCaseExtraction]] = []
+    for (_, case_info), raw in zip(cases, raw_results):
+        case_number = case_info.get('case_number', 'Unknown')
+        if isinstance(raw, Exception):
+            logger.error(f"❌ [OpenAI] Batch extraction failed for {case_number}: {type(raw).__name__}: {raw}")
+            results.append(None)
+            continue
+        try:
+            results.append(raw if isinstance(raw, LegalCaseExtraction) else _EXTRACTION_ADAPTER.validate_python(raw))
+        except Exception as e:
+            logger.error(f"❌ [OpenAI] Batch result validation failed for {case_number}: {e}")
+            results.append(None)
+    
+    succeeded = sum(1 for r in results if r is not None)
+    logger.info(f"[OpenAI] Batch extraction complete: {succeeded}/{len(cases)} succeeded "
+                f"in {time.time() - start_time:.2f}s")
+    return results
+
+
+# ============================================================================
+# OPENAI BATCH API (non-interactive bulk extraction)
+# ============================================================================
+
+@lru_cache(maxsize=1)
+def _get_openai_client():
+    """Plain OpenAI SDK client, used for the Batch API (files + batches endpoints)."""
+    from openai import OpenAI
+    return OpenAI()
+
+
+def _openai_chat_body(model: str, case_text: str, case_info: Dict[str, Any]) -> Dict[str, Any]:
+    """/v1/chat/completions request body with LegalCaseExtraction structured output."""
+    return {
+        "model": model,
+        "temperature": 0,
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": _format_user_message(case_info, case_text)},
+        ],
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": {"name": "LegalCaseExtraction", "schema": _extraction_json_schema()},
+        },
+    }
+
+
+def _openai_batch_request(custom_id: str, model: str, case_text: str, case_info: Dict[str, Any]) -> Dict[str, Any]:
+    """One /v1/chat/completions request line for a Batch API input file."""
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": _openai_chat_body(model, case_text, case_info),
+    }
+
+
+def submit_openai_batch(cases: List[Tuple[str, Dict[str, Any]]], model: Optional[str] = None) -> str:
+    """
+    Submit many cases to the OpenAI Batch API (cheaper, completes within 24h).
+    
+    Args:
+        cases: List of (case_text, case_info) tuples
+        model: OpenAI model; defaults to OPENAI_MODEL
+        
+    Returns:
+        The batch id, to be passed to poll_openai_batch()
+    """
+    model = model or os.getenv("OPENAI_MODEL", "gpt-4")
+    client = _get_openai_client()
+    
+    # custom_id is the input index so results can be put back in input order
+    payload = b"\n".join(
+        orjson.dumps(_openai_batch_request(str(i), model, case_text, case_info))
+        for i, (case_text, case_info) in enumerate(cases)
+    )
+    input_file = client.files.create(file=("extraction_batch.jsonl", payload), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+        # Lets poll_openai_batch() size its result list even if the batch fails before counting requests
+        metadata={"case_count": str(len(cases))},
+    )
+    logger.info(f"[OpenAI Batch] Submitted {len(cases)} cases with model {model}: batch_id={batch.id}")
+    return batch.id
+
+
+def poll_openai_batch(
+    batch_id: str,
+    case_count: Optional[int] = None,
+) -> Optional[List[Optional[LegalCaseExtraction]]]:
+    """
+    Check an OpenAI batch submitted with submit_openai_batch().
+    
+    Args:
+        batch_id: Id returned by submit_openai_batch()
+        case_count: Number of submitted cases; defaults to the count stored
+            in the batch metadata at submission
+        
+    Returns:
+        None while the batch is still running; otherwise one result per
+        submitted case, in input order (None where that request failed)
+    """
+    client = _get_openai_client()
+    batch = client.batches.retrieve(batch_id)
+    logger.info(f"[OpenAI Batch] {batch_id} status: {batch.status}")
+    if batch.status in ("validating", "in_progress", "finalizing", "cancelling"):
+        return None
+    
+    total = case_count
+    if total is None:
+        total = int((batch.metadata or {}).get("case_count", 0)) or (
+            batch.request_counts.total if batch.request_counts else 0
+        )
+    results: List[Optional[LegalCaseExtraction]] = [None] * total
+    if not batch.output_file_id:
+        logger.error(f"❌ [OpenAI Batch] {batch_id} ended with status {batch.status} and no output")
+        return results
+    
+    for line in client.files.content(batch.output_file_id).content.splitlines():
+        if not line.strip():
+            continue
+        record = orjson.loads(line)
+        custom_id = record.get("custom_id")
+        response = record.get("response") or {}
+        try:
+            if response.get("status_code") != 200:
+                raise ValueError(record.get("error") or f"status {response.get('status_code')}")
+            content = response["body"]["choices"][0]["message"]["content"]
+            results[int(custom_id)] = _EXTRACTION_ADAPTER.validate_json(content)
+        except Exception as e:
+            logger.error(f"❌ [OpenAI Batch] Request {custom_id} failed: {type(e).__name__}: {e}")
+    
+    succeeded = sum(1 for r in results if r is not None)
+    logger.info(f"[OpenAI Batch] {batch_id} complete: {succeeded}/{total} succeeded")
+    return results
+
+
+# ============================================================================
+# OPENAI DIRECT HTTP (OPENAI_DIRECT=true, async path only)
+# ============================================================================
+
+# aiohttp sessions are bound to the event loop they were created on
+_openai_direct_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+
+def _get_openai_direct_session():
+    """One pooled aiohttp ClientSession (with DNS cache) for the running event loop."""
+    import aiohttp
+    
+    loop = asyncio.get_running_loop()
+    session = _openai_direct_sessions.get(loop)
+    if session is None or session.closed:
+        logger.info(f"[OpenAI] Creating aiohttp session for direct requests...")
+        session = _openai_direct_sessions[loop] = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=100, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=10),
+        )
+    return session
+
+
+async def aclose_http_sessions() -> None:
+    """
+    Close the running event loop's pooled HTTP clients: the aiohttp session
+    (OPENAI_DIRECT=true), the ollama AsyncClients and the per-loop LangChain
+    chains' clients. extract_cases_batch and run_extraction_pipeline call this
+    when they finish; callers awaiting aextract_case_data directly should await
+    it before their event loop ends, or the clients leak their connections.
+    """
+    loop = asyncio.get_running_loop()
+    session = _openai_direct_sessions.pop(loop, None)
+    if session is not None and not session.closed:
+        await session.close()
+    for client in _async_ollama_clients.pop(loop, {}).values():
+        await _aclose_ollama_client(client)
+    for llm, _chain in _async_chains.pop(loop, {}).values():
+        await _aclose_chain_llm(llm)
+
+
+# Async entry points currently running per event loop, so concurrent batches
+# on one loop share its session and only the last to finish closes it
+_http_session_users: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int]" = weakref.WeakKeyDictionary()
+
+
+def _closes_http_sessions(func):
+    """Decorator for async entry points: close the loop's pooled sessions once the last one returns."""
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        _http_session_users[loop] = _http_session_users.get(loop, 0) + 1
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _http_session_users[loop] -= 1
+            if not _http_session_users[loop]:
+                await aclose_http_sessions()
+    return wrapper
+
+
+async def _openai_direct_extract(model: str, case_text: str, case_info: Dict[str, Any]) -> LegalCaseExtraction:
+    """
+    POST straight to /v1/chat/completions over the shared aiohttp session,
+    bypassing the OpenAI SDK / LangChain, and validate the structured output.
+    """
+    base_url = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/")
+    session = _get_openai_direct_session()
+    async with session.post(
+        f"{base_url}/chat/completions",
+        data=orjson.dumps(_openai_chat_body(model, case_text, case_info)),
+        headers={
+            "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}",
+            "Content-Type": "application/json",
+        },
+    ) as response:
+        body = await response.read()
+        if response.status != 200:
+            raise RuntimeError(f"OpenAI request failed: {response.status} - {body[:500].decode(errors='replace')}")
+    content = orjson.loads(body)["choices"][0]["message"]["content"]
+    return _EXTRACTION_ADAPTER.validate_json(content)
+
+
+# Hosts whose connection test (client.list()) has already succeeded
+_ollama_checked_hosts: set = set()
+
+
+def _ollama_http_options() -> Dict[str, Any]:
+    """
+    httpx options for the ollama clients (passed through to httpx.Client / AsyncClient):
+    a keep-alive pool sized for concurrent batch extraction, a bounded connect
+    timeout (generation itself stays unbounded), and HTTP/2 when OLLAMA_HTTP2=true
+    (requires the h2 package; only negotiated by servers behind TLS).
+    """
+    import httpx
+    
+    http2 = os.getenv("OLLAMA_HTTP2", "false").lower() == "true"
+    if http2 and importlib.util.find_spec("h2") is None:
+        # httpx raises ImportError for http2=True without h2, which would read as
+        # a missing ollama package and skip the native client altogether
+        logger.warning("[Ollama] OLLAMA_HTTP2=true but the h2 package is not installed "
+                       "(pip install h2); using HTTP/1.1")
+        http2 = False
+    
+    return {
+        "limits": httpx.Limits(max_keepalive_connections=40, max_connections=100, keepalive_expiry=30.0),
+        "timeout": httpx.Timeout(None, connect=10.0),
+        "http2": http2,
+    }
+
+
+@lru_cache(maxsize=4)
+def _get_ollama_client(host: str):
+    """One native ollama Client per host, reused across extractions."""
+    from ollama import Client
+    
+    logger.info(f"[Ollama] Creating client for {host}...")
+    return Client(host=host, **_ollama_http_options())
+
+
+# ollama.AsyncClient wraps an httpx.AsyncClient, which is tied to the event
+# loop it first runs on, so async clients are cached per (loop, host)
+_async_ollama_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+
+def _get_async_ollama_client(host: str):
+    """One ollama AsyncClient per host for the running event loop."""
+    from ollama import AsyncClient
+    
+    clients = _async_ollama_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(host)
+    if client is None:
+        logger.info(f"[Ollama] Creating async client for {host}...")
+        client = clients[host] = AsyncClient(host=host, **_ollama_http_options())
+    return client
+
+
+def _build_ollama_chain(model: str, base_url: str):
+    """Build the prompt | structured ChatOllama chain; returns (llm, chain)."""
+    from langchain_ollama import ChatOllama
+    
+    logger.info(f"[Ollama] Creating LangChain ChatOllama for {base_url}...")
+    llm = ChatOllama(
+        model=model, 
+        base_url=base_url,
+        temperature=0.0, 
+        format="json"
+    )
+    
+    # Try different structured output methods
+    structured_llm = None
+    for method in ["json_schema", "json_mode", None]:
+        try:
+            if method:
+                logger.info(f"[Ollama] Trying with_structured_output(method='{method}')...")
+                structured_llm = llm.with_structured_output(LegalCaseExtraction, method=method)
+            else:
+                logger.info(f"[Ollama] Trying with_structured_output() without method...")
+                structured_llm = llm.with_structured_output(LegalCaseExtraction)
+            logger.info(f"[Ollama] Structured output method '{method}' worked!")
+            break
+        except Exception as method_error:
+            logger.debug("[Ollama] Method '%s' failed: %s", method, method_error)
+            continue
+    
+    if not structured_llm:
+        raise Exception("All structured output methods failed")
+    
+    return llm, _build_prompt() | structured_llm
+
+
+@lru_cache(maxsize=4)
+def _get_ollama_chain(model: str, base_url: str):
+    """Build the prompt | structured ChatOllama chain once per (model, base_url) and reuse it (sync callers)."""
+    return _build_ollama_chain(model, base_url)[1]
+
+
+# The chains' LLMs hold httpx.AsyncClients that bind to the event loop they
+# first run on, so async callers get their own chains per (loop, key) as well;
+# each entry is (llm, chain) so aclose_http_sessions can close the llm's client
+_async_chains: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, ...], Tuple[Any, Any]]]" = weakref.WeakKeyDictionary()
+
+
+def _get_async_openai_chain(model: str):
+    """The prompt | structured ChatOpenAI chain for the running event loop."""
+    chains = _async_chains.setdefault(asyncio.get_running_loop(), {})
+    entry = chains.get(("openai", model))
+    if entry is None:
+        entry = chains[("openai", model)] = _build_openai_chain(model)
+    return entry[1]
+
+
+def _get_async_ollama_chain(model: str, base_url: str):
+    """The prompt | structured ChatOllama chain for the running event loop."""
+    chains = _async_chains.setdefault(asyncio.get_running_loop(), {})
+    entry = chains.get(("ollama", model, base_url))
+    if entry is None:
+        entry = chains[("ollama", model, base_url)] = _build_ollama_chain(model, base_url)
+    return entry[1]
+
+
+async def _aclose_ollama_client(client) -> None:
+    """Close an ollama AsyncClient's underlying httpx.AsyncClient."""
+    http_client = getattr(client, "_client", None)
+    if http_client is not None:
+        await http_client.aclose()
+
+
+async def _aclose_chain_llm(llm) -> None:
+    """Close the async HTTP client behind a ChatOpenAI / ChatOllama instance."""
+    openai_client = getattr(llm, "root_async_client", None)
+    if openai_client is not None:
+        await openai_client.close()
+    ollama_client = getattr(llm, "_async_client", None)
+    if ollama_client is not None:
+        await _aclose_ollama_client(ollama_client)
+
+
+def _ollama_regex_data(case_text: str, doc_type_slug: Optional[str]) -> Dict[str, Any]:
+    """Regex pre-extraction for the Ollama hybrid path (empty when the document type skips it)."""
+    if doc_type_slug is not None and get_processing_strategy(doc_type_slug) in _NO_REGEX_STRATEGIES:
+        logger.info(f"[Regex] Skipping regex pre-extraction for document type '{doc_type_slug}'")
+        regex_data = {}
+    else:
+        logger.info(f"[Regex] Running regex pre-extraction for reliable fields...")
+        regex_data = regex_pre_extract(case_text)
+    logger.info("[Regex] Pre-extracted: court_level=%s, district=%s, case_type=%s",
+                regex_data.get('court_level'), regex_data.get('district'), regex_data.get('case_type'))
+    logger.info("[Regex] Pre-extracted: parties=%d, judges=%d",
+                len(regex_data.get('parties_regex', [])), len(regex_data.get('judges_regex', [])))
+    return regex_data
+
+
+def _ollama_chat_messages(case_text: str, case_info: Dict[str, Any]) -> List[Dict[str, str]]:
+    """System and user messages for a native Ollama chat request (pair with _ollama_format())."""
+    # SYSTEM_PROMPT has no template variables, so only the user message is rendered per case
+    system_with_schema = _ollama_system_prompt()
+    user_content = _format_user_message(case_info, case_text)
+    logger.info("[Ollama] System prompt length: %d chars", len(system_with_schema))
+    logger.info("[Ollama] User prompt length: %d chars", len(user_content))
+    return [
+        {"role": "system", "content": system_with_schema},
+        {"role": "user", "content": user_content},
+    ]
+
+
+def _ollama_chat_content(client, chat_kwargs: Dict[str, Any]) -> str:
+    """Send one native Ollama chat request and return the message content."""
+    if os.getenv("OLLAMA_STREAM", "false").lower() == "true":
+        # Collect streamed chunks and join once, instead of holding the
+        # whole body in the HTTP response and again in the parsed message
+        return "".join(part.message.content for part in client.chat(stream=True, **chat_kwargs))
+    return client.chat(**chat_kwargs).message.content
+
+
+async def _aollama_chat_content(client, chat_kwargs: Dict[str, Any]) -> str:
+    """Async _ollama_chat_content for ollama.AsyncClient."""
+    if os.getenv("OLLAMA_STREAM", "false").lower() == "true":
+        return "".join([part.message.content async for part in await client.chat(stream=True, **chat_kwargs)])
+    return (await client.chat(**chat_kwargs)).message.content
+
+
+def _ollama_result_from_content(content: str, regex_data: Dict[str, Any]) -> LegalCaseExtraction:
+    """Parse, transform, apply regex overrides to and validate a native Ollama JSON response."""
+    # Always transform, even when the output already matches the schema: the
+    # transform also normalises values (e.g. court names) that validation accepts as-is
+    # Parse JSON and transform to match schema
+    logger.info(f"[Ollama] Parsing JSON response...")
+    raw_data = orjson.loads(content)
+    
+    # Transform flat response to nested schema format
+    logger.info(f"[Ollama] Transforming response to match Pydantic schema...")
+    transformed_data = _transform_ollama_response(raw_data)
+    
+    # === APPLY REGEX OVERRIDES (Hybrid approach) ===
+    logger.info(f"[Regex] Applying regex overrides to AI results...")
+    transformed_data = _apply_regex_overrides(transformed_data, regex_data)
+    
+    # Validate with Pydantic
+    logger.info(f"[Ollama] Validating transformed data with Pydantic...")
+    return _EXTRACTION_ADAPTER.validate_python(transformed_data)
+
+
+def extract_case_with_ollama(
+    case_text: str,
+    case_info: Dict[str, Any],
+    doc_type_slug: Optional[str] = None,
+    regex_data: Optional[Dict[str, Any]] = None,
+) -> Optional[LegalCaseExtraction]:
+    """
+    Extract case data using Ollama (local or remote) with regex hybrid approach.
+    If doc_type_slug routes to evidence indexing / text only, the regex
+    pre-extraction is skipped since its outcome fields are not used.
+    regex_data from an earlier _ollama_regex_data() call is reused when given.
+    """
     start_time = time.time()
     
     # Get configuration
     ollama_base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
     ollama_model = os.getenv("OLLAMA_MODEL", "llama3.3:latest")
     
-    logger.info(f"{'='*60}")
-    logger.info(f"[Ollama] STARTING HYBRID AI+REGEX EXTRACTION")
-    logger.info(f"{'='*60}")
-    logger.info(f"[Ollama] Server URL: {ollama_base_url}")
-    logger.info(f"[Ollama] Model: {ollama_model}")
-    logger.info(f"[Ollama] Case: {case_info.get('case_number', 'Unknown')}")
-    logger.info(f"[Ollama] Text length: {len(case_text)} characters ({len(case_text.split())} words)")
+    # The word count splits the whole text, so only build this when it will be emitted
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"{'='*60}")
+        logger.info(f"[Ollama] STARTING HYBRID AI+REGEX EXTRACTION")
+        logger.info(f"{'='*60}")
+        logger.info(f"[Ollama] Server URL: {ollama_base_url}")
+        logger.info(f"[Ollama] Model: {ollama_model}")
+        logger.info(f"[Ollama] Case: {case_info.get('case_number', 'Unknown')}")
+        logger.info(f"[Ollama] Text length: {len(case_text)} characters ({len(case_text.split())} words)")
     
     # === REGEX PRE-EXTRACTION (Reliable structured data) ===
-    logger.info(f"[Regex] Running regex pre-extraction for reliable fields...")
-    regex_data = regex_pre_extract(case_text)
-    logger.info(f"[Regex] Pre-extracted: court_level={regex_data.get('court_level')}, "
-                f"district={regex_data.get('district')}, case_type={regex_data.get('case_type')}")
-    logger.info(f"[Regex] Pre-extracted: parties={len(regex_data.get('parties_regex', []))}, "
-                f"judges={len(regex_data.get('judges_regex', []))}")
+    if regex_data is None:
+        regex_data = _ollama_regex_data(case_text, doc_type_slug)
     
     # === TRY 1: Native Ollama Client ===
     logger.info(f"[Ollama] Attempt 1: Native ollama Python client")
     
     try:
-        import ollama
-        from ollama import Client
-        
-        logger.info(f"[Ollama] Creating client for {ollama_base_url}...")
-        client = Client(host=ollama_base_url)
+        client = _get_ollama_client(ollama_base_url)
         
-        # Test connection first
-        logger.info(f"[Ollama] Testing connection...")
-        try:
-            models = client.list()
-            available_models = [m.get('name', m.get('model', 'unknown')) for m in models.get('models', [])]
-            logger.info(f"[Ollama] Connected! Available models: {available_models}")
-        except Exception as conn_error:
-            logger.warning(f"[Ollama] Connection test failed: {conn_error}")
-            raise conn_error
-        
-        prompt = _build_prompt()
-        msgs = prompt.format_messages(case_info=case_info, case_text=case_text)
-        
-        # Enhanced system message
-        enhanced_system = msgs[0].content + "\n\n🚨 CRITICAL JSON REQUIREMENTS:\nYour response MUST include ALL 7 top-level fields in your JSON:\n1. case (object)\n2. appeals_judges (array - REQUIRED even if empty [])\n3. attorneys (array - REQUIRED even if empty [])\n4. parties (array - REQUIRED even if empty [])\n5. issues_decisions (array - REQUIRED even if empty [])\n6. arguments (array - REQUIRED even if empty [])\n7. precedents (array - REQUIRED even if empty [])\n\nIf ANY field is missing from your JSON, the extraction WILL FAIL. Always include empty arrays [] if no data exists for that category."
-        
-        # Add schema to prompt
-        schema_json = json.dumps(LegalCaseExtraction.model_json_schema(), indent=2)
-        system_with_schema = f"{enhanced_system}\n\nIMPORTANT: You must return valid JSON that matches this exact schema:\n{schema_json}"
+        # Test connection the first time this server is used
+        if ollama_base_url not in _ollama_checked_hosts:
+            logger.info(f"[Ollama] Testing connection...")
+            try:
+                models = client.list()
+                available_models = [m.get('name', m.get('model', 'unknown')) for m in models.get('models', [])]
+                logger.info(f"[Ollama] Connected! Available models: {available_models}")
+            except Exception as conn_error:
+                logger.warning(f"[Ollama] Connection test failed: {conn_error}")
+                raise conn_error
+            _ollama_checked_hosts.add(ollama_base_url)
         
         logger.info(f"[Ollama] Sending chat request to model {ollama_model}...")
-        logger.info(f"[Ollama] System prompt length: {len(system_with_schema)} chars")
-        logger.info(f"[Ollama] User prompt length: {len(msgs[1].content)} chars")
-        
-        request_start = time.time()
-        response = client.chat(
+        messages = _ollama_chat_messages(case_text, case_info)
+        chat_kwargs = dict(
             model=ollama_model,
-            messages=[
-                {"role": "system", "content": system_with_schema},
-                {"role": "user", "content": msgs[1].content},
-            ],
-            format="json",
-            options={"temperature": 0.0},
+            messages=messages,
+            format=_ollama_format(),
+            options=_ollama_chat_options(messages),
+            keep_alive=os.getenv("OLLAMA_KEEP_ALIVE", "30m"),
         )
+        
+        request_start = time.time()
+        try:
+            content = _ollama_chat_content(client, chat_kwargs)
+        except ValidationError as e:
+            retry_kwargs = _ollama_json_retry_kwargs(e, chat_kwargs)
+            if retry_kwargs is None:
+                raise
+            content = _ollama_chat_content(client, retry_kwargs)
         request_duration = time.time() - request_start
         
-        logger.info(f"[Ollama] Response received in {request_duration:.2f}s")
-        logger.info(f"[Ollama] Response length: {len(response.message.content)} chars")
+        logger.info("[Ollama] Response received in %.2fs", request_duration)
+        logger.info("[Ollama] Response length: %d chars", len(content))
         
         # Log first part of response for debugging
-        response_preview = response.message.content[:1000]
-        logger.debug(f"[Ollama] Response preview:\n{response_preview}...")
-        
-        # Parse JSON and transform to match schema
-        logger.info(f"[Ollama] Parsing JSON response...")
-        raw_data = json.loads(response.message.content)
-        
-        # Transform flat response to nested schema format
-        logger.info(f"[Ollama] Transforming response to match Pydantic schema...")
-        transformed_data = _transform_ollama_response(raw_data)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[Ollama] Response preview:\n%s...", content[:1000])
         
-        # === APPLY REGEX OVERRIDES (Hybrid approach) ===
-        logger.info(f"[Regex] Applying regex overrides to AI results...")
-        transformed_data = _apply_regex_overrides(transformed_data, regex_data)
-        
-        # Validate with Pydantic
-        logger.info(f"[Ollama] Validating transformed data with Pydantic...")
-        result = LegalCaseExtraction.model_validate(transformed_data)
+        result = _ollama_result_from_content(content, regex_data)
         
         duration = time.time() - start_time
         _log_extraction_result(result, "Hybrid Native Ollama + Regex", duration)
@@ -1415,43 +2365,13 @@ def extract_case_with_ollama(case_text: str, case_info: Dict[str, Any]) -> Optio
         logger.warning(f"⚠️  [Ollama] Native client failed after {duration:.2f}s")
         logger.warning(f"⚠️  [Ollama] Error type: {type(e).__name__}")
         logger.warning(f"⚠️  [Ollama] Error message: {str(e)}")
-        logger.debug(f"⚠️  [Ollama] Full traceback:\n{traceback.format_exc()}")
+        logger.debug("⚠️  [Ollama] Full traceback:", exc_info=True)
 
     # === TRY 2: LangChain ChatOllama Fallback ===
     logger.info(f"[Ollama] Attempt 2: LangChain ChatOllama fallback")
     
     try:
-        from langchain_ollama import ChatOllama
-        
-        logger.info(f"[Ollama] Creating LangChain ChatOllama for {ollama_base_url}...")
-        llm = ChatOllama(
-            model=ollama_model, 
-            base_url=ollama_base_url,
-            temperature=0.0, 
-            format="json"
-        )
-        
-        # Try different structured output methods
-        structured_llm = None
-        for method in ["json_schema", "json_mode", None]:
-            try:
-                if method:
-                    logger.info(f"[Ollama] Trying with_structured_output(method='{method}')...")
-                    structured_llm = llm.with_structured_output(LegalCaseExtraction, method=method)
-                else:
-                    logger.info(f"[Ollama] Trying with_structured_output() without method...")
-                    structured_llm = llm.with_structured_output(LegalCaseExtraction)
-                logger.info(f"[Ollama] Structured output method '{method}' worked!")
-                break
-            except Exception as method_error:
-                logger.debug(f"[Ollama] Method '{method}' failed: {method_error}")
-                continue
-        
-        if not structured_llm:
-            raise Exception("All structured output methods failed")
-        
-        prompt = _build_prompt()
-        chain = prompt | structured_llm
+        chain = _get_ollama_chain(ollama_model, ollama_base_url)
         
         logger.info(f"[Ollama] Invoking LangChain chain...")
         request_start = time.time()
@@ -1464,7 +2384,7 @@ def extract_case_with_ollama(case_text: str, case_info: Dict[str, Any]) -> Optio
             _log_extraction_result(result, "LangChain Ollama", duration)
             return result
         
-        validated = LegalCaseExtraction.model_validate(result)
+        validated = _EXTRACTION_ADAPTER.validate_python(result)
         duration = time.time() - start_time
         _log_extraction_result(validated, "LangChain Ollama", duration)
         return validated
@@ -1474,78 +2394,801 @@ def extract_case_with_ollama(case_text: str, case_info: Dict[str, Any]) -> Optio
         logger.error(f"❌ [Ollama] LangChain fallback also failed after {duration:.2f}s")
         logger.error(f"❌ [Ollama] Error type: {type(e).__name__}")
         logger.error(f"❌ [Ollama] Error message: {str(e)}")
-        logger.debug(f"❌ [Ollama] Full traceback:\n{traceback.format_exc()}")
+        logger.debug("❌ [Ollama] Full traceback:", exc_info=True)
+        return None
+
+
+# ============================================================================
+# EXTRACTION RESULT CACHE (opt-in with LLM_CACHE=true)
+# ============================================================================
+
+_LLM_CACHE_SIZE = 512
+_llm_cache: "OrderedDict[bytes, LegalCaseExtraction]" = OrderedDict()
+_llm_cache_lock = threading.Lock()
+
+
+def _llm_cache_key(case_text: str, case_info: Dict[str, Any], doc_type_slug: Optional[str]) -> Optional[bytes]:
+    """
+    Exact-match key over the backend/model config, case_info and case_text,
+    or None when LLM_CACHE is off.
+    """
+    if os.getenv("LLM_CACHE", "false").lower() != "true":
         return None
+    config = (
+        os.getenv("USE_OLLAMA", "false").lower(),
+        os.getenv("OLLAMA_MODEL", "llama3.3:latest"),
+        os.getenv("OPENAI_MODEL", "gpt-4"),
+        doc_type_slug,
+    )
+    h = hashlib.blake2b(digest_size=16)
+    h.update(orjson.dumps([config, case_info], option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str))
+    h.update(case_text.encode('utf-8', 'surrogatepass'))
+    return h.digest()
+
+
+def _llm_cache_get(key: bytes) -> Optional[LegalCaseExtraction]:
+    with _llm_cache_lock:
+        cached = _llm_cache.get(key)
+        if cached is None:
+            return None
+        _llm_cache.move_to_end(key)
+    # Deep copy so callers can't mutate the cached result
+    return cached.model_copy(deep=True)
+
+
+def _llm_cache_put(key: Optional[bytes], result: LegalCaseExtraction) -> LegalCaseExtraction:
+    """Store a successful extraction (no-op when key is None); returns result for chaining."""
+    if key is not None:
+        with _llm_cache_lock:
+            _llm_cache[key] = result.model_copy(deep=True)
+            if len(_llm_cache) > _LLM_CACHE_SIZE:
+                _llm_cache.popitem(last=False)
+    return result
+
 
+# ============================================================================
+# PROVIDER PRIORITY
+# ============================================================================
 
-def extract_case_data(case_text: str, case_info: Dict[str, Any]) -> Optional[LegalCaseExtraction]:
+@dataclass(frozen=True)
+class _Provider:
+    """An extraction backend: sync/async extract callables plus an availability check."""
+    name: str
+    extract: Callable[..., Optional[LegalCaseExtraction]]  # (case_text, case_info, slug, regex_data=None)
+    aextract: Callable[[str, Dict[str, Any], Optional[str]], Any]
+    enabled: Callable[[], bool]
+    requires: str = ""
+
+
+# Callables look the module functions up at call time so they stay patchable
+_OLLAMA_PROVIDER = _Provider(
+    name="Ollama",
+    extract=lambda case_text, case_info, slug, regex_data=None: extract_case_with_ollama(
+        case_text, case_info, slug, regex_data
+    ),
+    aextract=lambda case_text, case_info, slug: aextract_case_with_ollama(case_text, case_info, slug),
+    enabled=lambda: True,
+)
+_OPENAI_PROVIDER = _Provider(
+    name="OpenAI",
+    extract=lambda case_text, case_info, slug, regex_data=None: extract_case_with_openai(case_text, case_info),
+    aextract=lambda case_text, case_info, slug: aextract_case_with_openai(case_text, case_info),
+    enabled=lambda: bool(os.getenv("OPENAI_API_KEY")),
+    requires="OPENAI_API_KEY not set",
+)
+
+
+def _ordered_providers(use_ollama: bool) -> Tuple[_Provider, ...]:
+    """Providers in priority order; each appears once."""
+    return (_OLLAMA_PROVIDER, _OPENAI_PROVIDER) if use_ollama else (_OPENAI_PROVIDER, _OLLAMA_PROVIDER)
+
+
+def extract_case_data(
+    case_text: str,
+    case_info: Dict[str, Any],
+    doc_type_slug: Optional[str] = None,
+) -> Optional[LegalCaseExtraction]:
     """
     Main extraction function that prioritizes Ollama if USE_OLLAMA=true.
     
     Extraction priority:
     1. If USE_OLLAMA=true: Try Ollama first, then OpenAI
     2. If USE_OLLAMA=false: Try OpenAI first, then Ollama
+    
+    When doc_type_slug is given and routes to TEXT_ONLY, no AI extraction is
+    done and None is returned. With LLM_CACHE=true, successful results are
+    cached in-process by an exact hash of the config, case_info and case_text.
     """
-    start_time = time.time()
+    done, cache_key, result = _extraction_precheck(case_text, case_info, doc_type_slug)
+    if done:
+        return result
+    return _extract_with_providers(case_text, case_info, doc_type_slug, cache_key)
+
+
+def _extraction_precheck(
+    case_text: str,
+    case_info: Dict[str, Any],
+    doc_type_slug: Optional[str],
+) -> Tuple[bool, Optional[bytes], Optional[LegalCaseExtraction]]:
+    """
+    Checks every extraction entry point runs before calling an LLM.
     
-    logger.info(f"\n{'#'*80}")
-    logger.info(f"# AI EXTRACTION STARTED")
-    logger.info(f"# Case: {case_info.get('case_number', 'Unknown')}")
-    logger.info(f"# Time: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-    logger.info(f"{'#'*80}\n")
+    Returns:
+        (done, cache_key, result): done is True when no LLM call is needed
+        (TEXT_ONLY document type, or an LLM cache hit returned as result);
+        cache_key is where a new successful result should be stored
+    """
+    if doc_type_slug is not None and get_processing_strategy(doc_type_slug) == ProcessingStrategy.TEXT_ONLY:
+        logger.info(f"[Strategy] Document type '{doc_type_slug}' is text-only, skipping AI extraction")
+        return True, None, None
+    
+    cache_key = _llm_cache_key(case_text, case_info, doc_type_slug)
+    if cache_key is not None:
+        cached = _llm_cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"[Cache] Returning cached extraction for {case_info.get('case_number', 'Unknown')}")
+            return True, cache_key, cached
+    return False, cache_key, None
+
+
+def _extract_with_providers(
+    case_text: str,
+    case_info: Dict[str, Any],
+    doc_type_slug: Optional[str],
+    cache_key: Optional[bytes],
+    regex_data: Optional[Dict[str, Any]] = None,
+) -> Optional[LegalCaseExtraction]:
+    """Provider priority/fallback loop of extract_case_data, after _extraction_precheck()."""
+    start_time = time.time()
     
-    # Log environment configuration
     use_ollama = os.getenv("USE_OLLAMA", "false").lower() == "true"
-    logger.info(f"[Config] USE_OLLAMA={use_ollama}")
-    logger.info(f"[Config] OLLAMA_BASE_URL={os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')}")
-    logger.info(f"[Config] OLLAMA_MODEL={os.getenv('OLLAMA_MODEL', 'llama3.3:latest')}")
-    logger.info(f"[Config] OPENAI_API_KEY={'[SET]' if os.getenv('OPENAI_API_KEY') else '[NOT SET]'}")
-    logger.info(f"[Config] OPENAI_MODEL={os.getenv('OPENAI_MODEL', 'gpt-4')}")
+    providers = _ordered_providers(use_ollama)
+    
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"\n{'#'*80}")
+        logger.info(f"# AI EXTRACTION STARTED")
+        logger.info(f"# Case: {case_info.get('case_number', 'Unknown')}")
+        logger.info(f"# Time: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info(f"{'#'*80}\n")
+        
+        # Log environment configuration
+        logger.info(f"[Config] USE_OLLAMA={use_ollama}")
+        logger.info(f"[Config] OLLAMA_BASE_URL={os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')}")
+        logger.info(f"[Config] OLLAMA_MODEL={os.getenv('OLLAMA_MODEL', 'llama3.3:latest')}")
+        logger.info(f"[Config] OPENAI_API_KEY={'[SET]' if os.getenv('OPENAI_API_KEY') else '[NOT SET]'}")
+        logger.info(f"[Config] OPENAI_MODEL={os.getenv('OPENAI_MODEL', 'gpt-4')}")
+        logger.info(f"\n[Strategy] Primary: {providers[0].name}, Fallback: {providers[1].name}")
+    
+    for n, provider in enumerate(providers):
+        label = provider.name if n == 0 else f"{provider.name} fallback"
+        if n:
+            logger.warning(f"\n[Strategy] {providers[n - 1].name} failed/unavailable, trying {label}...")
+        if not provider.enabled():
+            logger.warning(f"[Strategy] {provider.name} not configured ({provider.requires}), skipping...")
+            continue
+        result = provider.extract(case_text, case_info, doc_type_slug, regex_data)
+        if result:
+            total_duration = time.time() - start_time
+            logger.info(f"\n✅ EXTRACTION COMPLETE ({label}) - Total time: {total_duration:.2f}s")
+            return _llm_cache_put(cache_key, result)
+    
+    total_duration = time.time() - start_time
+    logger.error(f"\n❌ ALL EXTRACTION METHODS FAILED - Total time: {total_duration:.2f}s")
+    logger.error(f"{'#'*80}\n")
+    return None
+
+
+# ============================================================================
+# ASYNC EXTRACTION
+# ============================================================================
+
+async def aextract_case_with_openai(case_text: str, case_info: Dict[str, Any]) -> Optional[LegalCaseExtraction]:
+    """
+    Async version of extract_case_with_openai (awaits the cached chain's ainvoke).
+    With OPENAI_DIRECT=true the request is sent over a shared aiohttp session instead.
+    """
+    start_time = time.time()
+    model = os.getenv("OPENAI_MODEL", "gpt-4")
+    logger.info(f"[OpenAI] Starting async extraction with model: {model}")
     
-    result = None
+    if not _fits_openai_context(model, case_text, case_info):
+        return None
     
-    if use_ollama:
-        logger.info("\n[Strategy] Primary: Ollama, Fallback: OpenAI")
+    try:
+        result = None
+        if os.getenv("OPENAI_DIRECT", "false").lower() == "true":
+            try:
+                result = await _openai_direct_extract(model, case_text, case_info)
+            except ImportError as e:
+                logger.warning(f"[OpenAI] aiohttp not installed, using the SDK chain: {e}")
+        if result is None:
+            chain = _get_async_openai_chain(model)
+            result = await chain.ainvoke({"case_info": case_info, "case_text": case_text})
+            if not isinstance(result, LegalCaseExtraction):
+                result = _EXTRACTION_ADAPTER.validate_python(result)
+        _log_extraction_result(result, "OpenAI", time.time() - start_time)
+        return result
+    except Exception as e:
+        duration = time.time() - start_time
+        logger.error(f"❌ OpenAI extraction failed after {duration:.2f}s: {type(e).__name__}: {e}")
+        logger.debug("❌ Full traceback:", exc_info=True)
+        return None
+
+
+async def aextract_case_with_ollama(
+    case_text: str,
+    case_info: Dict[str, Any],
+    doc_type_slug: Optional[str] = None,
+) -> Optional[LegalCaseExtraction]:
+    """
+    Async version of extract_case_with_ollama using ollama.AsyncClient.
+    Regex pre-extraction and response parsing run on a worker thread so the
+    event loop stays free for other in-flight requests.
+    """
+    start_time = time.time()
+    ollama_base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    ollama_model = os.getenv("OLLAMA_MODEL", "llama3.3:latest")
+    logger.info(f"[Ollama] Starting async extraction for {case_info.get('case_number', 'Unknown')} "
+                f"with model {ollama_model} at {ollama_base_url}")
+    
+    regex_data = await asyncio.to_thread(_ollama_regex_data, case_text, doc_type_slug)
+    
+    # === TRY 1: Native Ollama AsyncClient ===
+    try:
+        client = _get_async_ollama_client(ollama_base_url)
         
-        # Try Ollama first
-        result = extract_case_with_ollama(case_text, case_info)
-        if result:
-            total_duration = time.time() - start_time
-            logger.info(f"\n✅ EXTRACTION COMPLETE (Ollama) - Total time: {total_duration:.2f}s")
-            return result
+        if ollama_base_url not in _ollama_checked_hosts:
+            logger.info(f"[Ollama] Testing connection...")
+            await client.list()
+            _ollama_checked_hosts.add(ollama_base_url)
         
-        # Fallback to OpenAI
-        logger.warning("\n[Strategy] Ollama failed, trying OpenAI fallback...")
-        if os.getenv("OPENAI_API_KEY"):
-            result = extract_case_with_openai(case_text, case_info)
-            if result:
-                total_duration = time.time() - start_time
-                logger.info(f"\n✅ EXTRACTION COMPLETE (OpenAI fallback) - Total time: {total_duration:.2f}s")
-                return result
+        messages = _ollama_chat_messages(case_text, case_info)
+        chat_kwargs = dict(
+            model=ollama_model,
+            messages=messages,
+            format=_ollama_format(),
+            options=_ollama_chat_options(messages),
+            keep_alive=os.getenv("OLLAMA_KEEP_ALIVE", "30m"),
+        )
+        request_start = time.time()
+        try:
+            content = await _aollama_chat_content(client, chat_kwargs)
+        except ValidationError as e:
+            retry_kwargs = _ollama_json_retry_kwargs(e, chat_kwargs)
+            if retry_kwargs is None:
+                raise
+            content = await _aollama_chat_content(client, retry_kwargs)
+        logger.info("[Ollama] Response received in %.2fs (%d chars)", time.time() - request_start, len(content))
+        
+        result = await asyncio.to_thread(_ollama_result_from_content, content, regex_data)
+        _log_extraction_result(result, "Hybrid Native Ollama + Regex", time.time() - start_time)
+        return result
+    
+    except ImportError as e:
+        logger.warning(f"[Ollama] ollama package not installed: {e}")
+    except Exception as e:
+        logger.warning(f"⚠️  [Ollama] Async native client failed after {time.time() - start_time:.2f}s: "
+                       f"{type(e).__name__}: {e}")
+        logger.debug("⚠️  [Ollama] Full traceback:", exc_info=True)
+    
+    # === TRY 2: LangChain ChatOllama Fallback ===
+    try:
+        chain = _get_async_ollama_chain(ollama_model, ollama_base_url)
+        result = await chain.ainvoke({"case_info": case_info, "case_text": case_text})
+        if not isinstance(result, LegalCaseExtraction):
+            result = _EXTRACTION_ADAPTER.validate_python(result)
+        _log_extraction_result(result, "LangChain Ollama", time.time() - start_time)
+        return result
+    except Exception as e:
+        logger.error(f"❌ [Ollama] LangChain fallback also failed after {time.time() - start_time:.2f}s: "
+                     f"{type(e).__name__}: {e}")
+        logger.debug("❌ [Ollama] Full traceback:", exc_info=True)
+        return None
+
+
+@lru_cache(maxsize=1)
+def _hedge_delay_s() -> Optional[float]:
+    """
+    HEDGE_MS in seconds, parsed once; None (no hedging) when unset, empty,
+    negative or not a number, with a warning for values that don't parse.
+    """
+    raw = os.getenv("HEDGE_MS", "").strip()
+    if not raw:
+        return None
+    try:
+        hedge_ms = float(raw)
+    except ValueError:
+        logger.warning(f"[Strategy] Ignoring HEDGE_MS={raw!r}: not a number; hedging disabled")
+        return None
+    if not hedge_ms >= 0:
+        logger.warning(f"[Strategy] Ignoring HEDGE_MS={raw!r}: must be >= 0; hedging disabled")
+        return None
+    return hedge_ms / 1000
+
+
+async def _hedged_extract(
+    providers: List[_Provider],
+    case_text: str,
+    case_info: Dict[str, Any],
+    doc_type_slug: Optional[str],
+    hedge_s: float,
+) -> Tuple[Optional[str], Optional[LegalCaseExtraction]]:
+    """
+    Hedged requests: start providers in priority order, launching the next one
+    when nothing has answered within hedge_s seconds or as soon as one fails.
+    The first non-empty result wins and the others are cancelled.
+    
+    Returns:
+        (provider name, result), or (None, None) when every provider failed
+    """
+    queue = list(providers)
+    pending: Dict[asyncio.Task, str] = {}
+    
+    def launch() -> None:
+        provider = queue.pop(0)
+        task = asyncio.create_task(provider.aextract(case_text, case_info, doc_type_slug))
+        pending[task] = provider.name
+    
+    launch()
+    try:
+        while pending:
+            done, _ = await asyncio.wait(
+                pending, timeout=hedge_s if queue else None, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                logger.info(f"[Strategy] No result after {hedge_s:.2f}s, hedging with {queue[0].name}")
+                launch()
+                continue
+            for task in done:
+                name = pending.pop(task)
+                if task.exception() is not None:
+                    logger.warning(f"[Strategy] {name} raised {type(task.exception()).__name__}: {task.exception()}")
+                elif task.result():
+                    return name, task.result()
+            if queue:
+                launch()
+        return None, None
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def aextract_case_data(
+    case_text: str,
+    case_info: Dict[str, Any],
+    doc_type_slug: Optional[str] = None,
+) -> Optional[LegalCaseExtraction]:
+    """
+    Async version of extract_case_data, with the same Ollama/OpenAI priority and
+    fallback. With HEDGE_MS set, the fallback provider is also started if the
+    primary hasn't answered within that many milliseconds (first result wins).
+    """
+    done, cache_key, result = _extraction_precheck(case_text, case_info, doc_type_slug)
+    if done:
+        return result
+    
+    start_time = time.time()
+    use_ollama = os.getenv("USE_OLLAMA", "false").lower() == "true"
+    
+    providers = []
+    for provider in _ordered_providers(use_ollama):
+        if provider.enabled():
+            providers.append(provider)
         else:
-            logger.warning("[Strategy] OpenAI API key not set, cannot use fallback")
+            logger.warning(f"[Strategy] {provider.name} not configured ({provider.requires}), skipping...")
+    
+    hedge_s = _hedge_delay_s()
+    if hedge_s is not None and len(providers) > 1:
+        name, result = await _hedged_extract(providers, case_text, case_info, doc_type_slug, hedge_s)
+        if result:
+            logger.info(f"✅ EXTRACTION COMPLETE ({name}, hedged) - Total time: {time.time() - start_time:.2f}s")
+            return _llm_cache_put(cache_key, result)
     else:
-        logger.info("\n[Strategy] Primary: OpenAI, Fallback: Ollama")
-        
-        # Try OpenAI first
-        if os.getenv("OPENAI_API_KEY"):
-            result = extract_case_with_openai(case_text, case_info)
+        for provider in providers:
+            result = await provider.aextract(case_text, case_info, doc_type_slug)
             if result:
-                total_duration = time.time() - start_time
-                logger.info(f"\n✅ EXTRACTION COMPLETE (OpenAI) - Total time: {total_duration:.2f}s")
-                return result
+                logger.info(f"✅ EXTRACTION COMPLETE ({provider.name}) - Total time: {time.time() - start_time:.2f}s")
+                return _llm_cache_put(cache_key, result)
+    
+    logger.error(f"❌ ALL EXTRACTION METHODS FAILED - Total time: {time.time() - start_time:.2f}s")
+    return None
+
+
+@_closes_http_sessions
+async def extract_cases_batch(
+    cases: List[Tuple[str, Dict[str, Any]]],
+    concurrency: Optional[int] = None,
+    doc_type_slug: Optional[str] = None,
+) -> List[Optional[LegalCaseExtraction]]:
+    """
+    Run aextract_case_data over many cases concurrently.
+
+    Each case goes through the same Ollama/OpenAI priority and fallback as
+    extract_case_data, with the HTTP calls overlapped on the event loop.
+
+    Args:
+        cases: List of (case_text, case_info) tuples
+        concurrency: Maximum number of cases in flight at once; defaults to
+            OLLAMA_NUM_PARALLEL (8 if unset) so client fan-out matches the
+            server's parallel request slots
+        doc_type_slug: Optional document type slug applied to every case
+
+    Returns:
+        One result per input case, in input order (None where extraction failed)
+    """
+    if not cases:
+        return []
+    if concurrency is None:
+        concurrency = int(os.getenv("OLLAMA_NUM_PARALLEL", "8"))
+
+    start_time = time.time()
+    logger.info(f"[Batch] Extracting {len(cases)} cases (concurrency={concurrency})")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(case_text: str, case_info: Dict[str, Any]) -> Optional[LegalCaseExtraction]:
+        async with semaphore:
+            return await aextract_case_data(case_text, case_info, doc_type_slug)
+
+    raw_results = await asyncio.gather(
+        *(run_one(case_text, case_info) for case_text, case_info in cases),
+        return_exceptions=True,
+    )
+
+    results: List[Optional[LegalCaseExtraction]] = []
+    for (_, case_info), raw in zip(cases, raw_results):
+        if isinstance(raw, Exception):
+            logger.error(f"❌ [Batch] Extraction failed for {case_info.get('case_number', 'Unknown')}: {raw}")
+            results.append(None)
         else:
-            logger.warning("[Strategy] OpenAI API key not set, skipping...")
+            results.append(raw)
+
+    succeeded = sum(1 for r in results if r is not None)
+    logger.info(f"[Batch] Complete: {succeeded}/{len(cases)} succeeded in {time.time() - start_time:.2f}s")
+    return results
+
+
+# ============================================================================
+# MULTI-CASE PROMPTS (several short cases per Ollama request)
+# ============================================================================
+
+_BATCH_PROMPT_INSTRUCTIONS = (
+    "\n\nBATCHED INPUT: The user message contains several cases, each starting with "
+    "'CASE <n>:' and separated by lines of '==='. Extract every case independently and "
+    "return ONE JSON object of the form {\"results\": [...]} whose array holds one "
+    "extraction object matching the schema above per case, in the same order as the cases."
+)
+
+
+@lru_cache(maxsize=1)
+def _ollama_batch_system_prompt() -> str:
+    """Ollama system prompt + schema, plus the multi-case output instructions."""
+    # The {"results": [...]} wrapper isn't the extraction schema, so this path
+    # keeps format="json" and relies on the schema embedded in the prompt
+    return _ollama_system_prompt() + _BATCH_PROMPT_INSTRUCTIONS
+
+
+def _ollama_extract_group(
+    group: List[Tuple[str, Dict[str, Any]]],
+    regex_data: List[Dict[str, Any]],
+) -> List[Optional[LegalCaseExtraction]]:
+    """
+    Extract several cases with one native Ollama request. Each returned item
+    goes through the usual transform + regex overrides (regex_data, one per
+    case) + validation; items that are missing or invalid come back as None.
+    """
+    ollama_base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    ollama_model = os.getenv("OLLAMA_MODEL", "llama3.3:latest")
+    client = _get_ollama_client(ollama_base_url)
+    
+    user_content = "\n===\n".join(
+        f"CASE {n}:\n{_format_user_message(case_info, case_text)}"
+        for n, (case_text, case_info) in enumerate(group, 1)
+    )
+    messages = [
+        {"role": "system", "content": _ollama_batch_system_prompt()},
+        {"role": "user", "content": user_content},
+    ]
+    request_start = time.time()
+    response = client.chat(
+        model=ollama_model,
+        messages=messages,
+        format="json",
+        options=_ollama_chat_options(messages),
+        keep_alive=os.getenv("OLLAMA_KEEP_ALIVE", "30m"),
+    )
+    logger.info(f"[Ollama] Multi-case response for {len(group)} cases received in "
+                f"{time.time() - request_start:.2f}s")
+    
+    items = orjson.loads(response.message.content).get("results")
+    if not isinstance(items, list):
+        raise ValueError("multi-case response has no 'results' array")
+    
+    results: List[Optional[LegalCaseExtraction]] = []
+    for (_, case_info), case_regex_data, item in zip(group, regex_data, items + [None] * (len(group) - len(items))):
+        if not isinstance(item, dict):
+            results.append(None)
+            continue
+        try:
+            transformed = _transform_ollama_response(item)
+            transformed = _apply_regex_overrides(transformed, case_regex_data)
+            results.append(_EXTRACTION_ADAPTER.validate_python(transformed))
+        except Exception as e:
+            logger.warning(f"[Ollama] Multi-case item for {case_info.get('case_number', 'Unknown')} "
+                           f"failed validation: {e}")
+            results.append(None)
+    return results
+
+
+def extract_cases_batched(
+    cases: List[Tuple[str, Dict[str, Any]]],
+    k: int = 4,
+    max_chars: int = 24000,
+    doc_type_slug: Optional[str] = None,
+) -> List[Optional[LegalCaseExtraction]]:
+    """
+    Extract many cases, packing up to k short cases into each Ollama request so
+    the system prompt and schema are sent once per group instead of per case.
+    
+    Only used when USE_OLLAMA=true. A case is packed only when its text fits in
+    max_chars // k characters, so a full group stays within about max_chars
+    (roughly max_chars / 4 tokens). Long cases, and any case whose group request
+    or item fails, are extracted on their own like extract_case_data. Every case
+    gets the same TEXT_ONLY skip and LLM cache lookup/fill as extract_case_data,
+    and only cache misses are sent to the LLM.
+    
+    Returns:
+        One result per input case, in input order (None where extraction failed)
+    """
+    results: List[Optional[LegalCaseExtraction]] = [None] * len(cases)
+    cache_keys: List[Optional[bytes]] = [None] * len(cases)
+    todo = []
+    for i, (case_text, case_info) in enumerate(cases):
+        done, cache_keys[i], results[i] = _extraction_precheck(case_text, case_info, doc_type_slug)
+        if not done:
+            todo.append(i)
+    if not todo:
+        return results
+    
+    if os.getenv("USE_OLLAMA", "false").lower() == "true" and k > 1:
+        per_case_chars = max_chars // k
+        short = [i for i in todo if len(cases[i][0]) <= per_case_chars]
+        singles = sorted(set(todo) - set(short))
+    else:
+        short, singles = [], list(todo)
+    
+    # Regex pre-extraction runs once per packed case and is reused if it falls back to a single request
+    regex_data: Dict[int, Dict[str, Any]] = {}
+    
+    for start in range(0, len(short), k):
+        idxs = short[start:start + k]
+        if len(idxs) == 1:
+            singles.append(idxs[0])
+            continue
+        for i in idxs:
+            regex_data[i] = _ollama_regex_data(cases[i][0], doc_type_slug)
+        try:
+            group_results = _ollama_extract_group([cases[i] for i in idxs], [regex_data[i] for i in idxs])
+        except Exception as e:
+            logger.warning(f"[Ollama] Multi-case request failed ({type(e).__name__}: {e}), "
+                           f"extracting {len(idxs)} cases individually")
+            group_results = [None] * len(idxs)
+        for i, result in zip(idxs, group_results):
+            if result is None:
+                singles.append(i)
+            else:
+                results[i] = _llm_cache_put(cache_keys[i], result)
+    
+    for i in sorted(singles):
+        case_text, case_info = cases[i]
+        results[i] = _extract_with_providers(case_text, case_info, doc_type_slug, cache_keys[i], regex_data.get(i))
+    
+    succeeded = sum(1 for r in results if r is not None)
+    logger.info(f"[Batch] Multi-case extraction complete: {succeeded}/{len(cases)} succeeded")
+    return results
+
+
+async def _aextract_pipeline_batch(cases: List[Tuple[str, Dict[str, Any]]]):
+    """
+    LLM stage of run_extraction_pipeline for one micro-batch of documents.
+    
+    Async generator yielding (n, result) for cases[n] as each case finishes.
+    With OpenAI as the primary provider (LangChain chain, not OPENAI_DIRECT),
+    the batch's cache misses go out in one chain.abatch() call and any case it
+    fails on is retried on the fallback provider only. Otherwise every case is
+    its own aextract_case_data request, since the native Ollama client has no
+    batch call (abatch on ChatOllama would also skip the regex overrides).
+    """
+    use_openai_batch = (
+        len(cases) > 1
+        and os.getenv("USE_OLLAMA", "false").lower() != "true"
+        and os.getenv("OPENAI_DIRECT", "false").lower() != "true"
+        and _OPENAI_PROVIDER.enabled()
+    )
+    
+    if use_openai_batch:
+        cache_keys: Dict[int, Optional[bytes]] = {}
+        misses = []
+        for n, (text, info) in enumerate(cases):
+            done, cache_keys[n], result = _extraction_precheck(text, info, None)
+            if done:
+                yield n, result
+            else:
+                misses.append(n)
+        
+        todo = []
+        if misses:
+            batch_results = await extract_cases_batch_with_openai([cases[n] for n in misses], max_concurrency=len(misses))
+            for n, result in zip(misses, batch_results):
+                if result is None:
+                    todo.append(n)
+                else:
+                    yield n, _llm_cache_put(cache_keys[n], result)
+        
+        fallbacks = _ordered_providers(use_ollama=False)[1:]
+        
+        async def run_one(n: int) -> Optional[LegalCaseExtraction]:
+            text, info = cases[n]
+            for provider in fallbacks:
+                if provider.enabled():
+                    logger.info(f"[Pipeline] Retrying {info.get('case_number', 'Unknown')} on {provider.name}")
+                    result = await provider.aextract(text, info, None)
+                    if result:
+                        return _llm_cache_put(cache_keys[n], result)
+            return None
+    else:
+        todo = list(range(len(cases)))
         
-        # Fallback to Ollama
-        logger.warning("\n[Strategy] OpenAI failed/unavailable, trying Ollama fallback...")
-        result = extract_case_with_ollama(case_text, case_info)
-        if result:
-            total_duration = time.time() - start_time
-            logger.info(f"\n✅ EXTRACTION COMPLETE (Ollama fallback) - Total time: {total_duration:.2f}s")
-            return result
+        async def run_one(n: int) -> Optional[LegalCaseExtraction]:
+            return await aextract_case_data(*cases[n])
     
-    total_duration = time.time() - start_time
-    logger.error(f"\n❌ ALL EXTRACTION METHODS FAILED - Total time: {total_duration:.2f}s")
-    logger.error(f"{'#'*80}\n")
-    return None
+    async def run_indexed(n: int) -> Tuple[int, Optional[LegalCaseExtraction]]:
+        try:
+            return n, await run_one(n)
+        except Exception as e:
+            logger.error(f"❌ [Pipeline] AI extraction failed for {cases[n][1].get('case_number', 'Unknown')}: {e}")
+            return n, None
+    
+    tasks = [asyncio.ensure_future(run_indexed(n)) for n in todo]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+@_closes_http_sessions
+async def run_extraction_pipeline(
+    documents: Iterable[Tuple[Any, Dict[str, Any]]],
+    text_extractor: Callable[[Any], str],
+    ocr_concurrency: int = 4,
+    llm_concurrency: int = 8,
+    on_result: Optional[Callable[[int, Dict[str, Any], Optional[LegalCaseExtraction]], None]] = None,
+    llm_batch_size: int = 4,
+    batch_flush_s: float = 0.2,
+) -> List[Optional[LegalCaseExtraction]]:
+    """
+    Pipelined text extraction -> AI extraction over many documents.
+    
+    Text extraction (PDF parsing / OCR) and LLM extraction run as two stages
+    connected by a bounded queue, so the LLM call for one document overlaps
+    with text extraction of the next ones. ocr_concurrency producers pull from
+    documents lazily and block on the full queue, so only a bounded number of
+    sources and extracted texts are held at once, however long the input is.
+    
+    LLM workers take micro-batches of up to llm_batch_size documents from the
+    queue (flushed after batch_flush_s when fewer are ready) and run them with
+    _aextract_pipeline_batch (chain.abatch() when OpenAI is primary), reporting
+    each document as soon as its own extraction finishes.
+    
+    Args:
+        documents: Iterable of (source, case_info) pairs; source is whatever
+            text_extractor accepts (e.g. PDF bytes or a file path)
+        text_extractor: Blocking callable turning a source into plain text
+        ocr_concurrency: Maximum concurrent text extractions
+        llm_concurrency: Maximum concurrent LLM requests
+        on_result: Optional callback(index, case_info, result) invoked as each
+            document finishes, in completion order
+        llm_batch_size: Maximum documents per LLM micro-batch (capped at llm_concurrency)
+        batch_flush_s: How long a worker waits to fill a micro-batch
+        
+    Returns:
+        One result per input document, in input order (None where any stage failed)
+    """
+    llm_batch_size = max(1, min(llm_batch_size, llm_concurrency))
+    num_workers = max(1, llm_concurrency // llm_batch_size)
+    
+    start_time = time.time()
+    logger.info(f"[Pipeline] Extracting documents (ocr_concurrency={ocr_concurrency}, "
+                f"llm_concurrency={llm_concurrency}, llm_batch_size={llm_batch_size})")
+    
+    loop = asyncio.get_running_loop()
+    text_queue: asyncio.Queue = asyncio.Queue(maxsize=llm_concurrency * 2)
+    results: Dict[int, Optional[LegalCaseExtraction]] = {}
+    doc_iter = enumerate(documents)
+    total = 0
+    
+    async def text_producer() -> None:
+        nonlocal total
+        # Producers share one iterator; next() never yields to the loop, so each document is taken once
+        for idx, (source, case_info) in doc_iter:
+            total += 1
+            text = None
+            try:
+                text = await asyncio.to_thread(text_extractor, source)
+            except Exception as e:
+                logger.error(f"❌ [Pipeline] Text extraction failed for "
+                             f"{case_info.get('case_number', 'Unknown')}: {e}")
+            source = None  # don't hold the input while waiting for queue space
+            await text_queue.put((idx, case_info, text))
+    
+    async def next_batch() -> Tuple[List[Tuple[int, Dict[str, Any], Optional[str]]], bool]:
+        """Up to llm_batch_size queued items, and whether the end sentinel was reached."""
+        item = await text_queue.get()
+        if item is None:
+            return [], True
+        batch = [item]
+        deadline = loop.time() + batch_flush_s
+        while len(batch) < llm_batch_size:
+            try:
+                item = text_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(text_queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+    
+    async def llm_worker() -> None:
+        finished = False
+        while not finished:
+            batch, finished = await next_batch()
+            unreported = {idx: case_info for idx, case_info, _ in batch}
+            
+            def report(idx: int) -> None:
+                case_info = unreported.pop(idx)
+                if on_result:
+                    try:
+                        on_result(idx, case_info, results.get(idx))
+                    except Exception as e:
+                        logger.error(f"❌ [Pipeline] on_result failed for "
+                                     f"{case_info.get('case_number', 'Unknown')}: {e}")
+            
+            ready = []
+            for idx, case_info, text in batch:
+                if text:
+                    ready.append((idx, case_info, text))
+                else:
+                    report(idx)
+            try:
+                async for n, result in _aextract_pipeline_batch([(text, case_info) for _, case_info, text in ready]):
+                    idx = ready[n][0]
+                    results[idx] = result
+                    report(idx)
+            except Exception as e:
+                logger.error(f"❌ [Pipeline] AI extraction failed for "
+                             f"{', '.join(str(info.get('case_number', 'Unknown')) for info in unreported.values())}: {e}")
+            for idx in list(unreported):
+                report(idx)
+    
+    workers = [asyncio.create_task(llm_worker()) for _ in range(num_workers)]
+    producers = [asyncio.create_task(text_producer()) for _ in range(ocr_concurrency)]
+    try:
+        await asyncio.gather(*producers)
+    finally:
+        for task in producers:
+            task.cancel()
+        for _ in workers:
+            await text_queue.put(None)
+        await asyncio.gather(*workers)
+    
+    ordered = [results.get(i) for i in range(total)]
+    succeeded = sum(1 for r in ordered if r is not None)
+    logger.info(f"[Pipeline] Complete: {succeeded}/{total} succeeded in {time.time() - start_time:.2f}s")
+    return ordered
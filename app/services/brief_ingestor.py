@@ -4,24 +4,102 @@ Similar architecture to case_ingestor.py but adapted for briefs
 Implements multi-strategy case linking and brief chaining
 """
 
+import io
 import os
 import logging
 import re
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple, Any
 from datetime import datetime
+import orjson
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
-from ..pdf_parser import extract_text_from_pdf, clean_pdf_text, get_pdf_metadata
+from ..pdf_parser import extract_text_from_pdf, extract_text_from_pdf_parallel, clean_pdf_text, get_pdf_metadata
 from ..chunker import LegalTextChunker
 from .word_processor import WordProcessor
 from .phrase_extractor import PhraseExtractor
 from .sentence_processor import SentenceProcessor
-from .embedding_service import generate_embedding, generate_embeddings_batch
+from .embedding_service import generate_embedding, generate_embeddings_batch_with_provider
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT statement; keeps bind parameters well under
+# Postgres' 65535-per-statement limit for the widest row templates here
+_INSERT_BATCH_ROWS = 500
+
+_PARAM_RE = re.compile(r':(\w+)')
+
+# Texts per embedding request, and how many requests may run ahead of the inserts
+_EMBED_BATCH_SIZE = 32
+_EMBED_PREFETCH = 4
+
+
+def _vector_literal(embedding: Optional[List[float]]) -> Optional[str]:
+    """
+    pgvector text literal for CAST(:embedding AS vector). Its '[x,y,...]' format
+    is a compact JSON array, so orjson builds it in C (~20x faster than
+    joining str() of every float) with the same shortest round-trip digits.
+    """
+    return orjson.dumps(embedding).decode() if embedding else None
+
+# Patterns used per brief / per chunk, compiled once at import
+_YEAR_DIR_RE = re.compile(r'\d{4}-briefs')
+_LEADING_DIGITS_RE = re.compile(r'^(\d+)')
+_WORD_RE = re.compile(r'\b\w+\b')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+\s+')
+_TOA_RE = re.compile(r'TABLE OF (AUTHORITIES|CASES|CONTENTS).*?(?=\n[A-Z]{2,}|\Z)', re.IGNORECASE | re.DOTALL)
+# "Citation Name, 123 Wn.2d 456 .......... 5, 10, 15"
+_TOA_CITATION_RE = re.compile(
+    r'([^,\n]+(?:Wn\.2d|Wn\. App\.|P\.2d|P\.3d|F\.2d|F\.3d|U\.S\.|S\.Ct\.)[^\.]+)\.*\s*(\d+(?:,\s*\d+)*)'
+)
+
+# Brief section keywords, in priority order (first section with any keyword present wins).
+# Keywords containing another keyword of the same section are left out ('statement of
+# facts' -> 'facts', 'issues presented' -> 'issues'): they can never change the result.
+# Plain `in` checks beat both one alternation regex and an Aho-Corasick automaton
+# for a keyword set this small.
+_SECTION_KEYWORDS = (
+    ('TABLE_OF_AUTHORITIES', ('table of authorities', 'table of cases', 'authorities cited')),
+    ('STATEMENT_OF_CASE', ('statement of the case', 'procedural history')),
+    ('STATEMENT_OF_FACTS', ('facts', 'background')),
+    ('ISSUES', ('issues', 'questions presented')),
+    ('ARGUMENT', ('argument', 'discussion', 'analysis')),
+    ('CONCLUSION', ('conclusion', 'prayer for relief', 'relief requested')),
+)
+
+
+def _insert_many(conn, insert_sql: str, row_sql: str, rows: List[Dict[str, Any]]) -> List:
+    """
+    Insert rows with one multi-row INSERT ... VALUES (...),(...) statement per
+    _INSERT_BATCH_ROWS rows instead of one statement per row.
+    
+    Args:
+        conn: Open connection (caller owns the transaction)
+        insert_sql: Statement with a {values} slot, e.g.
+            "INSERT INTO t (a, b) VALUES {values} RETURNING id"
+        row_sql: One VALUES tuple with :name placeholders, e.g. "(:a, :b)"
+        rows: One parameter dict per row, keyed by the placeholder names
+        
+    Returns:
+        Rows produced by a RETURNING clause (empty list if there is none)
+    """
+    returned = []
+    for start in range(0, len(rows), _INSERT_BATCH_ROWS):
+        batch = rows[start:start + _INSERT_BATCH_ROWS]
+        params = {}
+        values = []
+        for i, row in enumerate(batch):
+            values.append(_PARAM_RE.sub(lambda m: f":{m.group(1)}_{i}", row_sql))
+            params.update({f"{key}_{i}": value for key, value in row.items()})
+        result = conn.execute(text(insert_sql.format(values=",".join(values))), params)
+        if result.returns_rows:
+            returned.extend(result.fetchall())
+    return returned
+
+
 class BriefIngestor:
     """
     Ingests legal briefs into the database with:
@@ -37,6 +115,8 @@ class BriefIngestor:
         self.word_processor = WordProcessor(db_engine)
         self.phrase_extractor = PhraseExtractor(db_engine)
         self.sentence_processor = SentenceProcessor(db_engine)
+        # Read once; every embedding call for this ingestor uses the same provider preference
+        self.use_ollama = os.getenv("USE_OLLAMA", "false").lower() == "true"
     
     def ingest_pdf_brief(self, file_path: str, year: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -63,68 +143,82 @@ class BriefIngestor:
             logger.info("📄 Parsing PDF content...")
             with open(file_path, 'rb') as f:
                 pdf_content = f.read()
-            pages_text = extract_text_from_pdf(pdf_content)
-            full_text = "\n\n".join(pages_text)
-            full_text = clean_pdf_text(full_text)
-            logger.info(f"✅ Parsed {len(pages_text)} pages, {len(full_text)} characters")
-            
-            # Step 3: Insert brief record with multi-strategy case linking
-            logger.info("💾 Creating brief record with case linking...")
-            brief_id, case_id = self._insert_brief(metadata, full_text, len(pages_text))
-            
-            if case_id:
-                logger.info(f"✅ Linked to case_id: {case_id}")
+            # BRIEF_PDF_WORKERS > 1 extracts pages in that many worker processes
+            pdf_workers = int(os.getenv("BRIEF_PDF_WORKERS", "1"))
+            if pdf_workers > 1:
+                pages_text = extract_text_from_pdf_parallel(pdf_content, num_workers=pdf_workers)
             else:
-                logger.warning(f"⚠️ Could not link to case - will remain orphaned")
-            
-            # Step 4: Detect brief chaining (responds_to_brief_id)
-            logger.info("🔗 Detecting brief chaining...")
-            self._detect_brief_chaining(brief_id, metadata['case_file_id'], metadata['brief_type'])
-            
-            # Step 5: Create chunks for RAG
-            logger.info("📄 Creating text chunks...")
-            chunks = self.text_chunker.chunk_pages(pages_text)
-            logger.info(f"✅ Created {len(chunks)} text chunks")
-            
-            # Step 6: Insert chunks with section detection
-            logger.info("📦 Inserting chunks with embeddings...")
-            chunk_ids = self._insert_chunks(brief_id, case_id, chunks)
-            logger.info(f"✅ Inserted {len(chunk_ids)} chunks")
-            
-            # Step 7: Process sentences
-            # TEMPORARILY DISABLED - too slow with Ollama (generates embeddings per sentence)
-            # logger.info("✂️ Processing sentences...")
-            # sentence_stats = self._process_sentences(brief_id, chunks, chunk_ids)
-            # logger.info(f"✅ Processed {sentence_stats['total_sentences']} sentences")
-            sentence_stats = {'total_sentences': 0}
-            
-            # Step 8: Process words for precise search
-            # TEMPORARILY DISABLED - performance optimization
-            # logger.info("📝 Processing words...")
-            # word_stats = self._process_words(brief_id, chunks, chunk_ids)
-            # logger.info(f"✅ Processed {word_stats['total_words']} words")
-            word_stats = {'total_words': 0}
-            
-            # Step 9: Extract phrases
-            logger.info("🔤 Extracting legal phrases...")
-            phrase_stats = self._extract_phrases(brief_id, chunks)
-            logger.info(f"✅ Extracted {phrase_stats['phrases_inserted']} phrases")
-            
-            # Step 10: Generate full brief embedding
-            logger.info("🌟 Generating brief embedding...")
-            use_ollama = os.getenv("USE_OLLAMA", "false").lower() == "true"
-            brief_embedding = generate_embedding(full_text[:8000], prefer_ollama=use_ollama)  # Limit to first 8000 chars
-            self._update_brief_embedding(brief_id, brief_embedding)
-            logger.info("✅ Generated brief embedding")
-            
-            # Step 11: Extract Table of Authorities (TOA)
-            logger.info("📚 Extracting Table of Authorities...")
-            toa_stats = self._extract_toa(brief_id, full_text)
-            logger.info(f"✅ Extracted {toa_stats['citations_found']} citations from TOA")
-            
-            # Step 12: Update processing status
-            self._update_processing_status(brief_id, 'completed')
+                pages_text = extract_text_from_pdf(pdf_content)
+            # The raw PDF bytes are not needed past this point; don't keep them
+            # resident for the rest of the ingestion
+            del pdf_content
+            full_text = clean_pdf_text("\n\n".join(pages_text))
+            logger.info(f"✅ Parsed {len(pages_text)} pages, {len(full_text)} characters")
             
+            # Steps 3-12 run in one transaction: a single commit per brief, and a
+            # failure part-way leaves no partially ingested brief behind
+            with self.db.begin() as conn:
+                if os.getenv("BRIEF_ASYNC_COMMIT", "false").lower() == "true":
+                    # Don't wait for the WAL flush on commit; a crash can lose the most
+                    # recent briefs (they can be re-ingested), never corrupt them
+                    conn.execute(text("SET LOCAL synchronous_commit = off"))
+                
+                # Step 3: Insert brief record with multi-strategy case linking
+                logger.info("💾 Creating brief record with case linking...")
+                brief_id, case_id = self._insert_brief(conn, metadata, full_text, len(pages_text))
+                
+                if case_id:
+                    logger.info(f"✅ Linked to case_id: {case_id}")
+                else:
+                    logger.warning(f"⚠️ Could not link to case - will remain orphaned")
+                
+                # Step 4: Detect brief chaining (responds_to_brief_id)
+                logger.info("🔗 Detecting brief chaining...")
+                self._detect_brief_chaining(conn, brief_id, metadata['case_file_id'], metadata['brief_type'])
+                
+                # Step 5: Create chunks for RAG
+                logger.info("📄 Creating text chunks...")
+                chunks = self.text_chunker.chunk_pages(pages_text)
+                logger.info(f"✅ Created {len(chunks)} text chunks")
+                
+                # Step 6: Insert chunks with section detection
+                logger.info("📦 Inserting chunks with embeddings...")
+                chunk_ids = self._insert_chunks(conn, brief_id, case_id, chunks)
+                logger.info(f"✅ Inserted {len(chunk_ids)} chunks")
+                
+                # Step 7: Process sentences
+                # TEMPORARILY DISABLED - too slow with Ollama (generates embeddings per sentence)
+                # logger.info("✂️ Processing sentences...")
+                # sentence_stats = self._process_sentences(conn, brief_id, chunks, chunk_ids)
+                # logger.info(f"✅ Processed {sentence_stats['total_sentences']} sentences")
+                sentence_stats = {'total_sentences': 0}
+                
+                # Step 8: Process words for precise search
+                # TEMPORARILY DISABLED - performance optimization
+                # logger.info("📝 Processing words...")
+                # word_stats = self._process_words(conn, brief_id, chunks, chunk_ids)
+                # logger.info(f"✅ Processed {word_stats['total_words']} words")
+                word_stats = {'total_words': 0}
+                
+                # Step 9: Extract phrases
+                logger.info("🔤 Extracting legal phrases...")
+                phrase_stats = self._extract_phrases(conn, brief_id, chunks)
+                logger.info(f"✅ Extracted {phrase_stats['phrases_inserted']} phrases")
+                
+                # Step 10: Generate full brief embedding
+                logger.info("🌟 Generating brief embedding...")
+                brief_embedding = generate_embedding(full_text[:8000], prefer_ollama=self.use_ollama)  # Limit to first 8000 chars
+                self._update_brief_embedding(conn, brief_id, brief_embedding)
+                logger.info("✅ Generated brief embedding")
+                
+                # Step 11: Extract Table of Authorities (TOA)
+                logger.info("📚 Extracting Table of Authorities...")
+                toa_stats = self._extract_toa(conn, brief_id, full_text)
+                logger.info(f"✅ Extracted {toa_stats['citations_found']} citations from TOA")
+                
+                # Step 12: Update processing status
+                self._update_processing_status(conn, brief_id, 'completed')
+                
             result = {
                 'brief_id': brief_id,
                 'case_id': case_id,
@@ -166,7 +260,7 @@ class BriefIngestor:
         
         for part in parts:
             # Look for year pattern: "2024-briefs"
-            if re.match(r'\d{4}-briefs', part):
+            if _YEAR_DIR_RE.match(part):
                 year = int(part.split('-')[0])
                 break
         
@@ -174,7 +268,7 @@ class BriefIngestor:
         # Format: "860861_Appellants_8505.pdf" → "86086-1"
         # Take first 6 digits, format as XXXXX-X
         case_file_id = None
-        filename_digits = re.match(r'^(\d+)', filename)
+        filename_digits = _LEADING_DIGITS_RE.match(filename)
         if filename_digits:
             digits = filename_digits.group(1)
             if len(digits) >= 5:
@@ -238,66 +332,61 @@ class BriefIngestor:
             'year': year
         }
     
-    def _insert_brief(self, metadata: Dict[str, str], full_text: str, page_count: int) -> Tuple[int, Optional[int]]:
+    def _insert_brief(self, conn, metadata: Dict[str, str], full_text: str, page_count: int) -> Tuple[int, Optional[int]]:
         """
         Insert brief record with case linking via folder case_file_id
         
         Returns:
             (brief_id, case_id) - case_id is None if linking failed
         """
-        with self.db.connect() as conn:
-            trans = conn.begin()
+        try:
+            folder_case_id = metadata['case_file_id']
             
-            try:
-                folder_case_id = metadata['case_file_id']
-                
-                # Link to case via folder case_file_id
-                case_id = self._link_to_case(conn, folder_case_id)
-                
-                # Extract summary (first 500 chars)
-                summary = full_text[:500] if full_text else None
-                
-                # Insert brief
-                insert_query = text("""
-                    INSERT INTO briefs (
-                        case_id, case_file_id,
-                        brief_type, filing_party,
-                        page_count, word_count,
-                        summary, full_text, source_file, source_file_path, year,
-                        processing_status, extraction_timestamp
-                    ) VALUES (
-                        :case_id, :case_file_id,
-                        :brief_type, :filing_party,
-                        :page_count, :word_count,
-                        :summary, :full_text, :source_file, :source_file_path, :year,
-                        'processing', NOW()
-                    )
-                    RETURNING brief_id
-                """)
-                
-                result = conn.execute(insert_query, {
-                    'case_id': case_id,
-                    'case_file_id': folder_case_id,
-                    'brief_type': metadata['brief_type'],
-                    'filing_party': metadata['filing_party'],
-                    'page_count': page_count,
-                    'word_count': len(full_text.split()) if full_text else 0,
-                    'summary': summary,
-                    'full_text': full_text,
-                    'source_file': metadata['source_file'],
-                    'source_file_path': metadata['source_file_path'],
-                    'year': metadata.get('year')
-                })
-                
-                brief_id = result.fetchone()[0]
-                trans.commit()
-                
-                return brief_id, case_id
-                
-            except Exception as e:
-                trans.rollback()
-                logger.error(f"Failed to insert brief: {str(e)}")
-                raise
+            # Link to case via folder case_file_id
+            case_id = self._link_to_case(conn, folder_case_id)
+            
+            # Extract summary (first 500 chars)
+            summary = full_text[:500] if full_text else None
+            
+            # Insert brief
+            insert_query = text("""
+                INSERT INTO briefs (
+                    case_id, case_file_id,
+                    brief_type, filing_party,
+                    page_count, word_count,
+                    summary, full_text, source_file, source_file_path, year,
+                    processing_status, extraction_timestamp
+                ) VALUES (
+                    :case_id, :case_file_id,
+                    :brief_type, :filing_party,
+                    :page_count, :word_count,
+                    :summary, :full_text, :source_file, :source_file_path, :year,
+                    'processing', NOW()
+                )
+                RETURNING brief_id
+            """)
+            
+            result = conn.execute(insert_query, {
+                'case_id': case_id,
+                'case_file_id': folder_case_id,
+                'brief_type': metadata['brief_type'],
+                'filing_party': metadata['filing_party'],
+                'page_count': page_count,
+                'word_count': len(full_text.split()) if full_text else 0,
+                'summary': summary,
+                'full_text': full_text,
+                'source_file': metadata['source_file'],
+                'source_file_path': metadata['source_file_path'],
+                'year': metadata.get('year')
+            })
+            
+            brief_id = result.fetchone()[0]
+            
+            return brief_id, case_id
+            
+        except Exception as e:
+            logger.error(f"Failed to insert brief: {str(e)}")
+            raise
     
     def _link_to_case(self, conn, folder_case_id: str) -> Optional[int]:
         """
@@ -323,7 +412,7 @@ class BriefIngestor:
         logger.warning(f"⚠️ No case match for folder '{folder_case_id}'")
         return None
     
-    def _detect_brief_chaining(self, brief_id: int, case_file_id: str, brief_type: str):
+    def _detect_brief_chaining(self, conn, brief_id: int, case_file_id: str, brief_type: str):
         """
         Detect if this brief responds to a previous brief (conversation tracking)
         
@@ -331,10 +420,10 @@ class BriefIngestor:
         - Response brief responds to Opening brief
         - Reply brief responds to Response brief
         """
-        with self.db.connect() as conn:
-            trans = conn.begin()
-            
-            try:
+        try:
+            # Savepoint: a failure here rolls back only the chaining update,
+            # not the rest of the brief's transaction
+            with conn.begin_nested():
                 responds_to = None
                 sequence = 1
                 
@@ -381,45 +470,71 @@ class BriefIngestor:
                     'sequence': sequence
                 })
                 
-                trans.commit()
-                
                 if responds_to:
                     logger.info(f"✅ Brief chain detected: brief {brief_id} responds to brief {responds_to}")
                 
-            except Exception as e:
-                trans.rollback()
-                logger.error(f"Failed to detect brief chaining: {str(e)}")
+        except Exception as e:
+            logger.error(f"Failed to detect brief chaining: {str(e)}")
     
-    def _insert_chunks(self, brief_id: int, case_id: Optional[int], chunks: List) -> List[str]:
-        """Insert chunks with section detection and embeddings (batched for performance)"""
-        chunk_ids = []
-        use_ollama = os.getenv("USE_OLLAMA", "false").lower() == "true"
-        
-        # Generate all embeddings in one batch call (much faster)
-        chunk_texts = [chunk.text for chunk in chunks]
-        embeddings = generate_embeddings_batch(chunk_texts, prefer_ollama=use_ollama)
+    def _embed_batches(self, texts: List[str]):
+        """
+        Yield (start, embeddings) for consecutive slices of texts.
         
-        with self.db.connect() as conn:
-            trans = conn.begin()
-            
+        Embedding requests run on a worker thread up to _EMBED_PREFETCH slices
+        ahead of the caller, so the next batches are being embedded while the
+        caller inserts the current one on its own connection. Every slice is
+        embedded with the provider that embedded the first one, so the vectors
+        stay comparable even when the preferred provider fails part-way.
+        """
+        if not texts:
+            return
+        
+        # Slices run one at a time on the single worker, so each sees the previous pick
+        provider = None
+        
+        def embed(start: int) -> List:
+            nonlocal provider
+            provider, embeddings = generate_embeddings_batch_with_provider(
+                texts[start:start + _EMBED_BATCH_SIZE],
+                prefer_ollama=self.use_ollama,
+                batch_size=_EMBED_BATCH_SIZE,
+                provider=provider
+            )
+            return embeddings
+        
+        starts = iter(range(0, len(texts), _EMBED_BATCH_SIZE))
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="brief-embed") as executor:
             try:
-                for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
+                for start in starts:
+                    pending.append((start, executor.submit(embed, start)))
+                    if len(pending) >= _EMBED_PREFETCH:
+                        break
+                while pending:
+                    start, future = pending.popleft()
+                    embeddings = future.result()
+                    next_start = next(starts, None)
+                    if next_start is not None:
+                        pending.append((next_start, executor.submit(embed, next_start)))
+                    yield start, embeddings
+            finally:
+                # Caller stopped early (e.g. an insert failed): drop queued requests
+                for _, future in pending:
+                    future.cancel()
+    
+    def _insert_chunks(self, conn, brief_id: int, case_id: Optional[int], chunks: List) -> List[str]:
+        """Insert chunks with section detection and embeddings (embedding overlaps the inserts)"""
+        chunk_ids = []
+        
+        try:
+            for start, embeddings in self._embed_batches([chunk.text for chunk in chunks]):
+                rows = []
+                for i, (chunk, embedding) in enumerate(zip(chunks[start:start + len(embeddings)], embeddings), start):
                     section = self._determine_section(chunk.text)
                     
-                    embedding_str = f"[{','.join(map(str, embedding))}]" if embedding else None
+                    embedding_str = _vector_literal(embedding)
                     
-                    insert_query = text("""
-                        INSERT INTO brief_chunks (
-                            brief_id, case_id, chunk_order, text, section,
-                            word_count, char_count, embedding
-                        ) VALUES (
-                            :brief_id, :case_id, :chunk_order, :text, :section,
-                            :word_count, :char_count, CAST(:embedding AS vector)
-                        )
-                        RETURNING chunk_id
-                    """)
-                    
-                    result = conn.execute(insert_query, {
+                    rows.append({
                         'brief_id': brief_id,
                         'case_id': case_id,
                         'chunk_order': i,
@@ -429,16 +544,24 @@ class BriefIngestor:
                         'char_count': len(chunk.text),
                         'embedding': embedding_str
                     })
-                    
-                    chunk_id = result.fetchone()[0]
-                    chunk_ids.append(chunk_id)
                 
-                trans.commit()
+                returned = _insert_many(conn, """
+                    INSERT INTO brief_chunks (
+                        brief_id, case_id, chunk_order, text, section,
+                        word_count, char_count, embedding
+                    ) VALUES {values}
+                    RETURNING chunk_id, chunk_order
+                """, """(
+                        :brief_id, :case_id, :chunk_order, :text, :section,
+                        :word_count, :char_count, CAST(:embedding AS vector)
+                    )""", rows)
                 
-            except Exception as e:
-                trans.rollback()
-                logger.error(f"Failed to insert chunks: {str(e)}")
-                raise
+                # Order by chunk_order rather than relying on RETURNING row order
+                chunk_ids.extend(row[0] for row in sorted(returned, key=lambda row: row[1]))
+            
+        except Exception as e:
+            logger.error(f"Failed to insert chunks: {str(e)}")
+            raise
         
         return chunk_ids
     
@@ -447,186 +570,156 @@ class BriefIngestor:
         text_lower = text.lower()
         
         # Brief-specific sections
-        if any(word in text_lower for word in ['table of authorities', 'table of cases', 'authorities cited']):
-            return 'TABLE_OF_AUTHORITIES'
-        elif any(word in text_lower for word in ['statement of the case', 'procedural history']):
-            return 'STATEMENT_OF_CASE'
-        elif any(word in text_lower for word in ['statement of facts', 'facts', 'background']):
-            return 'STATEMENT_OF_FACTS'
-        elif any(word in text_lower for word in ['issues presented', 'questions presented', 'issues']):
-            return 'ISSUES'
-        elif any(word in text_lower for word in ['argument', 'discussion', 'analysis']):
-            return 'ARGUMENT'
-        elif any(word in text_lower for word in ['conclusion', 'prayer for relief', 'relief requested']):
-            return 'CONCLUSION'
-        else:
-            return 'GENERAL'
+        for section, keywords in _SECTION_KEYWORDS:
+            if any(word in text_lower for word in keywords):
+                return section
+        return 'GENERAL'
     
-    def _process_sentences(self, brief_id: int, chunks: List, chunk_ids: List[str]) -> Dict[str, int]:
+    def _process_sentences(self, conn, brief_id: int, chunks: List, chunk_ids: List[str]) -> Dict[str, int]:
         """Process chunks into sentences with embeddings"""
         total_sentences = 0
-        use_ollama = os.getenv("USE_OLLAMA", "false").lower() == "true"
         
-        with self.db.connect() as conn:
-            trans = conn.begin()
+        # Collect sentences first so their embeddings are generated in batched requests
+        pending = []
+        for chunk, chunk_id in zip(chunks, chunk_ids):
+            # Split into sentences (simple approach)
+            sentences = _SENTENCE_SPLIT_RE.split(chunk.text)
             
-            try:
-                for chunk, chunk_id in zip(chunks, chunk_ids):
-                    # Split into sentences (simple approach)
-                    sentences = re.split(r'[.!?]+\s+', chunk.text)
+            for pos, sentence in enumerate(sentences):
+                if len(sentence.strip()) < 10:  # Skip very short sentences
+                    continue
+                pending.append((chunk_id, pos, sentence))
+        
+        try:
+            for start, embeddings in self._embed_batches([sentence for _, _, sentence in pending]):
+                rows = []
+                for (chunk_id, pos, sentence), embedding in zip(pending[start:start + len(embeddings)], embeddings):
+                    embedding_str = _vector_literal(embedding)
                     
-                    for pos, sentence in enumerate(sentences):
-                        if len(sentence.strip()) < 10:  # Skip very short sentences
-                            continue
-                        
-                        # Generate embedding
-                        embedding = generate_embedding(sentence, prefer_ollama=use_ollama)
-                        embedding_str = f"[{','.join(map(str, embedding))}]" if embedding else None
-                        
-                        insert_query = text("""
-                            INSERT INTO brief_sentences (
-                                brief_id, chunk_id, text, position, word_count, embedding
-                            ) VALUES (
-                                :brief_id, :chunk_id, :text, :position, :word_count, CAST(:embedding AS vector)
-                            )
-                        """)
-                        
-                        conn.execute(insert_query, {
-                            'brief_id': brief_id,
-                            'chunk_id': chunk_id,
-                            'text': sentence.strip(),
-                            'position': pos,
-                            'word_count': len(sentence.split()),
-                            'embedding': embedding_str
-                        })
-                        
-                        total_sentences += 1
-                
-                trans.commit()
+                    rows.append({
+                        'brief_id': brief_id,
+                        'chunk_id': chunk_id,
+                        'text': sentence.strip(),
+                        'position': pos,
+                        'word_count': len(sentence.split()),
+                        'embedding': embedding_str
+                    })
                 
-            except Exception as e:
-                trans.rollback()
-                logger.error(f"Failed to process sentences: {str(e)}")
-                raise
+                _insert_many(conn, """
+                    INSERT INTO brief_sentences (
+                        brief_id, chunk_id, text, position, word_count, embedding
+                    ) VALUES {values}
+                """, "(:brief_id, :chunk_id, :text, :position, :word_count, CAST(:embedding AS vector))", rows)
+                total_sentences += len(rows)
+            
+        except Exception as e:
+            logger.error(f"Failed to process sentences: {str(e)}")
+            raise
         
         return {'total_sentences': total_sentences}
     
-    def _process_words(self, brief_id: int, chunks: List, chunk_ids: List[str]) -> Dict[str, int]:
+    def _process_words(self, conn, brief_id: int, chunks: List, chunk_ids: List[str]) -> Dict[str, int]:
         """Process words for word-level indexing (reuses word_dictionary)"""
         total_words = 0
         
-        with self.db.connect() as conn:
-            trans = conn.begin()
+        try:
+            # Tokenize every chunk first, keeping each word's position
+            chunk_words = []
+            for chunk, chunk_id in zip(chunks, chunk_ids):
+                words = _WORD_RE.findall(chunk.text.lower())
+                # Skip very short words
+                chunk_words.append((chunk_id, [(pos, word) for pos, word in enumerate(words) if len(word) >= 3]))
             
-            try:
-                for chunk, chunk_id in zip(chunks, chunk_ids):
-                    words = re.findall(r'\b\w+\b', chunk.text.lower())
-                    
-                    for pos, word in enumerate(words):
-                        if len(word) < 3:  # Skip very short words
-                            continue
-                        
-                        # Get or create word_id
-                        word_query = text("""
-                            INSERT INTO word_dictionary (word)
-                            VALUES (:word)
-                            ON CONFLICT (word) DO UPDATE SET word = EXCLUDED.word
-                            RETURNING word_id
-                        """)
-                        
-                        result = conn.execute(word_query, {'word': word})
-                        word_id = result.fetchone()[0]
-                        
-                        # Insert word occurrence
-                        occur_query = text("""
-                            INSERT INTO brief_word_occurrence (brief_id, chunk_id, word_id, position)
-                            VALUES (:brief_id, :chunk_id, :word_id, :position)
-                            ON CONFLICT (chunk_id, word_id, position) DO NOTHING
-                        """)
-                        
-                        conn.execute(occur_query, {
-                            'brief_id': brief_id,
-                            'chunk_id': chunk_id,
-                            'word_id': word_id,
-                            'position': pos
-                        })
-                        
-                        total_words += 1
-                
-                trans.commit()
-                
-            except Exception as e:
-                trans.rollback()
-                logger.error(f"Failed to process words: {str(e)}")
-                raise
+            # Get or create all word_ids with two statements: one bulk upsert of the
+            # distinct words (sorted, so concurrent ingestions lock rows in the same
+            # order) and one lookup
+            distinct_words = sorted({word for _, words in chunk_words for _, word in words})
+            conn.execute(text("""
+                INSERT INTO word_dictionary (word)
+                SELECT unnest(CAST(:words AS text[]))
+                ON CONFLICT (word) DO NOTHING
+            """), {'words': distinct_words})
+            word_ids = dict(conn.execute(text("""
+                SELECT word, word_id FROM word_dictionary WHERE word = ANY(:words)
+            """), {'words': distinct_words}).fetchall())
+            
+            occurrences = io.StringIO()
+            for chunk_id, words in chunk_words:
+                for pos, word in words:
+                    occurrences.write(f"{brief_id}\t{chunk_id}\t{word_ids[word]}\t{pos}\n")
+                total_words += len(words)
+            
+            # Stream all occurrences with one COPY instead of one INSERT per word.
+            # The chunks were just inserted, so (chunk_id, word_id, position) can't
+            # already exist and the old ON CONFLICT DO NOTHING isn't needed.
+            occurrences.seek(0)
+            with conn.connection.cursor() as cursor:
+                cursor.copy_expert(
+                    "COPY brief_word_occurrence (brief_id, chunk_id, word_id, position) FROM STDIN",
+                    occurrences
+                )
+            
+        except Exception as e:
+            logger.error(f"Failed to process words: {str(e)}")
+            raise
         
         return {'total_words': total_words}
     
-    def _extract_phrases(self, brief_id: int, chunks: List) -> Dict[str, int]:
+    def _extract_phrases(self, conn, brief_id: int, chunks: List) -> Dict[str, int]:
         """Extract legal phrases (2-5 grams)"""
         phrases_inserted = 0
-        phrase_counts = {}
+        phrase_counts = Counter()
         
         # Extract phrases from all chunks
         for chunk in chunks:
-            words = re.findall(r'\b\w+\b', chunk.text.lower())
+            words = _WORD_RE.findall(chunk.text.lower())
             
-            # Extract 2-5 grams
+            # Extract 2-5 grams (Counter.update does the counting loop in C). Grams are
+            # counted as word tuples; only the few kept below are joined into strings.
             for n in range(2, 6):
-                for i in range(len(words) - n + 1):
-                    phrase = ' '.join(words[i:i+n])
-                    phrase_counts[phrase] = phrase_counts.get(phrase, 0) + 1
+                phrase_counts.update(zip(*[words[i:] for i in range(n)]))
         
         # Insert phrases with frequency > 1
-        with self.db.connect() as conn:
-            trans = conn.begin()
+        try:
+            rows = [
+                {
+                    'brief_id': brief_id,
+                    'phrase': ' '.join(gram),
+                    'frequency': freq,
+                    'phrase_length': len(gram)
+                }
+                for gram, freq in phrase_counts.items()
+                if freq >= 2  # Skip single occurrences
+            ]
             
-            try:
-                for phrase, freq in phrase_counts.items():
-                    if freq < 2:  # Skip single occurrences
-                        continue
-                    
-                    insert_query = text("""
-                        INSERT INTO brief_phrases (brief_id, phrase, frequency, phrase_length)
-                        VALUES (:brief_id, :phrase, :frequency, :phrase_length)
-                    """)
-                    
-                    conn.execute(insert_query, {
-                        'brief_id': brief_id,
-                        'phrase': phrase,
-                        'frequency': freq,
-                        'phrase_length': len(phrase.split())
-                    })
-                    
-                    phrases_inserted += 1
-                
-                trans.commit()
-                
-            except Exception as e:
-                trans.rollback()
-                logger.error(f"Failed to extract phrases: {str(e)}")
-                raise
+            _insert_many(conn, """
+                INSERT INTO brief_phrases (brief_id, phrase, frequency, phrase_length)
+                VALUES {values}
+            """, "(:brief_id, :phrase, :frequency, :phrase_length)", rows)
+            phrases_inserted = len(rows)
+            
+        except Exception as e:
+            logger.error(f"Failed to extract phrases: {str(e)}")
+            raise
         
         return {'phrases_inserted': phrases_inserted}
     
-    def _update_brief_embedding(self, brief_id: int, embedding: List[float]):
+    def _update_brief_embedding(self, conn, brief_id: int, embedding: List[float]):
         """Update brief with full text embedding"""
-        with self.db.connect() as conn:
-            embedding_str = f"[{','.join(map(str, embedding))}]" if embedding else None
-            
-            update_query = text("""
-                UPDATE briefs
-                SET full_embedding = CAST(:embedding AS vector)
-                WHERE brief_id = :brief_id
-            """)
-            
-            conn.execute(update_query, {
-                'brief_id': brief_id,
-                'embedding': embedding_str
-            })
-            conn.commit()
+        embedding_str = _vector_literal(embedding)
+        
+        update_query = text("""
+            UPDATE briefs
+            SET full_embedding = CAST(:embedding AS vector)
+            WHERE brief_id = :brief_id
+        """)
+        
+        conn.execute(update_query, {
+            'brief_id': brief_id,
+            'embedding': embedding_str
+        })
     
-    def _extract_toa(self, brief_id: int, full_text: str) -> Dict[str, int]:
+    def _extract_toa(self, conn, brief_id: int, full_text: str) -> Dict[str, int]:
         """
         Extract Table of Authorities (TOA) citations
         
@@ -635,8 +728,7 @@ class BriefIngestor:
         citations_found = 0
         
         # Find TOA section
-        toa_pattern = r'TABLE OF (AUTHORITIES|CASES|CONTENTS).*?(?=\n[A-Z]{2,}|\Z)'
-        match = re.search(toa_pattern, full_text, re.IGNORECASE | re.DOTALL)
+        match = _TOA_RE.search(full_text)
         
         if not match:
             logger.info("No Table of Authorities found")
@@ -645,53 +737,40 @@ class BriefIngestor:
         toa_text = match.group(0)
         
         # Extract citations with page numbers
-        # Pattern: "Citation Name, 123 Wn.2d 456 .......... 5, 10, 15"
-        citation_pattern = r'([^,\n]+(?:Wn\.2d|Wn\. App\.|P\.2d|P\.3d|F\.2d|F\.3d|U\.S\.|S\.Ct\.)[^\.]+)\.*\s*(\d+(?:,\s*\d+)*)'
-        
-        with self.db.connect() as conn:
-            trans = conn.begin()
-            
-            try:
-                for match in re.finditer(citation_pattern, toa_text):
-                    citation_text = match.group(1).strip()
-                    page_refs = [p.strip() for p in match.group(2).split(',')]
-                    
-                    insert_query = text("""
-                        INSERT INTO brief_citations (
-                            brief_id, citation_text, citation_type, from_toa, toa_page_refs
-                        ) VALUES (
-                            :brief_id, :citation_text, 'case', TRUE, :toa_page_refs
-                        )
-                    """)
-                    
-                    conn.execute(insert_query, {
-                        'brief_id': brief_id,
-                        'citation_text': citation_text,
-                        'toa_page_refs': page_refs
-                    })
-                    
-                    citations_found += 1
-                
-                trans.commit()
+        try:
+            rows = []
+            for match in _TOA_CITATION_RE.finditer(toa_text):
+                citation_text = match.group(1).strip()
+                page_refs = [p.strip() for p in match.group(2).split(',')]
                 
-            except Exception as e:
-                trans.rollback()
-                logger.error(f"Failed to extract TOA: {str(e)}")
-                raise
+                rows.append({
+                    'brief_id': brief_id,
+                    'citation_text': citation_text,
+                    'toa_page_refs': page_refs
+                })
+            
+            _insert_many(conn, """
+                INSERT INTO brief_citations (
+                    brief_id, citation_text, citation_type, from_toa, toa_page_refs
+                ) VALUES {values}
+            """, "(:brief_id, :citation_text, 'case', TRUE, :toa_page_refs)", rows)
+            citations_found = len(rows)
+            
+        except Exception as e:
+            logger.error(f"Failed to extract TOA: {str(e)}")
+            raise
         
         return {'citations_found': citations_found}
     
-    def _update_processing_status(self, brief_id: int, status: str):
+    def _update_processing_status(self, conn, brief_id: int, status: str):
         """Update brief processing status"""
-        with self.db.connect() as conn:
-            update_query = text("""
-                UPDATE briefs
-                SET processing_status = :status
-                WHERE brief_id = :brief_id
-            """)
-            
-            conn.execute(update_query, {
-                'brief_id': brief_id,
-                'status': status
-            })
-            conn.commit()
+        update_query = text("""
+            UPDATE briefs
+            SET processing_status = :status
+            WHERE brief_id = :brief_id
+        """)
+        
+        conn.execute(update_query, {
+            'brief_id': brief_id,
+            'status': status
+        })
@@ -14,6 +14,7 @@ from sqlalchemy.engine import Engine
 
 # Import our extraction and database services
 from .ai_extractor import extract_case_data, extract_all_regex, RegexExtractionResult
+from .models import LegalCaseExtraction
 from .hybrid_extractor import extract_hybrid, HybridExtractionResult
 from .database_inserter import DatabaseInserter
 
@@ -29,6 +30,19 @@ from .sentence_processor import SentenceProcessor
 
 logger = logging.getLogger(__name__)
 
+
+def case_info_from_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """The case_info passed to AI extraction for a case's CSV/batch metadata."""
+    return {
+        'case_number': metadata.get('case_number', 'Unknown'),
+        'title': metadata.get('title', metadata.get('case_title', 'Unknown')),
+        'court_level': metadata.get('court_level', 'Unknown'),
+        'division': metadata.get('division', 'Unknown'),
+        'publication': metadata.get('publication', 'Unknown'),
+        'court_info_raw': metadata.get('court_info_raw', '')
+    }
+
+
 class LegalCaseIngestor:
     """
     Complete legal case ingestor that provides:
@@ -55,7 +69,8 @@ class LegalCaseIngestor:
         metadata: Dict[str, Any],
         source_file_info: Optional[Dict[str, str]] = None,
         enable_ai_extraction: bool = False,  # Default to regex (fast)
-        extraction_mode: str = 'hybrid'  # 'hybrid' (recommended), 'regex', 'ai', or 'none'
+        extraction_mode: str = 'hybrid',  # 'hybrid' (recommended), 'regex', 'ai', or 'none'
+        extracted_data: Optional[LegalCaseExtraction] = None
     ) -> Dict[str, Any]:
         """
         Main ingestion method - processes PDF with extraction and RAG indexing.
@@ -70,6 +85,9 @@ class LegalCaseIngestor:
                 - 'regex' (fast): Regex only, some columns empty
                 - 'ai' (slow): AI only, uses older insertion method
                 - 'none': Metadata only (not recommended)
+            extracted_data: AI extraction already run for this PDF (e.g. by
+                run_extraction_pipeline); used instead of calling
+                extract_case_data in 'ai' mode
             
         Returns:
             Dictionary with ingestion results
@@ -128,17 +146,9 @@ class LegalCaseIngestor:
                 
             elif extraction_mode == 'ai':
                 # SLOW: Use AI extraction only (original method)
-                logger.info("[AI] Running AI extraction...")
-                case_info = {
-                    'case_number': metadata.get('case_number', 'Unknown'),
-                    'title': metadata.get('title', metadata.get('case_title', 'Unknown')),
-                    'court_level': metadata.get('court_level', 'Unknown'),
-                    'division': metadata.get('division', 'Unknown'),
-                    'publication': metadata.get('publication', 'Unknown'),
-                    'court_info_raw': metadata.get('court_info_raw', '')
-                }
-                
-                extracted_data = extract_case_data(full_text, case_info)
+                if extracted_data is None:
+                    logger.info("[AI] Running AI extraction...")
+                    extracted_data = extract_case_data(full_text, case_info_from_metadata(metadata))
                 
                 if extracted_data:
                     logger.info("[OK] AI extraction successful")
@@ -14,6 +14,14 @@ from .dimension_service import DimensionService
 
 logger = logging.getLogger(__name__)
 
+# Map role names to database format
+_JUDGE_ROLE_MAP = {
+    'Authored by': 'Author',
+    'Concurring': 'Concurring', 
+    'Dissenting': 'Dissenting',
+    'Joining': 'Panelist'
+}
+
 class DatabaseInserter:
     """Clean and reliable database insertion using sequential IDs"""
     
@@ -309,18 +317,10 @@ class DatabaseInserter:
                 court = EXCLUDED.court
         """)
         
-        # Map role names to database format
-        role_map = {
-            'Authored by': 'Author',
-            'Concurring': 'Concurring', 
-            'Dissenting': 'Dissenting',
-            'Joining': 'Panelist'
-        }
-        
         conn.execute(case_judge_query, {
             'case_id': case_id,
             'judge_id': judge_id,
-            'role': role_map.get(judge_data.role.value, judge_data.role.value),
+            'role': _JUDGE_ROLE_MAP.get(judge_data.role.value, judge_data.role.value),
             'court': 'Appeals Court',  # Default for family law cases
             'created_at': datetime.now()
         })
@@ -5,17 +5,17 @@ Generates embeddings for both case-level and chunk-level content
 
 import os
 import logging
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
-def local_ollama_embed(text: str, model: str = None) -> List[float]:
+@lru_cache(maxsize=4)
+def _get_ollama_embeddings(model: str, base_url: str):
     """
-    Create an embedding using a local Ollama embeddings model.
-    Default model is a 1024-dim choice to match DB schema.
-    
-    This is the EXACT same function from your working code.
+    One OllamaEmbeddings per (model, base_url), reused across calls so its
+    HTTP client keeps connections to the Ollama server alive.
     """
     try:
         # Try the new langchain-ollama package first
@@ -24,9 +24,24 @@ def local_ollama_embed(text: str, model: str = None) -> List[float]:
         # Fallback to the deprecated version
         from langchain_community.embeddings import OllamaEmbeddings
     
+    return OllamaEmbeddings(model=model, base_url=base_url)
+
+@lru_cache(maxsize=2)
+def _get_openai_client(api_key: str):
+    """One OpenAI client per API key, reused so its connection pool is shared across calls."""
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
+def local_ollama_embed(text: str, model: str = None) -> List[float]:
+    """
+    Create an embedding using a local Ollama embeddings model.
+    Default model is a 1024-dim choice to match DB schema.
+    
+    This is the EXACT same function from your working code.
+    """
     ollama_model = model or os.getenv("OLLAMA_EMBED_MODEL", "mxbai-embed-large")
     ollama_base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
-    embeddings = OllamaEmbeddings(model=ollama_model, base_url=ollama_base_url)
+    embeddings = _get_ollama_embeddings(ollama_model, ollama_base_url)
     return embeddings.embed_query(text)
 
 def local_ollama_embed_batch(texts: List[str], model: str = None) -> List[List[float]]:
@@ -41,16 +56,9 @@ def local_ollama_embed_batch(texts: List[str], model: str = None) -> List[List[f
     Returns:
         List of embedding vectors
     """
-    try:
-        # Try the new langchain-ollama package first
-        from langchain_ollama import OllamaEmbeddings
-    except ImportError:
-        # Fallback to the deprecated version
-        from langchain_community.embeddings import OllamaEmbeddings
-    
     ollama_model = model or os.getenv("OLLAMA_EMBED_MODEL", "mxbai-embed-large")
     ollama_base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
-    embeddings = OllamaEmbeddings(model=ollama_model, base_url=ollama_base_url)
+    embeddings = _get_ollama_embeddings(ollama_model, ollama_base_url)
     return embeddings.embed_documents(texts)
 
 def openai_embed(text: str, dimensions: int = 1024) -> List[float]:
@@ -59,12 +67,10 @@ def openai_embed(text: str, dimensions: int = 1024) -> List[float]:
     Server deployment can replace this with an OSS model.
     """
     try:
-        from openai import OpenAI
-        
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY not set")
-        client = OpenAI(api_key=api_key)
+        client = _get_openai_client(api_key)
         # text-embedding-3-large supports dimensions parameter
         resp = client.embeddings.create(model="text-embedding-3-large", input=text, dimensions=dimensions)
         return resp.data[0].embedding
@@ -72,6 +78,24 @@ def openai_embed(text: str, dimensions: int = 1024) -> List[float]:
         logger.warning(f"OpenAI embedding failed: {e}")
         raise
 
+def openai_embed_batch(texts: List[str], dimensions: int = 1024) -> List[List[float]]:
+    """
+    Create OpenAI embeddings for multiple texts with one /v1/embeddings request.
+    
+    Args:
+        texts: List of texts to embed
+        dimensions: Embedding dimension (must match DB schema)
+        
+    Returns:
+        List of embedding vectors, in input order
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY not set")
+    client = _get_openai_client(api_key)
+    resp = client.embeddings.create(model="text-embedding-3-large", input=texts, dimensions=dimensions)
+    return [item.embedding for item in sorted(resp.data, key=lambda item: item.index)]
+
 def generate_embedding(text: str, prefer_ollama: bool = True, ollama_only: bool = False) -> Optional[List[float]]:
     """
     Generate embedding with fallback logic.
@@ -119,26 +143,43 @@ def generate_embedding(text: str, prefer_ollama: bool = True, ollama_only: bool
     logger.error("Embedding generation failed (Ollama-only mode)")
     return None
 
-def generate_embeddings_batch(texts: List[str], prefer_ollama: bool = True, ollama_only: bool = False) -> List[Optional[List[float]]]:
+def generate_embeddings_batch(texts: List[str], prefer_ollama: bool = True, ollama_only: bool = False,
+                              batch_size: int = 32) -> List[Optional[List[float]]]:
     """
     Generate embeddings for multiple texts in batch (much faster than individual calls).
     
+    All returned vectors come from one provider: if any Ollama request fails,
+    the whole batch is re-embedded with OpenAI rather than mixing models.
+    
     Args:
         texts: List of texts to embed
         prefer_ollama: Whether to try Ollama first (default True)
         ollama_only: If True, only use Ollama (no OpenAI fallback)
+        batch_size: Number of texts sent per embedding request
         
     Returns:
         List of embedding vectors (None for failed embeddings)
     """
+    return generate_embeddings_batch_with_provider(texts, prefer_ollama, ollama_only, batch_size)[1]
+
+def generate_embeddings_batch_with_provider(texts: List[str], prefer_ollama: bool = True, ollama_only: bool = False,
+                                            batch_size: int = 32, provider: Optional[str] = None
+                                            ) -> Tuple[Optional[str], List[Optional[List[float]]]]:
+    """
+    generate_embeddings_batch() that also reports which provider ("Ollama" or
+    "OpenAI") produced the vectors (None if nothing was embedded).
+    
+    Callers embedding one document in several calls pass that name back as
+    provider= so every vector of the document comes from the same model.
+    """
     if not texts:
-        return []
+        return provider, []
     
     # Filter out empty texts
     filtered_texts = [(i, text) for i, text in enumerate(texts) if text and text.strip()]
     if not filtered_texts:
         logger.warning("All texts are empty")
-        return [None] * len(texts)
+        return provider, [None] * len(texts)
     
     indices, valid_texts = zip(*filtered_texts) if filtered_texts else ([], [])
     
@@ -146,31 +187,57 @@ def generate_embeddings_batch(texts: List[str], prefer_ollama: bool = True, olla
     if os.getenv('USE_OLLAMA', 'false').lower() == 'true':
         ollama_only = True
     
-    embeddings_result = [None] * len(texts)
-    
-    # Try Ollama batch embedding
-    if prefer_ollama or ollama_only:
+    # Vectors from different models are not comparable in one index, so every
+    # embedding returned for this call comes from a single provider
+    ollama = ("Ollama", local_ollama_embed_batch, local_ollama_embed)
+    openai = ("OpenAI", openai_embed_batch, openai_embed)
+    if provider is not None:
+        providers = [entry for entry in (ollama, openai) if entry[0] == provider]
+    else:
+        providers = []
+        if prefer_ollama or ollama_only:
+            providers.append(ollama)
+        if not ollama_only:
+            providers.append(openai)
+    if not providers:
+        raise ValueError(f"Unknown embedding provider: {provider!r}")
+    
+    attempts = []
+    for n, (name, embed_batch, embed_one) in enumerate(providers):
+        embeddings_result = [None] * len(texts)
+        attempts.append((name, embed_one, embeddings_result))
         try:
-            logger.debug(f"Attempting Ollama batch embedding for {len(valid_texts)} texts...")
-            batch_embeddings = local_ollama_embed_batch(list(valid_texts))
-            logger.debug(f"Ollama batch embedding successful, {len(batch_embeddings)} embeddings generated")
-            
-            # Map back to original indices
-            for idx, embedding in zip(indices, batch_embeddings):
-                embeddings_result[idx] = embedding
-            
-            return embeddings_result
+            logger.debug(f"Attempting {name} batch embedding for {len(valid_texts)} texts...")
+            # One request per batch_size texts instead of one per text
+            for start in range(0, len(valid_texts), batch_size):
+                batch_embeddings = embed_batch(list(valid_texts[start:start + batch_size]))
+                # Map back to original indices
+                for idx, embedding in zip(indices[start:start + batch_size], batch_embeddings):
+                    embeddings_result[idx] = embedding
+            logger.debug(f"{name} batch embedding successful, {len(valid_texts)} embeddings generated")
+            return name, embeddings_result
         except Exception as e:
-            if ollama_only:
-                logger.error(f"Ollama-only mode: batch embedding failed: {e}")
-                return embeddings_result
-            logger.warning(f"Ollama batch embedding failed: {e}, falling back to individual calls...")
-    
-    # Fallback: try individual embeddings (slower but more reliable)
+            if n + 1 < len(providers):
+                logger.warning(f"{name} batch embedding failed: {e}, "
+                               f"re-embedding all {len(valid_texts)} texts with {providers[n + 1][0]}...")
+            else:
+                logger.warning(f"{name} batch embedding failed: {e}, falling back to individual calls...")
+    
+    # Fallback: individual calls (slower but more reliable) for whatever the most
+    # complete attempt is missing, with that attempt's provider only
+    name, embed_one, embeddings_result = max(
+        attempts, key=lambda attempt: sum(embedding is not None for embedding in attempt[2])
+    )
     for idx, text in zip(indices, valid_texts):
-        embeddings_result[idx] = generate_embedding(text, prefer_ollama=prefer_ollama, ollama_only=ollama_only)
-    
-    return embeddings_result
+        if embeddings_result[idx] is None:
+            try:
+                embeddings_result[idx] = embed_one(text)
+            except Exception as e:
+                logger.error(f"{name} embedding failed: {e}")
+    
+    if not any(embedding is not None for embedding in embeddings_result):
+        name = provider
+    return name, embeddings_result
 
 def generate_case_level_embedding(title: str, summary: str = "") -> Optional[List[float]]:
     """
@@ -214,7 +281,10 @@ def generate_chunk_embeddings(chunks: List[Dict[str, Any]]) -> List[Dict[str, An
     embedding_model = os.getenv("OLLAMA_EMBED_MODEL", "mxbai-embed-large")
     embedding_timestamp = datetime.now()
     
-    for i, chunk in enumerate(chunks):
+    # Embed all chunk texts in batched requests up front
+    embeddings = generate_embeddings_batch([chunk.get('chunk_text', '') for chunk in chunks], prefer_ollama=True)
+    
+    for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
         chunk_text = chunk.get('chunk_text', '')
         if not chunk_text:
             logger.warning(f"Chunk {i} has no text, skipping embedding")
@@ -225,9 +295,6 @@ def generate_chunk_embeddings(chunks: List[Dict[str, Any]]) -> List[Dict[str, An
             enhanced_chunks.append(enhanced_chunk)
             continue
         
-        logger.debug(f"Generating embedding for chunk {i+1}/{len(chunks)}: {chunk_text[:50]}...")
-        embedding = generate_embedding(chunk_text, prefer_ollama=True)
-        
         # Add embedding info to chunk
         enhanced_chunk = chunk.copy()
         enhanced_chunk['embedding'] = embedding
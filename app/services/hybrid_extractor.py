@@ -46,6 +46,14 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# AI judge role -> ExtractedJudge role
+_JUDGE_ROLE_MAP = {
+    'Authored by': 'author',
+    'Concurring': 'concurring',
+    'Dissenting': 'dissenting',
+    'Joining': 'panelist'
+}
+
 
 @dataclass
 class HybridExtractionResult:
@@ -348,15 +356,9 @@ class HybridExtractor:
         
         # === JUDGES (AI only - not regex) ===
         for ai_judge in ai_result.appeals_judges:
-            role_map = {
-                'Authored by': 'author',
-                'Concurring': 'concurring',
-                'Dissenting': 'dissenting',
-                'Joining': 'panelist'
-            }
             result.judges.append(ExtractedJudge(
                 name=ai_judge.judge_name,
-                role=role_map.get(ai_judge.role.value, 'author')
+                role=_JUDGE_ROLE_MAP.get(ai_judge.role.value, 'author')
             ))
         result.extraction_sources['judges'] = 'ai'
         
@@ -346,7 +346,7 @@ class CaseModel(BaseModel):
     def validate_title(cls, v):
         if not v or v.strip() == '':
             raise ValueError("Case title cannot be empty")
-        title = re.sub(r'\*', '', v.strip())
+        title = v.strip().replace('*', '')
         title = re.sub(r'\s+', ' ', title)
         return title.title()
 
@@ -397,7 +397,7 @@ class JudgeModel(BaseModel):
     def validate_judge_name(cls, v):
         if not v or v.strip() == '':
             raise ValueError("Judge name cannot be empty")
-        return re.sub(r'\s+', ' ', v.strip()).title()
+        return ' '.join(v.split()).title()
 
 class AttorneyModel(BaseModel):
     """Legal attorney model"""
@@ -412,7 +412,7 @@ class AttorneyModel(BaseModel):
     def validate_attorney_name(cls, v):
         if not v or v.strip() == '':
             raise ValueError("Attorney name cannot be empty")
-        return re.sub(r'\s+', ' ', v.strip()).title()
+        return ' '.join(v.split()).title()
 
     @field_validator('representing')
     @classmethod
@@ -474,7 +474,7 @@ class PartyModel(BaseModel):
     def validate_party_name(cls, v):
         if not v or v.strip() == '':
             raise ValueError("Party name cannot be empty")
-        return re.sub(r'\s+', ' ', v.strip()).title()
+        return ' '.join(v.split()).title()
 
     @field_validator('legal_role')
     @classmethod
@@ -562,13 +562,13 @@ class IssueDecisionModel(BaseModel):
     def validate_issue_summary(cls, v):
         if not v or v.strip() == '':
             raise ValueError("Issue summary cannot be empty")
-        return re.sub(r'\s+', ' ', v.strip())
+        return ' '.join(v.split())
 
     @field_validator('decision_summary')
     @classmethod
     def validate_decision_summary(cls, v):
         if v and v.strip():
-            return re.sub(r'\s+', ' ', v.strip())
+            return ' '.join(v.split())
         return v
 
     @field_validator('appeal_outcome')
@@ -624,7 +624,7 @@ class ArgumentModel(BaseModel):
     def validate_argument_text(cls, v):
         if not v or v.strip() == '':
             raise ValueError("Argument text cannot be empty")
-        return re.sub(r'\s+', ' ', v.strip())
+        return ' '.join(v.split())
 
 class PrecedentModel(BaseModel):
     """Legal precedent model"""
@@ -638,14 +638,14 @@ class PrecedentModel(BaseModel):
     def validate_precedent_case(cls, v):
         if not v or v.strip() == '':
             raise ValueError("Precedent case name cannot be empty")
-        return re.sub(r'\s+', ' ', v.strip())
+        return ' '.join(v.split())
 
     @field_validator('citation')
     @classmethod
     def validate_citation(cls, v):
         if not v or v.strip() == '':
             return v
-        return re.sub(r'\s+', ' ', v.strip())
+        return ' '.join(v.split())
 
 class LegalCaseExtraction(BaseModel):
     """Complete legal case extraction with all related entities"""
@@ -114,9 +114,30 @@ class LLMExtractor:
         self.model = model or os.getenv("OLLAMA_MODEL", "llama3.1:8b")
         self.base_url = base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
         self.timeout = timeout
+        self._session = None
         
         logger.info(f"LLM Extractor initialized with model: {self.model}")
     
+    @property
+    def session(self):
+        """
+        Keep-alive HTTP session shared by every call (and by the worker threads
+        of a parallel batch), so requests reuse pooled connections to Ollama
+        instead of opening a new one each time.
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            # Enough pooled connections for the parallel batch workers; keep in
+            # line with the Ollama server's OLLAMA_NUM_PARALLEL
+            pool_size = int(os.getenv("OLLAMA_NUM_PARALLEL", "8"))
+            session = requests.Session()
+            session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+            self._session = session
+        return self._session
+    
     def extract(self, text: str, max_chars: int = None) -> Dict[str, Any]:
         """
         Extract structured data from case text using LLM.
@@ -162,8 +183,6 @@ class LLMExtractor:
         Returns:
             Response text from the model
         """
-        import requests
-        
         url = f"{self.base_url}/api/generate"
         
         payload = {
@@ -180,7 +199,7 @@ class LLMExtractor:
         
         logger.info(f"Calling Ollama ({self.model})...")
         
-        response = requests.post(
+        response = self.session.post(
             url,
             json=payload,
             timeout=self.timeout
@@ -589,8 +608,7 @@ class LLMExtractor:
     def test_connection(self) -> bool:
         """Test if Ollama is available and the model is loaded."""
         try:
-            import requests
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             if response.status_code == 200:
                 models = response.json().get("models", [])
                 model_names = [m.get("name", "") for m in models]